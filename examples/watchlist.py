@@ -119,10 +119,33 @@ class Watchlist(object):
 
     def _load_all(self, **kwargs) -> dict:
         """Updates the Watchlist's data property with a dictionary of DataFrames
-        keyed by ticker."""
+        keyed by ticker. The strategy runs across the tickers in parallel."""
         if (self.tickers is not None and isinstance(self.tickers, list) and
                 len(self.tickers)):
-            self.data = {ticker: self.load(ticker, **kwargs) for ticker in self.tickers}
+            analyze = kwargs.pop("analyze", True)
+            plot = kwargs.pop("plot", False)
+            # load()'s own arguments, the rest are for the strategy
+            load_kwargs = {k: kwargs.pop(k) for k in ["tf", "index", "drop"] if k in kwargs}
+            data = {ticker: self.load(ticker, analyze=False, **load_kwargs) for ticker in self.tickers}
+            data = {ticker: df for ticker, df in data.items() if df is not None}
+
+            if analyze:
+                if self.debug: print(f"[+] TA[{len(self.strategy.ta)}]: {self.strategy.name}")
+                kwargs.setdefault("timed", self.timed)
+                for result in ta.run_strategy(data, self.strategy, verbose=self.timed, **kwargs):
+                    if result.ok:
+                        result.df.ticker = result.symbol # Attach ticker to the DataFrame
+                        result.df.tf = data[result.symbol].tf
+                        data[result.symbol] = result.df
+                    else:
+                        print(f"[X] {result.symbol}: {result.error}")
+
+            # After the strategy, its MAs are plotted
+            if plot:
+                for df in data.values():
+                    self._plot(df, mas=analyze)
+
+            self.data = data
             return self.data
 
     def _plot(self, df, mas:bool = True, constants:bool = False, **kwargs) -> None:
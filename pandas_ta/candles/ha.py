@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pandas import DataFrame
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, linear_filter, verify_series
 
 
 def ha(open_, high, low, close, offset=None, **kwargs):
@@ -21,8 +21,11 @@ def ha(open_, high, low, close, offset=None, **kwargs):
         "HA_close": 0.25 * (open_ + high + low + close),
     })
 
-    for i in range(1, m):
-        df["HA_open"][i] = 0.5 * (df["HA_open"][i - 1] + df["HA_close"][i - 1])
+    # HA_open[i] = 0.5 * (HA_open[i - 1] + HA_close[i - 1])
+    if m > 1:
+        ha_open = df["HA_open"].to_numpy(dtype=float)
+        ha_open[1:] = linear_filter(df["HA_close"].to_numpy(dtype=float)[:-1], [0.5], [1, -0.5], y0=[ha_open[0]])
+        df["HA_open"] = ha_open
 
     df["HA_high"] = df[["HA_open", "HA_high", "HA_close"]].max(axis=1)
     df["HA_low"] = df[["HA_open", "HA_low", "HA_close"]].min(axis=1)
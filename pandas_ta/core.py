@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import as_completed, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import wraps
+from inspect import signature
 from multiprocessing import cpu_count, Pool
 from pathlib import Path
 from time import perf_counter
+from traceback import format_exc
 from typing import List, Tuple
-from warnings import simplefilter
+from uuid import uuid4
+from warnings import catch_warnings, simplefilter
 
 import pandas as pd
-from numpy import log10 as npLog10
+from numpy import allclose as npAllclose
 from numpy import ndarray as npNdarray
 from pandas.core.base import PandasObject
 
@@ -27,6 +32,54 @@ from pandas_ta.utils import *
 
 df = pd.DataFrame()
 
+
+def _shm_worker(arguments: tuple):
+    """Multiprocessing Worker that runs a batch of Methods on a Shared Memory
+    DataFrame. Only the results are sent back, they are never appended to the
+    shared block. Returns a list of: (position, result, saved, inputs)"""
+    spec, batch, run = arguments
+
+    shared = shm_attach(spec)
+    shared.ta.adjusted = spec.get("adjusted")
+    results = []
+    for position, method, args, kwargs in batch:
+        kwargs = {**kwargs, "append": False, "cache": False}
+        with cache.recording() as reads:
+            try:
+                ta_ = shared.ta
+                result, saved = memo_call(run, getattr(ta_, method), *args, **kwargs)
+            except ValueError:
+                # The indicator writes into its inputs and the shared block is read-only
+                private = shared.copy()
+                private.ta.adjusted = spec.get("adjusted")
+                ta_ = private.ta
+                result, saved = memo_call(run, getattr(ta_, method), *args, **kwargs)
+
+        if method == "ichimoku" and isinstance(result, tuple):
+            result = result[0]
+        # Failed indicators return the DataFrame itself
+        if result is ta_._df:
+            result = None
+        results.append((position, result, saved, tuple(reads)))
+    return results
+
+
+def _symbol_worker(arguments: tuple) -> tuple:
+    """Worker that runs a Strategy on one symbol's DataFrame, without nested
+    multiprocessing. Errors are returned, not raised, so one symbol can not
+    abort the others. Returns: (symbol, DataFrame, seconds, error)"""
+    symbol, df, args, kwargs = arguments
+    stime = perf_counter()
+    try:
+        # Serial, without changing the caller's df.ta.cores
+        result = df.ta.strategy(*args, **{**kwargs, "backend": "serial"})
+        if kwargs.get("append", True) is False:
+            df = result
+        return symbol, df, perf_counter() - stime, None
+    except Exception:
+        return symbol, None, perf_counter() - stime, format_exc()
+
+
 # Strategy DataClass
 @dataclass
 class Strategy:
@@ -110,6 +163,96 @@ CommonStrategy = Strategy(
 )
 
 
+@dataclass
+class StrategyResult:
+    """StrategyResult DataClass
+    The outcome of a Strategy on one symbol, see help(ta.run_strategy)
+
+    Args:
+        symbol (str): The symbol's key in 'frames'.
+        df (pd.DataFrame): The DataFrame with the Strategy's columns or the
+            features when append=False. None if it failed.
+        seconds (float): Time spent running the Strategy.
+        error (str): The traceback if it failed. Default: None
+    """
+
+    symbol: str
+    df: pd.DataFrame = None
+    seconds: float = 0.0
+    error: str = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_strategy(frames: dict, strategy=None, executor=None, cores: int = None, verbose: bool = False, **kwargs):
+    """Run Strategy
+
+    Runs a Strategy on many symbols by spreading whole symbols, instead of
+    indicators, across the workers. Each symbol runs without multiprocessing
+    in its worker. Results are yielded as each symbol completes. A failing
+    symbol is reported and the rest continue.
+
+    >>> frames = {"SPY": spy_df, "QQQ": qqq_df, ...}
+    >>> for result in ta.run_strategy(frames, ta.CommonStrategy):
+    ...     if result.ok:
+    ...         frames[result.symbol] = result.df
+    ...     else:
+    ...         print(result.symbol, result.error)
+
+    Args:
+        frames (dict): DataFrames keyed by symbol.
+        strategy (Strategy | str): A Strategy, "All" or a Category name.
+            Default: "All"
+        executor: A concurrent.futures Executor or multiprocessing Pool to
+            run on. Default: ta.pool when it is running, otherwise a Pool of
+            'cores' workers.
+        cores (int): Workers of the default Pool. 0 runs in this process.
+            Default: cpu_count()
+        verbose (bool): Print each symbol's timing or failure and a summary.
+            Default: False
+        kwargs: Passed on to df.ta.strategy(), like append=False.
+
+    Returns:
+        Generator of StrategyResult in completion order.
+    """
+    args = (strategy,) if strategy is not None else ()
+    tasks = [(symbol, df, args, kwargs) for symbol, df in frames.items()]
+    cores = cpu_count() if cores is None else int(cores)
+
+    pool_, stime, failed = None, perf_counter(), 0
+    if executor is not None:
+        if hasattr(executor, "submit"):
+            results = (x.result() for x in as_completed([executor.submit(_symbol_worker, t) for t in tasks]))
+        else:
+            results = executor.imap_unordered(_symbol_worker, tasks)
+    elif pool.active:
+        results = pool.pool.imap_unordered(_symbol_worker, tasks)
+    elif cores > 0 and len(tasks) > 1:
+        pool_ = Pool(min(cores, len(tasks)))
+        results = pool_.imap_unordered(_symbol_worker, tasks)
+    else:
+        results = map(_symbol_worker, tasks)
+
+    try:
+        for symbol, df, seconds, error in results:
+            if verbose:
+                if error is None:
+                    print(f"[+] {symbol}: {df.shape[1]} columns in {seconds:.4f} s")
+                else:
+                    print(f"[X] {symbol}: failed after {seconds:.4f} s\n{error}")
+            failed += error is not None
+            yield StrategyResult(symbol, df, seconds, error)
+    finally:
+        if pool_ is not None:
+            pool_.terminate()
+            pool_.join()
+
+    if verbose:
+        print(f"[i] Symbols: {len(tasks)}, Failed: {failed}, Runtime: {perf_counter() - stime:.4f} s")
+
+
 # Base Class for extending a Pandas DataFrame
 class BasePandasObject(PandasObject):
     """Simple PandasObject Extension
@@ -250,6 +393,7 @@ class AnalysisIndicators(BasePandasObject):
     _exchange = "NYSE"
     _time_range = "years"
     _last_run = get_time(_exchange, to_string=True)
+    _pending = None
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
@@ -396,34 +540,117 @@ class AnalysisIndicators(BasePandasObject):
                 result.columns = [prefix + column + suffix for column in result.columns]
 
     def _append(self, result=None, **kwargs) -> None:
-        """Appends a Pandas Series or DataFrame columns to self._df."""
+        """Appends a Pandas Series or DataFrame columns to self._df. During a
+        strategy() run, the columns are collected and appended in bulk."""
         if "append" in kwargs and kwargs["append"]:
             df = self._df
             if df is None or result is None: return
             else:
-                simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
-                if "col_names" in kwargs and not isinstance(kwargs["col_names"], tuple):
-                    kwargs["col_names"] = (kwargs["col_names"],) # Note: tuple(kwargs["col_names"]) doesn't work
-
-                if isinstance(result, pd.DataFrame):
-                    # If specified in kwargs, rename the columns.
-                    # If not, use the default names.
-                    if "col_names" in kwargs and isinstance(kwargs["col_names"], tuple):
-                        if len(kwargs["col_names"]) >= len(result.columns):
-                            for col, ind_name in zip(result.columns, kwargs["col_names"]):
-                                df[ind_name] = result.loc[:, col]
-                        else:
-                            print(f"Not enough col_names were specified : got {len(kwargs['col_names'])}, expected {len(result.columns)}.")
-                            return
-                    else:
-                        for i, column in enumerate(result.columns):
-                            df[column] = result.iloc[:, i]
+                columns = self._result_columns(result, **kwargs)
+                if columns is None: return
+
+                if self._pending is not None:
+                    self._pending.update(columns)
                 else:
-                    ind_name = (
-                        kwargs["col_names"][0] if "col_names" in kwargs and
-                        isinstance(kwargs["col_names"], tuple) else result.name
-                    )
-                    df[ind_name] = result
+                    simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
+                    for ind_name, column in columns.items():
+                        df[ind_name] = column
+
+    def _bulk_append(self, columns: dict, inplace: bool = True) -> pd.DataFrame:
+        """Attaches all the columns to self._df at once, as consolidated blocks,
+        instead of inserting and fragmenting them one at a time. Returns the
+        columns as a DataFrame."""
+        df = self._df
+        if len(columns) == 0:
+            return pd.DataFrame(index=df.index)
+
+        # Same alignment as df[name] = column
+        aligned = [
+            column if column.index.equals(df.index) else column.reindex(df.index)
+            for column in columns.values()
+        ]
+        features = pd.concat(aligned, axis=1)
+        features.columns = list(columns.keys())
+
+        if inplace:
+            # Existing columns are replaced in place, the rest are concatenated
+            existing = [x for x in features.columns if x in df.columns]
+            for column in existing:
+                df[column] = features[column]
+            new = features.drop(columns=existing) if len(existing) else features
+            if new.shape[1] > 0:
+                # One consolidated block when pandas allows it, otherwise the
+                # public column by column insert
+                update_inplace = getattr(df, "_update_inplace", None)
+                try:
+                    update_inplace(pd.concat([df, new], axis=1, copy=False))
+                except TypeError:
+                    with catch_warnings():
+                        simplefilter("ignore", pd.errors.PerformanceWarning)
+                        df[new.columns] = new
+        return features
+
+    def _cache_call(self, kind: str, args: tuple, kwargs: dict) -> str:
+        """Returns the fingerprint of an indicator call, without the content
+        of its input columns, or None if it can not be cached."""
+        try:
+            bound = _signatures[kind].bind(self, *args, **kwargs)
+        except (KeyError, TypeError):
+            return None
+        # Omitted arguments are keyed by their defaults, like passed ones
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop("self", None)
+        arguments.update(arguments.pop("kwargs", {}))
+        arguments = {k: v for k, v in arguments.items() if k not in _cache_ignored}
+        return fingerprint(kind, arguments, self.adjusted, Imports["talib"], version)
+
+    def _cache_key(self, call: str, inputs: tuple) -> str:
+        """Returns the fingerprint of an indicator call and the content of its
+        input columns or None if an input column is missing."""
+        df, columns = self._df, []
+        for name in inputs:
+            name = self.adjusted if name is None else name
+            if name is None:
+                columns.append(None)
+            elif name in df.columns:
+                columns.append(df[name])
+            elif self._pending is not None and name in self._pending:
+                columns.append(self._pending[name])
+            else:
+                return None
+        return fingerprint(call, df.index, inputs, columns)
+
+    def _cache_lookup(self, tasks: list, positions: list) -> tuple:
+        """Looks up the cached results of the tasks' positions.
+        Returns a tuple: (hits, calls), where 'hits' is a list of
+        (position, result, saved) and 'calls' are the fingerprints of the
+        calls to cache once computed."""
+        hits, calls = [], {}
+        for i in positions:
+            method, args, kwargs = tasks[i]
+            kwargs = {**kwargs, "append": False}
+            if method == "ichimoku" or not kwargs.pop("cache", True): continue
+
+            call = self._cache_call(method, args, kwargs)
+            if call is None: continue
+
+            inputs = cache.inputs(call)
+            key = self._cache_key(call, inputs) if inputs is not None else None
+            result = cache.get(key, self._df.index)
+            if result is not None:
+                hits.append((i, result, {}))
+            else:
+                calls[i] = call
+        return hits, calls
+
+    def _cache_put(self, call: str, inputs: tuple, result) -> None:
+        """Caches the result of an indicator call that read 'inputs'."""
+        if result is self._df: return
+        cache.set_inputs(call, inputs)
+        key = self._cache_key(call, inputs)
+        if key is not None:
+            cache.put(key, result, self._df.index)
 
     def _check_na_columns(self, stdout: bool = True):
         """Returns the columns in which all it's values are na."""
@@ -433,6 +660,8 @@ class AnalysisIndicators(BasePandasObject):
         """Attempts to get the correct series or 'column' and return it."""
         df = self._df
         if df is None: return
+        if not isinstance(series, pd.Series):
+            cache.record(series)
 
         # Explicitly passing a pd.Series to override default.
         if isinstance(series, pd.Series):
@@ -445,6 +674,11 @@ class AnalysisIndicators(BasePandasObject):
             # Return the df column since it's in there.
             if series in df.columns:
                 return df[series]
+            # Or a column of this strategy() run that is not appended yet.
+            elif self._pending is not None and series in self._pending:
+                column = self._pending[series].copy(deep=False)
+                column.name = series
+                return column
             else:
                 # Attempt to match the 'series' because it was likely
                 # misspelled.
@@ -455,18 +689,278 @@ class AnalysisIndicators(BasePandasObject):
                 NOT_FOUND = f"[X] Ooops!!! It's {series not in df.columns}, the series '{series}' was not found in {cols}"
                 return df.iloc[:, match[0]] if len(match) else print(NOT_FOUND)
 
+    def _result_columns(self, result, **kwargs) -> dict:
+        """Returns the result's columns by their (col_names) names or None if
+        there are not enough col_names."""
+        if "col_names" in kwargs and not isinstance(kwargs["col_names"], tuple):
+            kwargs["col_names"] = (kwargs["col_names"],) # Note: tuple(kwargs["col_names"]) doesn't work
+        col_names = kwargs["col_names"] if "col_names" in kwargs and isinstance(kwargs["col_names"], tuple) else None
+
+        if isinstance(result, pd.DataFrame):
+            # If specified in kwargs, rename the columns.
+            # If not, use the default names.
+            if col_names is not None:
+                if len(col_names) >= len(result.columns):
+                    return {ind_name: result.loc[:, col] for col, ind_name in zip(result.columns, col_names)}
+                else:
+                    print(f"Not enough col_names were specified : got {len(col_names)}, expected {len(result.columns)}.")
+                    return
+            return {column: result.iloc[:, i] for i, column in enumerate(result.columns)}
+
+        ind_name = col_names[0] if col_names is not None else result.name
+        return {ind_name: result}
+
     def _indicators_by_category(self, name: str) -> list:
         """Returns indicators by Categorical name."""
         return Category[name] if name in self.categories else None
 
+    def _incremental_full(self, method: str, params: tuple, kwargs: dict) -> tuple:
+        """Runs a Strategy task over all rows. Returns its columns and, for
+        recursive indicators, the state to resume from."""
+        result = getattr(self, method)(*params, **kwargs)
+        if isinstance(result, tuple): result = result[0]
+        if not isinstance(result, (pd.Series, pd.DataFrame)): return [], None
+
+        columns = self._result_columns(result, **kwargs)
+        if columns is None: return [], None
+
+        state = None
+        if ta_incremental(method, params, kwargs) == "resume":
+            names, state_fn, _ = TA_RESUME[method]
+            inputs = {x: self._get_column(kwargs.get(x, x)) for x in names}
+            if all(isinstance(x, pd.Series) for x in inputs.values()):
+                inputs = {k: v.values.astype(float) for k, v in inputs.items()}
+                outputs = [x.values.astype(float) for x in columns.values()]
+                state = state_fn(inputs, outputs, **kwargs)
+        return list(columns.keys()), state
+
+    def _incremental_tail(self, method: str, params: tuple, kwargs: dict, task: dict, start: int) -> tuple:
+        """Updates a Strategy task's columns in place for the rows from
+        'start' on. Returns its columns and state or None if it has to be
+        fully recomputed."""
+        df, mode = self._df, ta_incremental(method, params, kwargs)
+        if mode is None or not len(task["columns"]): return
+
+        state = None
+        if mode == "resume":
+            begin = start - INCREMENTAL_HISTORY
+            if task["state"] is None or begin < 0: return
+
+            names, _, resume = TA_RESUME[method]
+            inputs = {x: self._get_column(kwargs.get(x, x)) for x in names}
+            if not all(isinstance(x, pd.Series) for x in inputs.values()): return
+
+            inputs = {k: v.values[begin:].astype(float) for k, v in inputs.items()}
+            outputs, state = resume(task["state"], inputs, **kwargs)
+            if len(outputs) != len(task["columns"]): return
+            values = dict(zip(task["columns"], outputs))
+        else:
+            begin = max(start - ta_lookback(method, kwargs) - INCREMENTAL_CHECK, 0)
+            tail = df.iloc[begin:].copy()
+            tail.ta.adjusted = self.adjusted
+            result = getattr(tail.ta, method)(*params, **{**kwargs, "append": False})
+            if isinstance(result, tuple): result = result[0]
+            if not isinstance(result, (pd.Series, pd.DataFrame)): return
+
+            columns = self._result_columns(result, **kwargs)
+            if columns is None or list(columns.keys()) != task["columns"]: return
+            columns = {
+                name: column if column.index.equals(tail.index) else column.reindex(tail.index)
+                for name, column in columns.items()
+            }
+
+            # The recomputed rows of the last run must match, otherwise the
+            # lookback was not enough for these kwargs
+            offset = start - begin
+            check = max(offset - INCREMENTAL_CHECK, 0)
+            for name, column in columns.items():
+                stored = df[name].values[begin + check:start].astype(float)
+                if not npAllclose(column.values[check:offset].astype(float), stored, equal_nan=True):
+                    return
+            values = {name: column.values[offset:] for name, column in columns.items()}
+
+        locations = [df.columns.get_loc(name) for name in values.keys()]
+        if not all(isinstance(x, int) for x in locations): return
+        for location, value in zip(locations, values.values()):
+            df.iloc[start:, location] = value
+        return task["columns"], state
+
+    def _strategy_incremental(self, tasks: list, verbose: bool = False) -> None:
+        """Runs the Strategy's tasks serially. If only rows were appended since
+        the last incremental run, windowed indicators recompute just their
+        tail and recursive ones resume from their state. Otherwise, or when
+        neither applies, the indicator is recomputed."""
+        df = self._df
+        inputs = ["open", "high", "low", "close", "volume"]
+        if self.adjusted is not None: inputs.append(self.adjusted)
+        key = strategy_key(tasks, self.adjusted, Imports["talib"])
+        last = incremental_state(df, key, inputs)
+        start = last["rows"] if last is not None else 0
+        if last is None and verbose:
+            print(f"[i] No incremental state in df.attrs['{INCREMENTAL_KEY}'], computing all rows. Append new bars in place, pd.concat() drops df.attrs.")
+
+        # Existing columns are updated in place instead of collected
+        if last is not None:
+            pending, self._pending = self._pending, None
+
+        states, counts = [], {"full": 0, "resume": 0, "tail": 0}
+        try:
+            for i, (method, params, kwds) in enumerate(tasks):
+                updated = None
+                if last is not None:
+                    task = last["tasks"][i]
+                    if start == df.shape[0]:
+                        updated = task["columns"], task["state"]
+                    else:
+                        updated = self._incremental_tail(method, params, kwds, task, start)
+                        if updated is not None:
+                            counts[ta_incremental(method, params, kwds)] += 1
+
+                if updated is None:
+                    updated = self._incremental_full(method, params, kwds)
+                    counts["full"] += 1
+                states.append({"columns": updated[0], "state": updated[1]})
+        finally:
+            if last is not None:
+                self._pending = pending
+
+        save_incremental_state(df, key, inputs, states)
+        if verbose:
+            print(f"[i] Incremental: {df.shape[0] - start} new rows. Tail: {counts['tail']}, Resumed: {counts['resume']}, Recomputed: {counts['full']}")
+
     def _mp_worker(self, arguments: tuple):
-        """Multiprocessing Worker to handle different Methods."""
-        method, args, kwargs = arguments
+        """Multiprocessing Worker to handle a batch of different Methods. The
+        cache is left to the parent, see _mp_run().
+        Returns a list of: (position, result, saved, inputs)"""
+        batch, run = arguments
+        results = []
+        for position, method, args, kwargs in batch:
+            with cache.recording() as reads:
+                result, saved = memo_call(run, getattr(self, method), *args, **{**kwargs, "append": False, "cache": False})
+
+            if method == "ichimoku":
+                result = result[0]
+            # Failed indicators return the DataFrame itself
+            if result is self._df:
+                result = None
+            results.append((position, result, saved, tuple(reads)))
+        return results
+
+    def _mp_run(self, tasks: list, groups: list, run: str, chunksize: int = None, shm: bool = False, progress: bool = False, verbose: bool = False, mp_pool: Pool = None) -> list:
+        """Runs the tasks' positions in 'groups' on a multiprocessing Pool,
+        scheduled by their calibrated costs, longest expected first. With
+        ta.cache enabled, the cached results are served by the parent and
+        only the others are sent to the workers. 'mp_pool' is a caller's Pool
+        to use instead of a temporary one.
+        Returns a list of: (position, result, saved)"""
+        hits, calls = [], {}
+        if cache.enabled:
+            hits, calls = self._cache_lookup(tasks, [i for group in groups for i in group])
+            served = {position for position, _, _ in hits}
+            groups = [[i for i in group if i not in served] for group in groups]
+            groups = [group for group in groups if len(group)]
+            if verbose and len(hits):
+                print(f"[i] Cache: {len(hits)} indicators served.")
+            if len(groups) == 0:
+                return hits
+
+        mp_worker, shm_ = self._mp_worker, None
+        if shm:
+            spec, shm_ = shm_publish(self._df)
+            spec["adjusted"] = self.adjusted
+            mp_worker = _shm_worker
+            if verbose:
+                print(f"[i] Shared memory: {len(spec['columns'])} columns x {self._df.shape[0]} rows.")
 
-        if method != "ichimoku":
-            return getattr(self, method)(*args, **kwargs)
-        else:
-            return getattr(self, method)(*args, **kwargs)[0]
+        # Reuse the Persistent Worker Pool, ta.pool, when it is running
+        persistent = pool.active or mp_pool is not None
+        mp_cores = pool.cores if pool.active else self.cores
+        pool_ = pool.pool if pool.active else mp_pool if mp_pool is not None else Pool(self.cores)
+        try:
+            rows = self._df.shape[0]
+            costs = {i: ta_cost(tasks[i][0], rows) for group in groups for i in group}
+            batches, predicted = strategy_schedule(groups, costs, mp_cores, chunksize=chunksize)
+            if verbose:
+                _total_ta = sum(len(group) for group in groups)
+                _pool_msg = " (persistent pool)" if pool.active else ""
+                print(f"[i] Multiprocessing {_total_ta} indicators in {len(batches)} batches with {mp_cores}/{cpu_count()} cpus{_pool_msg}.")
+
+            planned = [([(i, *tasks[i]) for i in batch], run) for batch in batches]
+            if shm:
+                planned = [(spec, *x) for x in planned]
+
+            mp_stime = perf_counter()
+            results = pool_.imap_unordered(mp_worker, planned)
+            if progress:
+                from tqdm import tqdm
+                results = tqdm(results, total=len(planned))
+
+            # Wait for all the results before releasing the workers
+            results = [result for batch in results for result in batch]
+            actual = perf_counter() - mp_stime
+        finally:
+            if not persistent:
+                pool_.close()
+                pool_.join()
+            # Workers are done with the shared block
+            shm_release(shm_)
+
+        if verbose:
+            print(f"[i] Makespan: {predicted:.4f} s predicted, {actual:.4f} s actual.")
+
+        for position, result, _, reads in results:
+            if position in calls:
+                self._cache_put(calls[position], reads, result)
+        return hits + [(position, result, saved) for position, result, saved, _ in results]
+
+    def _thread_run(self, tasks: list, groups: list, run: str, chunksize: int = None, shm: bool = False, verbose: bool = False) -> list:
+        """Runs the tasks on threads that share self._df. Indicators that hold
+        the GIL, pure Python loops, are sent to processes instead when more
+        than one core is available. Returns a list of: (position, result, saved)"""
+        threads = max(self.cores, 1)
+        gil = set()
+        if self.cores > 1:
+            gil = {i for i, task in enumerate(tasks) if ta_holds_gil(task[0])}
+
+        thread_groups = [[i for i in group if i not in gil] for group in groups]
+        thread_groups = [group for group in thread_groups if len(group)]
+        process_groups = [[i for i in group if i in gil] for group in groups]
+        process_groups = [group for group in process_groups if len(group)]
+
+        rows = self._df.shape[0]
+        costs = {i: ta_cost(tasks[i][0], rows) for group in thread_groups for i in group}
+        batches, _ = strategy_schedule(thread_groups, costs, threads, chunksize=chunksize)
+        if verbose:
+            print(f"[i] Threading {len(costs)} indicators in {len(batches)} batches with {threads} threads, {len(gil)} to processes.")
+
+        with ThreadPoolExecutor(threads + (len(process_groups) > 0)) as executor:
+            futures = [
+                executor.submit(self._thread_worker, [(i, *tasks[i]) for i in batch], run)
+                for batch in batches
+            ]
+            if len(process_groups):
+                futures.append(executor.submit(
+                    self._mp_run, tasks, process_groups, run,
+                    chunksize=chunksize, shm=shm, verbose=verbose,
+                ))
+            return [result for future in futures for result in future.result()]
+
+    def _thread_worker(self, batch: list, run: str) -> list:
+        """Thread Worker that runs a batch of Methods on the shared self._df.
+        The results are appended afterwards by the caller.
+        Returns a list of: (position, result, saved)"""
+        results = []
+        for position, method, args, kwargs in batch:
+            kwargs = {**kwargs, "append": False}
+            result, saved = memo_call(run, getattr(self, method), *args, **kwargs)
+
+            if method == "ichimoku" and isinstance(result, tuple):
+                result = result[0]
+            # Failed indicators return the DataFrame itself
+            if result is self._df:
+                result = None
+            results.append((position, result, saved))
+        return results
 
     def _post_process(self, result, **kwargs) -> Tuple[pd.Series, pd.DataFrame]:
         """Applies any additional modifications to the DataFrame
@@ -490,6 +984,24 @@ class AnalysisIndicators(BasePandasObject):
             self._append(result=result, **kwargs)
         return result
 
+    def _strategy_level(self, tasks: list, remaining: list, produced: dict) -> list:
+        """Returns the remaining tasks' positions that can run in parallel:
+        their input columns are in the DataFrame or were created by earlier
+        levels' tasks at earlier positions, 'produced' is {position: columns}.
+        As in a serial run, a task only reads the columns of earlier tasks.
+        The first task runs alone when its inputs are still missing."""
+        ohlcv = ["open", "high", "low", "close", "volume"]
+        level = []
+        for i in remaining:
+            columns = set(self._df.columns).union(*[produced[j] for j in produced if j < i])
+            if all(
+                tasks[i][2][c] in columns for c in ohlcv
+                if isinstance(tasks[i][2].get(c), str)
+            ):
+                level.append(i)
+        first = min(remaining)
+        return level if first in level else [first]
+
     def _strategy_mode(self, *args) -> tuple:
         """Helper method to determine the mode and name of the strategy. Returns tuple: (name:str, mode:dict)"""
         name = "All"
@@ -617,18 +1129,41 @@ class AnalysisIndicators(BasePandasObject):
         Future implementations will allow more specific indicator generation
         with possibly as json, yaml config file or an sqlite3 table.
 
+        Multiprocessing reuses the Persistent Worker Pool when it has been
+        started with ta.pool.start() or 'with ta.pool:'. See help(ta.pool).
 
         Kwargs:
-            chunksize (bool): Adjust the chunksize for the Multiprocessing Pool.
-                Default: Number of cores of the OS
+            append (bool): When False, the DataFrame is left unchanged and the
+                new features are returned as a separate DataFrame.
+                Otherwise they are appended at once. Default: True
+            backend (str): "process" runs the indicators on a multiprocessing
+                Pool. "thread" runs the vectorized indicators on threads that
+                share the DataFrame and sends the ones that hold the GIL, see
+                help(ta.ta_holds_gil), to processes. "serial" runs them one
+                after another. Default: "process", "serial" if cores = 0
+            chunksize (int): Fixed number of indicators per Multiprocessing
+                batch. Default: None, the indicators are scheduled among the
+                cores by their calibrated costs, see help(ta.calibrate_costs)
             exclude (list): List of indicator names to exclude. Some are
                 excluded by default for various reasons; they require additional
-                sources, performance (td_seq), not a ohlcv chart (vp) etc.
+                sources, not a ohlcv chart (vp) etc.
+            incremental (bool): Only compute the rows appended since the
+                last incremental run of the same Strategy. Windowed indicators
+                recompute their tail with their declared lookback and 'ema',
+                'rma', 'psar' and 'supertrend' resume from their state, saved
+                in df.attrs["pandas_ta"]. Others and a changed history are
+                recomputed. pd.concat() drops df.attrs, so append new bars in
+                place, df.loc[ts] = bar, or all rows are recomputed. Runs
+                without multiprocessing. Default: False
             name (str): Select all indicators or indicators by
                 Category such as: "candles", "cycles", "momentum", "overlap",
                 "performance", "statistics", "trend", "volatility", "volume", or
                 "all". Default: "all"
             ordered (bool): Whether to run "all" in order. Default: True
+            shm (bool): Publish the numeric columns once to shared memory so
+                the workers attach to them instead of unpickling the
+                DataFrame for every chunk. Requires Python 3.8+.
+                Default: False
             timed (bool): Show the process time of the strategy().
                 Default: False
             verbose (bool): Provide some additional insight on the progress of
@@ -637,10 +1172,16 @@ class AnalysisIndicators(BasePandasObject):
         # If True, it returns the resultant DataFrame. Default: False
         returns = kwargs.pop("returns", False)
         # cpus = cpu_count()
+        # If False, the DataFrame is not modified and the new features are
+        # returned instead. Default: True
+        inplace = kwargs.pop("append", True)
         # Ensure indicators are appended to the DataFrame
         kwargs["append"] = True
         all_ordered = kwargs.pop("ordered", True)
-        mp_chunksize = kwargs.pop("chunksize", self.cores)
+        mp_chunksize = kwargs.pop("chunksize", None)
+        use_shm = kwargs.pop("shm", False)
+        incremental = kwargs.pop("incremental", False) and inplace
+        backend = kwargs.pop("backend", None)
 
         # Initialize
         initial_column_count = len(self._df.columns)
@@ -654,7 +1195,6 @@ class AnalysisIndicators(BasePandasObject):
             # "data", # reserved
             "long_run",
             "short_run",
-            "td_seq", # Performance exclusion
             "tsignals",
             "vp",
             "xsignals",
@@ -701,103 +1241,153 @@ class AnalysisIndicators(BasePandasObject):
         timed = kwargs.pop("timed", False)
         results = []
         use_multiprocessing = True if self.cores > 0 else False
-        has_col_names = False
 
         if timed:
             stime = perf_counter()
 
-        if use_multiprocessing and mode["custom"]:
-            # Determine if the Custom Model has 'col_names' parameter
-            has_col_names = (True if len([
-                True for x in ta
-                if "col_names" in x and isinstance(x["col_names"], tuple)
-            ]) else False)
-
-            if has_col_names:
-                use_multiprocessing = False
-
         if Imports["tqdm"]:
             # from tqdm import tqdm
             from tqdm import tqdm
 
-        if use_multiprocessing:
-            _total_ta = len(ta)
-            with Pool(self.cores) as pool:
-                # Some magic to optimize chunksize for speed based on total ta indicators
-                _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
+        # Collect the results and append them at once, see _bulk_append()
+        self._pending = {}
+        try:
+            # Tasks: (method, params, kwargs)
+            if mode["custom"]:
+                tasks = [(
+                    ind["kind"],
+                    ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
+                    {**ind, **kwargs},
+                ) for ind in ta]
+            else:
+                tasks = [(ind, tuple(), kwargs) for ind in ta]
+
+            # Chained indicators need columns created by earlier indicators
+            ohlcv = ["open", "high", "low", "close", "volume"]
+            is_chained = mode["custom"] and any(
+                isinstance(x.get(c), str) and x[c] not in self._df.columns
+                for x in ta for c in ohlcv
+            )
+            if use_multiprocessing and use_shm and is_chained:
+                use_shm = False
                 if verbose:
-                    print(f"[i] Multiprocessing {_total_ta} indicators with {_chunksize} chunks and {self.cores}/{cpu_count()} cpus.")
-
-                results = None
-                if mode["custom"]:
-                    # Create a list of all the custom indicators into a list
-                    custom_ta = [(
-                        ind["kind"],
-                        ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else (),
-                        {**ind, **kwargs},
-                    ) for ind in ta]
-                    # Custom multiprocessing pool. Must be ordered for Chained Strategies
-                    # May fix this to cpus if Chaining/Composition if it remains
-                    results = pool.imap(self._mp_worker, custom_ta, _chunksize)
-                else:
-                    default_ta = [(ind, tuple(), kwargs) for ind in ta]
-                    # All and Categorical multiprocessing pool.
-                    if all_ordered:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap(self._mp_worker, default_ta, _chunksize)) # Order over Speed
-                        else:
-                            results = pool.imap(self._mp_worker, default_ta, _chunksize) # Order over Speed
-                    else:
-                        if Imports["tqdm"]:
-                            results = tqdm(pool.imap_unordered(self._mp_worker, default_ta, _chunksize)) # Speed over Order
-                        else:
-                            results = pool.imap_unordered(self._mp_worker, default_ta, _chunksize) # Speed over Order
-                if results is None:
-                    print(f"[X] ta.strategy('{name}') has no results.")
-                    return
+                    print(f"[i] No shared memory support for Chained Strategies.")
+
+            # Backends: "process", "thread" or "serial"
+            backend_ = backend
+            if backend not in ("process", "serial", "thread"):
+                backend_ = backend = "process" if use_multiprocessing else "serial"
+            if backend == "process" and not use_multiprocessing:
+                backend = "serial"
+            run, saved = uuid4().hex, {}
 
-                pool.close()
-                pool.join()
+            if incremental:
+                if verbose:
+                    print(f"[i] No mulitproccessing for incremental runs.")
+                self._strategy_incremental(tasks, verbose=verbose)
                 self._last_run = get_time(self.exchange, to_string=True)
 
-        else:
-            # Without multiprocessing:
-            if verbose:
-                _col_msg = f"[i] No mulitproccessing (cores = 0)."
-                if has_col_names:
-                    _col_msg = f"[i] No mulitproccessing support for 'col_names' option."
-                print(_col_msg)
+            elif backend in ("process", "thread"):
+                # Dispatch indicators that share intermediates (atr, ema,
+                # bbands, ...) next to each other, see strategy_plan()
+                plan = strategy_plan(ta, groups=True)
+                remaining, produced = list(range(len(tasks))), {}
+                # The levels share one Pool
+                mp_pool = None
+                if backend == "process" and is_chained and not pool.active:
+                    mp_pool = Pool(self.cores)
+                try:
+                    while len(remaining):
+                        # Chained indicators run in levels, after the indicators
+                        # that create their input columns
+                        level = self._strategy_level(tasks, remaining, produced) if is_chained else remaining
+                        remaining = [i for i in remaining if i not in level]
+                        groups = [[i for i in group if i in level] for group in plan]
+                        groups = [group for group in groups if len(group)]
+                        if verbose and is_chained:
+                            print(f"[i] Chained level: {len(level)} indicators, {len(remaining)} remaining.")
+
+                        # A task alone must not read the columns of later tasks
+                        hidden = {}
+                        if is_chained and len(level) == 1:
+                            later = [c for j in produced if j > level[0] for c in produced[j]]
+                            hidden = {c: self._pending.pop(c) for c in later if c in self._pending}
+
+                        if backend == "process":
+                            results = self._mp_run(
+                                tasks, groups, run, chunksize=mp_chunksize,
+                                shm=use_shm, progress=Imports["tqdm"] and not mode["custom"],
+                                verbose=verbose, mp_pool=mp_pool,
+                            )
+                        else:
+                            results = self._thread_run(
+                                tasks, groups, run,
+                                chunksize=mp_chunksize, shm=use_shm, verbose=verbose,
+                            )
+
+                        # Restore the Strategy's order. Custom Strategies are always ordered
+                        if mode["custom"] or all_ordered:
+                            results.sort(key=lambda x: x[0])
+
+                        # Columns are appended here with each task's kwargs, so
+                        # col_names are applied and the next level can read them
+                        for position, result, _saved in results:
+                            count = len(self._pending)
+                            self._append(result, **tasks[position][2])
+                            produced[position] = list(self._pending)[count:]
+                            for k, v in _saved.items():
+                                saved[k] = saved.get(k, 0) + v
+                        self._pending.update(hidden)
+                finally:
+                    if mp_pool is not None:
+                        mp_pool.close()
+                        mp_pool.join()
+                results = []
+                self._last_run = get_time(self.exchange, to_string=True)
+
+                # Columns in the Strategy's order, as a serial run
+                if is_chained:
+                    columns = [c for i in sorted(produced) for c in produced[i]]
+                    self._pending = {c: self._pending[c] for c in columns}
 
-            if mode["custom"]:
-                if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
-                else:
-                    for ind in ta:
-                        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else tuple()
-                        getattr(self, ind["kind"])(*params, **{**ind, **kwargs})
             else:
+                # Without multiprocessing:
+                if verbose:
+                    _col_msg = f"[i] No mulitproccessing (cores = 0)."
+                    if backend_ == "serial":
+                        _col_msg = f"[i] Serial backend."
+                    print(_col_msg)
+
                 if Imports["tqdm"] and verbose:
-                    pbar = tqdm(ta, f"[i] Progress")
-                    for ind in pbar:
-                        getattr(self, ind)(*tuple(), **kwargs)
-                else:
-                    for ind in ta:
-                        getattr(self, ind)(*tuple(), **kwargs)
+                    tasks = tqdm(tasks, f"[i] Progress")
+
+                memo_start(run)
+                try:
+                    for method, params, kwds in tasks:
+                        getattr(self, method)(*params, **kwds)
+                finally:
+                    saved = memo_stop()
                 self._last_run = get_time(self.exchange, to_string=True)
 
-        # Apply prefixes/suffixes and appends indicator results to the  DataFrame
-        [self._post_process(r, **kwargs) for r in results]
+            # Apply prefixes/suffixes and appends indicator results to the  DataFrame
+            [self._post_process(r, **kwargs) for r in results]
+        finally:
+            pending, self._pending = self._pending, None
+        features = self._bulk_append(pending, inplace=inplace)
 
         if verbose:
+            total_saved = sum(saved.values())
+            if total_saved > 0:
+                saved_str = ", ".join([f"{k}: {v}" for k, v in sorted(saved.items())])
+                print(f"[i] Shared intermediates: {total_saved} computations saved ({saved_str})")
             print(f"[i] Total indicators: {len(ta)}")
-            print(f"[i] Columns added: {len(self._df.columns) - initial_column_count}")
+            columns_added = len(self._df.columns) - initial_column_count if inplace else features.shape[1]
+            print(f"[i] Columns added: {columns_added}")
             print(f"[i] Last Run: {self._last_run}")
         if timed:
             print(f"[i] Runtime: {final_time(stime)}")
 
+        if not inplace: return features
         if returns: return self._df
 
 
@@ -1301,7 +1891,7 @@ class AnalysisIndicators(BasePandasObject):
         result = vidya(close=close, length=length, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
 
-    def vwap(self, anchor=None, offset=None, **kwargs):
+    def vwap(self, anchor=None, bands=None, offset=None, **kwargs):
         high = self._get_column(kwargs.pop("high", "high"))
         low = self._get_column(kwargs.pop("low", "low"))
         close = self._get_column(kwargs.pop("close", "close"))
@@ -1310,7 +1900,7 @@ class AnalysisIndicators(BasePandasObject):
         if not self.datetime_ordered:
             volume.index = self._df.index
 
-        result = vwap(high=high, low=low, close=close, volume=volume, anchor=anchor, offset=offset, **kwargs)
+        result = vwap(high=high, low=low, close=close, volume=volume, anchor=anchor, bands=bands, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
 
     def vwma(self, volume=None, length=None, offset=None, **kwargs):
@@ -1752,3 +2342,43 @@ class AnalysisIndicators(BasePandasObject):
         volume = self._get_column(kwargs.pop("volume", "volume"))
         result = vp(close=close, volume=volume, width=width, percent=percent, **kwargs)
         return self._post_process(result, **kwargs)
+
+
+# Accessor and strategy kwargs that do not change the returned result
+_cache_ignored = ("append", "col_names", "timed", "verbose")
+_signatures = {}
+
+
+def _cached(method):
+    """Wraps an indicator method with the opt-in result cache, see
+    help(ta.cache). The input columns a call reads are learned on its first
+    run and fingerprinted, with the call, on the following ones."""
+    kind = method.__name__
+    _signatures[kind] = signature(method)
+
+    @wraps(method)
+    def _cached_method(self, *args, **kwargs):
+        if not kwargs.pop("cache", True) or not cache.enabled:
+            return method(self, *args, **kwargs)
+
+        call = self._cache_call(kind, args, kwargs)
+        if call is None:
+            return method(self, *args, **kwargs)
+
+        inputs = cache.inputs(call)
+        key = self._cache_key(call, inputs) if inputs is not None else None
+        result = cache.get(key, self._df.index)
+        if result is not None:
+            self._append(result[0] if isinstance(result, tuple) else result, **kwargs)
+            return result
+
+        with cache.recording() as reads:
+            result = method(self, *args, **kwargs)
+        self._cache_put(call, tuple(reads), result)
+        return result
+
+    return _cached_method
+
+
+for _kind in pd.DataFrame().ta.indicators(as_list=True):
+    setattr(AnalysisIndicators, _kind, _cached(getattr(AnalysisIndicators, _kind)))
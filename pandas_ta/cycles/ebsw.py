@@ -1,12 +1,55 @@
 # -*- coding: utf-8 -*-
 from numpy import cos as npCos
 from numpy import exp as npExp
+from numpy import full as npFull
 from numpy import nan as npNaN
 from numpy import pi as npPi
 from numpy import sin as npSin
 from numpy import sqrt as npSqrt
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, njit, verify_series
+
+# Size of the state of _ebsw_kernel(), all zeros before the first bar
+EBSW_STATE = 4
+
+
+@njit
+def _ebsw_kernel(close, length, bars, state):
+    """EBSW kernel, see ebsw(). Runs the bars of 'close' after the 'state'
+    (lastClose, lastHP and the last two Filt) of the previous bar. Returns
+    the EBSW of each bar and the state of the last."""
+    lastClose, lastHP, filt0, filt1 = state[0], state[1], state[2], state[3]
+
+    # HighPass filter cyclic components whose periods are shorter than Duration input
+    alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
+    # Smooth with a Super Smoother Filter from equation 3-3
+    a1 = npExp(-npSqrt(2) * npPi / bars)
+    b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
+    c2 = b1
+    c3 = -1 * a1 * a1
+    c1 = 1 - c2 - c3
+
+    result = npZeros(close.shape[0])
+    for i in range(close.shape[0]):
+        HP = 0.5 * (1 + alpha1) * (close[i] - lastClose) + alpha1 * lastHP
+        Filt = c1 * (HP + lastHP) / 2 + c2 * filt1 + c3 * filt0
+
+        # 3 Bar average of Wave amplitude and power
+        Wave = (Filt + filt1 + filt0) / 3
+        Pwr = (Filt * Filt + filt1 * filt1 + filt0 * filt0) / 3
+
+        # Normalize the Average Wave to Square Root of the Average Power
+        result[i] = Wave / npSqrt(Pwr)
+
+        filt0, filt1 = filt1, Filt
+        lastHP = HP
+        lastClose = close[i]
+
+    state = npZeros(EBSW_STATE)
+    state[0], state[1], state[2], state[3] = lastClose, lastHP, filt0, filt1
+    return result, state
 
 
 def ebsw(close, length=None, bars=None, offset=None, **kwargs):
@@ -19,45 +62,11 @@ def ebsw(close, length=None, bars=None, offset=None, **kwargs):
 
     if close is None: return
 
-    # variables
-    alpha1 = HP = 0 # alpha and HighPass
-    a1 = b1 = c1 = c2 = c3 = 0
-    Filt = Pwr = Wave = 0
-
-    lastClose = lastHP = 0
-    FilterHist = [0, 0]   # Filter history
-
     # Calculate Result
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        # HighPass filter cyclic components whose periods are shorter than Duration input
-        alpha1 = (1 - npSin(360 / length)) / npCos(360 / length)
-        HP = 0.5 * (1 + alpha1) * (close[i] - lastClose) + alpha1 * lastHP
-
-        # Smooth with a Super Smoother Filter from equation 3-3
-        a1 = npExp(-npSqrt(2) * npPi / bars)
-        b1 = 2 * a1 * npCos(npSqrt(2) * 180 / bars)
-        c2 = b1
-        c3 = -1 * a1 * a1
-        c1 = 1 - c2 - c3
-        Filt = c1 * (HP + lastHP) / 2 + c2 * FilterHist[1] + c3 * FilterHist[0]
-        # Filt = float("{:.8f}".format(float(Filt))) # to fix for small scientific notations, the big ones fail
-
-        # 3 Bar average of Wave amplitude and power
-        Wave = (Filt + FilterHist[1] + FilterHist[0]) / 3
-        Pwr = (Filt * Filt + FilterHist[1] * FilterHist[1] + FilterHist[0] * FilterHist[0]) / 3
-
-        # Normalize the Average Wave to Square Root of the Average Power
-        Wave = Wave / npSqrt(Pwr)
-
-        # update storage, result
-        FilterHist.append(Filt)  # append new Filt value
-        FilterHist.pop(0)  # remove first element of list (left) -> updating/trim
-        lastHP = HP
-        lastClose = close[i]
-        result.append(Wave)
-
+    kernel = _ebsw_kernel if Imports["numba"] else _ebsw_kernel.py_func
+    result = npFull(close.size, npNaN)
+    result[length - 1] = 0
+    result[length:], _ = kernel(close.to_numpy(dtype=float)[length:], length, bars, npZeros(EBSW_STATE))
     ebsw = Series(result, index=close.index)
 
     # Offset
@@ -25,7 +25,7 @@ def cci(high, low, close, length=None, c=None, talib=None, offset=None, **kwargs
     else:
         typical_price = hlc3(high=high, low=low, close=close)
         mean_typical_price = sma(typical_price, length=length)
-        mad_typical_price = mad(typical_price, length=length)
+        mad_typical_price = mad(typical_price, length=length, memory=kwargs.get("memory"))
 
         cci = typical_price - mean_typical_price
         cci /= c * mad_typical_price
@@ -77,6 +77,8 @@ Args:
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
+    memory (int, optional): Bytes of windows the mad processes at once, see
+        help(ta.mad). Default: ta.utils.ROLLING_MEMORY
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
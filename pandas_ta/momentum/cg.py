@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series, weights
+from pandas_ta.utils import get_offset, rolling_dot, verify_series
 
 
 def cg(close, length=None, offset=None, **kwargs):
@@ -13,7 +13,7 @@ def cg(close, length=None, offset=None, **kwargs):
 
     # Calculate Result
     coefficients = [length - i for i in range(0, length)]
-    numerator = -close.rolling(length).apply(weights(coefficients), raw=True)
+    numerator = -rolling_dot(close, coefficients)
     cg = numerator / close.rolling(length).sum()
 
     # Offset
@@ -1,9 +1,31 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import log as nplog
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
+from pandas_ta import Imports
 from pandas_ta.overlap import hl2
-from pandas_ta.utils import get_offset, high_low_range, verify_series
+from pandas_ta.utils import get_offset, high_low_range, njit, verify_series
+
+
+@njit
+def _fisher_kernel(position, state):
+    """Fisher Transform kernel, see fisher(). Runs the bars of 'position'
+    after the 'state' (v, fisher) of the previous bar, zeros before the
+    first. Returns the Fisher Transform of each bar and the last state."""
+    v, fisher = state[0], state[1]
+    result = npZeros(position.shape[0])
+    for i in range(position.shape[0]):
+        v = 0.66 * position[i] + 0.67 * v
+        if v < -0.99: v = -0.999
+        if v > 0.99: v = 0.999
+        fisher = 0.5 * (nplog((1 + v) / (1 - v)) + fisher)
+        result[i] = fisher
+
+    state = npZeros(2)
+    state[0], state[1] = v, fisher
+    return result, state
 
 
 def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
@@ -28,14 +50,10 @@ def fisher(high, low, length=None, signal=None, offset=None, **kwargs):
 
     position = ((hl2_ - lowest_hl2) / hlr) - 0.5
 
-    v = 0
-    m = high.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        v = 0.66 * position.iloc[i] + 0.67 * v
-        if v < -0.99: v = -0.999
-        if v > 0.99: v = 0.999
-        result.append(0.5 * (nplog((1 + v) / (1 - v)) + result[i - 1]))
+    kernel = _fisher_kernel if Imports["numba"] else _fisher_kernel.py_func
+    result = npFull(high.size, npNaN)
+    result[length - 1] = 0
+    result[length:], _ = kernel(position.to_numpy(dtype=float)[length:], npZeros(2))
     fisher = Series(result, index=high.index)
     signalma = fisher.shift(signal)
 
@@ -1,31 +1,25 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import concat, DataFrame, Series
-from pandas_ta.utils import get_drift, get_offset, verify_series, signals
+from pandas_ta import Imports
+from pandas_ta.utils import get_drift, get_offset, njit, verify_series, signals
 
+# Size of the state of _rsx_kernel(), all zeros before the first bar
+RSX_STATE = 20
 
-def rsx(close, length=None, drift=None, offset=None, **kwargs):
-    """Indicator: Relative Strength Xtra (inspired by Jurik RSX)"""
-    # Validate arguments
-    length = int(length) if length and length > 0 else 14
-    close = verify_series(close, length)
-    drift = get_drift(drift)
-    offset = get_offset(offset)
 
-    if close is None: return
-
-    # variables
-    vC, v1C = 0, 0
-    v4, v8, v10, v14, v18, v20 = 0, 0, 0, 0, 0, 0
-
-    f0, f8, f10, f18, f20, f28, f30, f38 = 0, 0, 0, 0, 0, 0, 0, 0
-    f40, f48, f50, f58, f60, f68, f70, f78 = 0, 0, 0, 0, 0, 0, 0, 0
-    f80, f88, f90 = 0, 0, 0
+@njit
+def _rsx_kernel(close, length, state):
+    """RSX kernel, see rsx(). Runs the bars of 'close' after the 'state' of
+    the previous bar. Returns the RSX of each bar and the state of the last.
+    """
+    f0, f8, f18, f20, f28, f30, f38, f40, f48, f50 = state[:10]
+    f58, f60, f68, f70, f78, f80, f88, f90, v14, v20 = state[10:]
 
-    # Calculate Result
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
+    result = npZeros(close.shape[0])
+    for i in range(close.shape[0]):
         if f90 == 0:
             f90 = 1.0
             f0 = 0.0
@@ -33,7 +27,7 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
                 f88 = length - 1.0
             else:
                 f88 = 5.0
-            f8 = 100.0 * close.iloc[i]
+            f8 = 100.0 * close[i]
             f18 = 3.0 / (length + 2.0)
             f20 = 1.0 - f18
         else:
@@ -42,7 +36,7 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
             else:
                 f90 = f90 + 1
             f10 = f8
-            f8 = 100 * close.iloc[i]
+            f8 = 100 * close[i]
             v8 = f8 - f10
             f28 = f20 * f28 + f18 * v8
             f30 = f18 * f28 + f20 * f30
@@ -76,7 +70,29 @@ def rsx(close, length=None, drift=None, offset=None, **kwargs):
                 v4 = 0.0
         else:
             v4 = 50.0
-        result.append(v4)
+        result[i] = v4
+
+    state = npZeros(RSX_STATE)
+    state[:10] = f0, f8, f18, f20, f28, f30, f38, f40, f48, f50
+    state[10:] = f58, f60, f68, f70, f78, f80, f88, f90, v14, v20
+    return result, state
+
+
+def rsx(close, length=None, drift=None, offset=None, **kwargs):
+    """Indicator: Relative Strength Xtra (inspired by Jurik RSX)"""
+    # Validate arguments
+    length = int(length) if length and length > 0 else 14
+    close = verify_series(close, length)
+    drift = get_drift(drift)
+    offset = get_offset(offset)
+
+    if close is None: return
+
+    # Calculate Result
+    kernel = _rsx_kernel if Imports["numba"] else _rsx_kernel.py_func
+    result = npFull(close.size, npNaN)
+    result[length - 1] = 0
+    result[length:], _ = kernel(close.to_numpy(dtype=float)[length:], length, npZeros(RSX_STATE))
     rsx = Series(result, index=close.index)
 
     # Offset
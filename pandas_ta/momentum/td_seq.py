@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
-# import numpy as np
-from numpy import where as npWhere
+from numpy import minimum as npMinimum
+from numpy import nan as npNaN
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import consecutive, get_offset, verify_series
 
 
 def td_seq(close, asint=None, offset=None, **kwargs):
@@ -13,28 +13,17 @@ def td_seq(close, asint=None, offset=None, **kwargs):
     asint = asint if isinstance(asint, bool) else False
     show_all = kwargs.setdefault("show_all", True)
 
-    def true_sequence_count(series: Series):
-        index = series.where(series == False).last_valid_index()
-
-        if index is None:
-            return series.count()
-        else:
-            s = series[series.index > index]
-            return s.count()
-
     def calc_td(series: Series, direction: str, show_all: bool):
         td_bool = series.diff(4) > 0 if direction=="up" else series.diff(4) < 0
-        td_num = npWhere(
-            td_bool, td_bool.rolling(13, min_periods=0).apply(true_sequence_count), 0
-        )
-        td_num = Series(td_num)
+        # Length of the run of True ending at each bar, counted up to 13
+        td_num = npMinimum(consecutive(td_bool).to_numpy(), 13).astype(float)
 
         if show_all:
-            td_num = td_num.mask(td_num == 0)
+            td_num[td_num == 0] = npNaN
         else:
-            td_num = td_num.mask(~td_num.between(6,9))
+            td_num[(td_num < 6) | (td_num > 9)] = npNaN
 
-        return td_num
+        return Series(td_num, index=series.index)
 
     up_seq = calc_td(close, "up", show_all)
     down_seq = calc_td(close, "down", show_all)
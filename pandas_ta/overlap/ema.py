@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import ewm_mean, get_offset, memoize, verify_series
 
 
+@memoize
 def ema(close, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Exponential Moving Average (EMA)"""
     # Validate Arguments
@@ -26,7 +27,7 @@ def ema(close, length=None, talib=None, offset=None, **kwargs):
             sma_nth = close[0:length].mean()
             close[:length - 1] = npNaN
             close.iloc[length - 1] = sma_nth
-        ema = close.ewm(span=length, adjust=adjust).mean()
+        ema = ewm_mean(close, 2 / (length + 1), adjust=adjust)
 
     # Offset
     if offset != 0:
@@ -1,6 +1,39 @@
 # -*- coding: utf-8 -*-
+from numpy import array as npArray
+from numpy import outer as npOuter
+from numpy import poly as npPoly
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, linear_filter, njit, verify_series
+
+
+def _hwma_coefficients(na, nb, nc):
+    """HWMA as a linear filter: the (b, a) coefficients of its state update
+    s[n] = M s[n - 1] + g x[n], with s = (F, V, A) and y = F + V + 0.5 A."""
+    f = npArray([1 - na, 1 - na, 0.5 * (1 - na)])
+    v = nb * f + npArray([-nb, 1 - nb, 1 - nb])
+    a = nc * v + npArray([0, -nc, 1 - nc])
+    M, g, c = npArray([f, v, a]), npArray([na, nb * na, nc * nb * na]), npArray([1, 1, 0.5])
+
+    den = npPoly(M)
+    num = npPoly(M - npOuter(g, c @ M)) + (c @ g - 1) * den
+    return num, den
+
+
+@njit
+def _hwma_kernel(close, na, nb, nc):
+    """HWMA kernel, see hwma()"""
+    result = npZeros(close.shape[0])
+    last_a = last_v = 0.0
+    last_f = close[0]
+    for i in range(close.shape[0]):
+        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close[i]
+        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
+        A = (1.0 - nc) * last_a + nc * (V - last_v)
+        result[i] = F + V + 0.5 * A
+        last_a, last_f, last_v = A, F, V
+    return result
 
 
 def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
@@ -13,17 +46,25 @@ def hwma(close, na=None, nb=None, nc=None, offset=None, **kwargs):
     offset = get_offset(offset)
 
     # Calculate Result
-    last_a = last_v = 0
-    last_f = close.iloc[0]
-
-    result = []
-    m = close.size
-    for i in range(m):
-        F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
-        V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
-        A = (1.0 - nc) * last_a + nc * (V - last_v)
-        result.append((F + V + 0.5 * A))
-        last_a, last_f, last_v = A, F, V # update values
+    if Imports["scipy"]:
+        # At rest on the first close: F = close, V = A = 0
+        b, a = _hwma_coefficients(na, nb, nc)
+        initial = [close.iloc[0]] * 3
+        result = linear_filter(close.to_numpy(dtype=float), b, a, y0=initial, x0=initial)
+    elif Imports["numba"]:
+        result = _hwma_kernel(close.to_numpy(dtype=float), na, nb, nc)
+    else:
+        last_a = last_v = 0
+        last_f = close.iloc[0]
+
+        result = []
+        m = close.size
+        for i in range(m):
+            F = (1.0 - na) * (last_f + last_v + 0.5 * last_a) + na * close.iloc[i]
+            V = (1.0 - nb) * (last_v + last_a) + nb * (F - last_f)
+            A = (1.0 - nc) * last_a + nc * (V - last_v)
+            result.append((F + V + 0.5 * A))
+            last_a, last_f, last_v = A, F, V # update values
 
     hwma = Series(result, index=close.index)
 
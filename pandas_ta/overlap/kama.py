@@ -1,7 +1,19 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
 from numpy import nan as npNaN
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, non_zero_range, verify_series
+from pandas_ta import Imports
+from pandas_ta.utils import get_drift, get_offset, njit, non_zero_range, verify_series
+
+
+@njit
+def _kama_kernel(close, sc, length):
+    """KAMA kernel, see kama()"""
+    result = npFull(close.shape[0], npNaN)
+    result[length - 1] = 0
+    for i in range(length, close.shape[0]):
+        result[i] = sc[i] * close[i] + (1 - sc[i]) * result[i - 1]
+    return result
 
 
 def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kwargs):
@@ -30,10 +42,13 @@ def kama(close, length=None, fast=None, slow=None, drift=None, offset=None, **kw
     x = er * (fr - sr) + sr
     sc = x * x
 
-    m = close.size
-    result = [npNaN for _ in range(0, length - 1)] + [0]
-    for i in range(length, m):
-        result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
+    if Imports["numba"]:
+        result = _kama_kernel(close.to_numpy(dtype=float), sc.to_numpy(dtype=float), length)
+    else:
+        m = close.size
+        result = [npNaN for _ in range(0, length - 1)] + [0]
+        for i in range(length, m):
+            result.append(sc.iloc[i] * close.iloc[i] + (1 - sc.iloc[i]) * result[i - 1])
 
     kama = Series(result, index=close.index)
 
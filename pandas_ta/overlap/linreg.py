@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
-from numpy import array as npArray
 from numpy import arctan as npAtan
-from numpy import nan as npNaN
 from numpy import pi as npPi
-from numpy.version import version as npVersion
-from pandas import Series
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_ols, verify_series
 
 
 def linreg(close, length=None, offset=None, **kwargs):
@@ -24,50 +20,21 @@ def linreg(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    x = range(1, length + 1)  # [1, 2, ..., n] from 1 to n keeps Sum(xy) low
-    x_sum = 0.5 * length * (length + 1)
-    x2_sum = x_sum * (2 * length + 1) / 3
-    divisor = length * x2_sum - x_sum * x_sum
-
-    def linear_regression(series):
-        y_sum = series.sum()
-        xy_sum = (x * series).sum()
-
-        m = (length * xy_sum - x_sum * y_sum) / divisor
-        if slope:
-            return m
-        b = (y_sum * x2_sum - x_sum * xy_sum) / divisor
-        if intercept:
-            return b
-
-        if angle:
-            theta = npAtan(m)
-            if degrees:
-                theta *= 180 / npPi
-            return theta
-
-        if r:
-            y2_sum = (series * series).sum()
-            rn = length * xy_sum - x_sum * y_sum
-            rd = (divisor * (length * y2_sum - y_sum * y_sum)) ** 0.5
-            return rn / rd
-
-        return m * length + b if tsf else m * (length - 1) + b
-
-    def rolling_window(array, length):
-        """https://github.com/twopirllc/pandas-ta/issues/285"""
-        strides = array.strides + (array.strides[-1],)
-        shape = array.shape[:-1] + (array.shape[-1] - length + 1, length)
-        return as_strided(array, shape=shape, strides=strides)
-
-    if npVersion >= "1.20.0":
-        from numpy.lib.stride_tricks import sliding_window_view
-        linreg_ = [linear_regression(_) for _ in sliding_window_view(npArray(close), length)]
+    ols = rolling_ols(close, length)
+    if slope:
+        linreg = ols["slope"]
+    elif intercept:
+        linreg = ols["intercept"]
+    elif angle:
+        linreg = npAtan(ols["slope"])
+        if degrees:
+            linreg *= 180 / npPi
+    elif r:
+        linreg = ols["r"]
     else:
-        from numpy.lib.stride_tricks import as_strided
-        linreg_ = [linear_regression(_) for _ in rolling_window(npArray(close), length)]
-
-    linreg = Series([npNaN] * (length - 1) + linreg_, index=close.index)
+        # x = [1, 2, ..., n]
+        x = length if tsf else length - 1
+        linreg = ols["slope"] * x + ols["intercept"]
 
     # Offset
     if offset != 0:
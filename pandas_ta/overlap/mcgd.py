@@ -1,5 +1,25 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from pandas import Series
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit
+def _mcgd_kernel(close, length, c):
+    """McGinley Dynamic kernel, see mcgd(). Each bar is smoothed from the
+    previous smoothed bar, windows with a NaN are skipped."""
+    mcg = close.copy()
+    result = close.copy()
+    for i in range(1, close.shape[0]):
+        if npIsnan(mcg[i - 1]) or npIsnan(mcg[i]):
+            result[i] = npNaN
+            continue
+        denom = c * length * (mcg[i] / mcg[i - 1]) ** 4
+        mcg[i] = mcg[i - 1] + ((mcg[i] - mcg[i - 1]) / denom)
+        result[i] = mcg[i]
+    return result
 
 
 def mcgd(close, length=None, offset=None, c=None, **kwargs):
@@ -13,15 +33,18 @@ def mcgd(close, length=None, offset=None, c=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    close = close.copy()
-
-    def mcg_(series):
-        denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
-        series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
-        return series.iloc[1]
-
-    mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
-    mcg_ds = close[:1].append(mcg_cell[1:])
+    if Imports["numba"]:
+        mcg_ds = Series(_mcgd_kernel(close.to_numpy(dtype=float), length, c), index=close.index)
+    else:
+        close = close.copy()
+
+        def mcg_(series):
+            denom = (c * length * (series.iloc[1] / series.iloc[0]) ** 4)
+            series.iloc[1] = (series.iloc[0] + ((series.iloc[1] - series.iloc[0]) / denom))
+            return series.iloc[1]
+
+        mcg_cell = close[0:].rolling(2, min_periods=2).apply(mcg_, raw=False)
+        mcg_ds = close[:1].append(mcg_cell[1:])
 
     # Offset
     if offset != 0:
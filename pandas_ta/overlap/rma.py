@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import ewm_mean, get_offset, memoize, verify_series
 
 
+@memoize
 def rma(close, length=None, offset=None, **kwargs):
     """Indicator: wildeR's Moving Average (RMA)"""
     # Validate Arguments
@@ -13,7 +14,7 @@ def rma(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    rma = close.ewm(alpha=alpha, min_periods=length).mean()
+    rma = ewm_mean(close, alpha, adjust=True, min_periods=length)
 
     # Offset
     if offset != 0:
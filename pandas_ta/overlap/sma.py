@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, memoize, verify_series
 
 
+@memoize
 def sma(close, length=None, talib=None, offset=None, **kwargs):
     """Indicator: Simple Moving Average (SMA)"""
     # Validate Arguments
@@ -3,7 +3,22 @@ from numpy import cos as npCos
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
-from pandas_ta.utils import get_offset, verify_series
+from pandas import Series
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, linear_filter, njit, verify_series
+
+
+@njit
+def _ssf_kernel(close, poles, c1, c2, c3, c4):
+    """SSF kernel, see ssf()"""
+    ssf = close.copy()
+    if poles == 3:
+        for i in range(0, close.shape[0]):
+            ssf[i] = c1 * close[i] + c2 * ssf[max(i - 1, 0)] + c3 * ssf[max(i - 2, 0)] + c4 * ssf[max(i - 3, 0)]
+    else:
+        for i in range(0, close.shape[0]):
+            ssf[i] = c1 * close[i] + c2 * ssf[max(i - 1, 0)] + c3 * ssf[max(i - 2, 0)]
+    return ssf
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -31,8 +46,14 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
         c1 = 1 - c2 - c3 - c4
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
+        # The bars before the first one are seeded with the first close
+        if Imports["scipy"]:
+            ssf = linear_filter(close.astype(float), [c1], [1, -c2, -c3, -c4], y0=[close.iloc[0]] * 3)
+        elif Imports["numba"]:
+            ssf = Series(_ssf_kernel(close.to_numpy(dtype=float), poles, c1, c2, c3, c4), index=close.index)
+        else:
+            for i in range(0, m):
+                ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[max(i - 1, 0)] + c3 * ssf.iloc[max(i - 2, 0)] + c4 * ssf.iloc[max(i - 3, 0)]
 
     else: # poles == 2
         x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
@@ -41,8 +62,14 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
         b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
         c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+        # The bars before the first one are seeded with the first close
+        if Imports["scipy"]:
+            ssf = linear_filter(close.astype(float), [c1], [1, -b1, -a1], y0=[close.iloc[0]] * 2)
+        elif Imports["numba"]:
+            ssf = Series(_ssf_kernel(close.to_numpy(dtype=float), poles, c1, b1, a1, 0.0), index=close.index)
+        else:
+            for i in range(0, m):
+                ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[max(i - 1, 0)] + a1 * ssf.iloc[max(i - 2, 0)]
 
     # Offset
     if offset != 0:
@@ -1,9 +1,54 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import nan as npNaN
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
 from pandas import DataFrame
+from pandas_ta import Imports
 from pandas_ta.overlap import hl2
 from pandas_ta.volatility import atr
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, njit, verify_series
+
+
+@njit
+def _supertrend_step(close, upperband, lowerband, dir_, upper, lower):
+    """One bar of the Supertrend kernel: its close and bands and the
+    previous direction and final bands. Returns the direction and the final
+    bands."""
+    if close > upper:
+        dir_ = 1
+    elif close < lower:
+        dir_ = -1
+    else:
+        if dir_ > 0 and lowerband < lower:
+            lowerband = lower
+        if dir_ < 0 and upperband > upper:
+            upperband = upper
+    return dir_, upperband, lowerband
+
+
+@njit
+def _supertrend_kernel(close, upperband, lowerband):
+    """Supertrend kernel, see supertrend(). Updates the bands in place and
+    returns the trend, direction, long and short arrays, a
+    _supertrend_step() per bar."""
+    m = close.shape[0]
+    dir_, trend = npOnes(m, dtype=npInt64), npZeros(m)
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
+
+    for i in range(1, m):
+        dir_[i], upperband[i], lowerband[i] = _supertrend_step(
+            close[i], upperband[i], lowerband[i],
+            dir_[i - 1], upperband[i - 1], lowerband[i - 1]
+        )
+
+        if dir_[i] > 0:
+            trend[i] = long[i] = lowerband[i]
+        else:
+            trend[i] = short[i] = upperband[i]
+
+    return trend, dir_, long, short
 
 
 def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kwargs):
@@ -19,31 +64,13 @@ def supertrend(high, low, close, length=None, multiplier=None, offset=None, **kw
     if high is None or low is None or close is None: return
 
     # Calculate Results
-    m = close.size
-    dir_, trend = [1] * m, [0] * m
-    long, short = [npNaN] * m, [npNaN] * m
-
     hl2_ = hl2(high, low)
     matr = multiplier * atr(high, low, close, length)
-    upperband = hl2_ + matr
-    lowerband = hl2_ - matr
-
-    for i in range(1, m):
-        if close.iloc[i] > upperband.iloc[i - 1]:
-            dir_[i] = 1
-        elif close.iloc[i] < lowerband.iloc[i - 1]:
-            dir_[i] = -1
-        else:
-            dir_[i] = dir_[i - 1]
-            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
-                lowerband.iloc[i] = lowerband.iloc[i - 1]
-            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
-                upperband.iloc[i] = upperband.iloc[i - 1]
+    upperband = (hl2_ + matr).to_numpy(dtype=float)
+    lowerband = (hl2_ - matr).to_numpy(dtype=float)
 
-        if dir_[i] > 0:
-            trend[i] = long[i] = lowerband.iloc[i]
-        else:
-            trend[i] = short[i] = upperband.iloc[i]
+    kernel = _supertrend_kernel if Imports["numba"] else _supertrend_kernel.py_func
+    trend, dir_, long, short = kernel(close.to_numpy(dtype=float), upperband, lowerband)
 
     # Prepare DataFrame to return
     _props = f"_{length}_{multiplier}"
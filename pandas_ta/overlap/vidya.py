@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import Series
-from pandas_ta.utils import get_drift, get_offset, verify_series
+from pandas_ta import Imports
+from pandas_ta.utils import get_drift, get_offset, njit, verify_series
+
+
+@njit
+def _vidya_kernel(close, abs_cmo, alpha, length):
+    """VIDYA kernel, see vidya()"""
+    vidya = npZeros(close.shape[0])
+    for i in range(length, close.shape[0]):
+        vidya[i] = alpha * abs_cmo[i] * close[i] + vidya[i - 1] * (1 - alpha * abs_cmo[i])
+    return vidya
 
 
 def vidya(close, length=None, drift=None, offset=None, **kwargs):
@@ -32,9 +43,13 @@ def vidya(close, length=None, drift=None, offset=None, **kwargs):
     m = close.size
     alpha = 2 / (length + 1)
     abs_cmo = _cmo(close, length, drift).abs()
-    vidya = Series(0, index=close.index)
-    for i in range(length, m):
-        vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
+    if Imports["numba"]:
+        vidya = _vidya_kernel(close.to_numpy(dtype=float), abs_cmo.to_numpy(dtype=float), alpha, length)
+        vidya = Series(vidya, index=close.index)
+    else:
+        vidya = Series(0, index=close.index)
+        for i in range(length, m):
+            vidya.iloc[i] = alpha * abs_cmo.iloc[i] * close.iloc[i] + vidya.iloc[i - 1] * (1 - alpha * abs_cmo.iloc[i])
     vidya.replace({0: npNaN}, inplace=True)
 
     # Offset
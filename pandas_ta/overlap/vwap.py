@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
+from numpy import sqrt as npSqrt
+from pandas import DataFrame
 from .hlc3 import hlc3
 from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
 
-def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
+def vwap(high, low, close, volume, anchor=None, bands=None, offset=None, **kwargs):
     """Indicator: Volume Weighted Average Price (VWAP)"""
     # Validate Arguments
     high = verify_series(high)
@@ -10,6 +12,7 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     close = verify_series(close)
     volume = verify_series(volume)
     anchor = anchor.upper() if anchor and isinstance(anchor, str) and len(anchor) >= 1 else "D"
+    bands = list(bands) if isinstance(bands, (list, tuple)) else [bands] if bands else []
     offset = get_offset(offset)
 
     typical_price = hlc3(high=high, low=low, close=close)
@@ -20,8 +23,22 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
 
     # Calculate Result
     wp = typical_price * volume
-    vwap  = wp.groupby(wp.index.to_period(anchor)).cumsum()
-    vwap /= volume.groupby(volume.index.to_period(anchor)).cumsum()
+    wp_periods = wp.index.to_period(anchor)
+    cum_volume = volume.groupby(volume.index.to_period(anchor)).cumsum()
+    vwap  = wp.groupby(wp_periods).cumsum()
+    vwap /= cum_volume
+
+    if bands:
+        # Volume weighted standard deviation of the typical price
+        variance = (wp * typical_price).groupby(wp_periods).cumsum() / cum_volume
+        variance -= vwap * vwap
+        stdev = npSqrt(variance.clip(lower=0))
+
+        data = {f"VWAP_{anchor}": vwap}
+        for band in bands:
+            data[f"VWAPL_{anchor}_{band}"] = vwap - band * stdev
+            data[f"VWAPU_{anchor}_{band}"] = vwap + band * stdev
+        vwap = DataFrame(data)
 
     # Offset
     if offset != 0:
@@ -57,6 +74,11 @@ Calculation:
     tpv = tp * volume
     VWAP = tpv.cumsum() / volume.cumsum()
 
+    STDEV = SQRT((tpv * tp).cumsum() / volume.cumsum() - VWAP * VWAP)
+    For each band:
+        LOWER = VWAP - band * STDEV
+        UPPER = VWAP + band * STDEV
+
 Args:
     high (pd.Series): Series of 'high's
     low (pd.Series): Series of 'low's
@@ -66,6 +88,7 @@ Args:
         implement various Timeseries Offset Aliases as listed here:
         https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases
         Default: "D".
+    bands (list): Standard deviation multipliers of the bands. Default: None
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
@@ -73,5 +96,6 @@ Kwargs:
     fill_method (value, optional): Type of fill method
 
 Returns:
-    pd.Series: New feature generated.
+    pd.Series: New feature generated. pd.DataFrame: vwap and the lower and
+        upper bands, when there are bands.
 """
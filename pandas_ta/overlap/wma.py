@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from pandas import Series
 from pandas_ta import Imports
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, memoize, rolling_dot, verify_series
 
 
+@memoize
 def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
     """Indicator: Weighted Moving Average (WMA)"""
     # Validate Arguments
@@ -21,19 +21,12 @@ def wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
         wma = WMA(close, length)
     else:
         from numpy import arange as npArange
-        from numpy import dot as npDot
 
         total_weight = 0.5 * length * (length + 1)
-        weights_ = Series(npArange(1, length + 1))
+        weights_ = npArange(1, length + 1) / total_weight
         weights = weights_ if asc else weights_[::-1]
 
-        def linear(w):
-            def _compute(x):
-                return npDot(x, w) / total_weight
-            return _compute
-
-        close_ = close.rolling(length, min_periods=length)
-        wma = close_.apply(linear(weights), raw=True)
+        wma = rolling_dot(close, weights)
 
     # Offset
     if offset != 0:
@@ -1,7 +1,16 @@
 # -*- coding: utf-8 -*-
-from . import (
-    dema, ema, hma, linreg, rma, sma, swma, t3, tema, trima, vidya, wma
-)
+from .dema import dema
+from .ema import ema
+from .hma import hma
+from .linreg import linreg
+from .rma import rma
+from .sma import sma
+from .swma import swma
+from .t3 import t3
+from .tema import tema
+from .trima import trima
+from .vidya import vidya
+from .wma import wma
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
-from numpy import fabs as npfabs
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_mad, verify_series
 
 
 def mad(close, length=None, offset=None, **kwargs):
@@ -14,11 +13,7 @@ def mad(close, length=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    def mad_(series):
-        """Mean Absolute Deviation"""
-        return npfabs(series - series.mean()).mean()
-
-    mad = close.rolling(length, min_periods=min_periods).apply(mad_, raw=True)
+    mad = rolling_mad(close, length, min_periods=min_periods, memory=kwargs.get("memory"))
 
     # Offset
     if offset != 0:
@@ -53,6 +48,8 @@ Args:
     offset (int): How many periods to offset the result. Default: 0
 
 Kwargs:
+    memory (int, optional): Bytes of windows processed at once, see
+        help(ta.utils.rolling_mad). Default: ta.utils.ROLLING_MEMORY
     fillna (value, optional): pd.DataFrame.fillna(value)
     fill_method (value, optional): Type of fill method
 
@@ -3,9 +3,9 @@ from numpy import array as npArray
 from numpy import arange as npArange
 from numpy import polyfit as npPolyfit
 from numpy import std as npStd
-from pandas import DataFrame, DatetimeIndex, Series
+from pandas import DataFrame, DatetimeIndex, RangeIndex, Series
 from .stdev import stdev as stdev
-from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils import get_offset, rolling_ols, verify_series
 
 def tos_stdevall(close, length=None, stds=None, ddof=None, offset=None, **kwargs):
     """Indicator: TD Ameritrade's Think or Swim Standard Deviation All"""
@@ -31,13 +31,15 @@ def tos_stdevall(close, length=None, stds=None, ddof=None, offset=None, **kwargs
 
     # Calculate Result
     X = src_index = close.index
-    if isinstance(close.index, DatetimeIndex):
-        X = npArange(length)
-        close = npArray(close)
-
-    m, b = npPolyfit(X, close, 1)
-    lr = Series(m * X + b, index=src_index)
-    stdev = npStd(close, ddof=ddof)
+    if isinstance(close.index, (DatetimeIndex, RangeIndex)):
+        # Evenly spaced, the last window of the rolling regression
+        ols = rolling_ols(close, length)
+        m, b = ols["slope"].iloc[-1], ols["intercept"].iloc[-1]
+        lr = Series(m * npArange(1, length + 1) + b, index=src_index)
+    else:
+        m, b = npPolyfit(X, close, 1)
+        lr = Series(m * X + b, index=src_index)
+    stdev = npStd(npArray(close), ddof=ddof)
 
     # Name and Categorize it
     df = DataFrame({f"{_props}_LR": lr}, index=src_index)
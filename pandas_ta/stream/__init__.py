@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+from ._base import Stream
+from .overlap import DEMA, EMA, RMA, SMA, T3, TEMA, VWAP, WMA, ZLMA, ma
+from .momentum import CCI, MACD, RSI, STOCH, TSI, WILLR
+from .volatility import ATR
+from .trend import CKSP, PSAR, SUPERTREND
+from .strategy import StreamingStrategy
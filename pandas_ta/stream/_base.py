@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import copysign, inf
+
+from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import concatenate as npConcatenate
+from numpy import flatnonzero as npFlatnonzero
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import generic as npGeneric
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import ndarray as npNdarray
+from pandas import Series
+from pandas_ta import Imports
+from pandas_ta.utils import ewm_mean
+
+
+def divide(a: float, b: float) -> float:
+    """a / b like NumPy: +-inf or NaN instead of ZeroDivisionError."""
+    if b == 0:
+        if a != a or a == 0: return npNaN
+        return copysign(inf, a) * copysign(1.0, b)
+    return a / b
+
+
+def first_valid(x: npNdarray) -> int:
+    """The position of the first value of 'x' that is not NaN, or None."""
+    valid = npFlatnonzero(~npIsnan(x))
+    return int(valid[0]) if valid.size else None
+
+
+def shift(x: npNdarray, n: int) -> npNdarray:
+    """'x' delayed by 'n' bars, NaN for the first 'n'."""
+    if n <= 0: return x
+    return npConcatenate([npFull(min(n, x.size), npNaN), x[:-n]])
+
+
+def wilder(x: npNdarray, length: int) -> float:
+    """The last of TA Lib's Wilder average of 'x', which has no NaNs: the
+    mean of its first 'length' values, then ((avg * (length - 1)) + x) /
+    length for the others."""
+    average = 0.0
+    for value in x[:length].tolist():
+        average += value
+    average /= length
+    if x.size == length: return average
+    return float(ewm_mean(Series(npConcatenate([[average], x[length:]])), 1.0 / length).iloc[-1])
+
+
+def _dump(x):
+    """A stream's attribute as JSON types: objects as dicts of their
+    attributes, deques and tuples as lists and NumPy scalars as Python's."""
+    if isinstance(x, (deque, list, tuple)): return [_dump(v) for v in x]
+    if isinstance(x, npNdarray): return x.tolist()
+    if isinstance(x, npGeneric): return x.item()
+    if hasattr(x, "__dict__"): return {k: _dump(v) for k, v in vars(x).items()}
+    return x
+
+
+def _load(current, saved):
+    """Restores the attribute 'current' from its _dump()."""
+    if hasattr(current, "__dict__") and isinstance(saved, dict):
+        for k, v in saved.items():
+            setattr(current, k, _load(getattr(current, k, None), v))
+        return current
+    if isinstance(current, deque):
+        return deque([tuple(v) if isinstance(v, list) else v for v in saved], maxlen=current.maxlen)
+    if isinstance(current, tuple): return tuple(saved)
+    if isinstance(current, npNdarray): return npArray(saved, dtype=current.dtype)
+    if isinstance(current, list) and len(current) == len(saved):
+        return [_load(c, v) for c, v in zip(current, saved)]
+    return saved
+
+
+def talib_mode(talib) -> bool:
+    """Returns True when a streaming indicator follows TA Lib, like its
+    batch indicator: TA Lib is installed and 'talib' is not False."""
+    return Imports["talib"] and (bool(talib) if isinstance(talib, bool) else True)
+
+
+class Stream(object):
+    """Streaming Indicator
+
+    Base of the streaming indicators. update() takes the values of the next
+    bar and returns the indicator's value for it in O(1) time, the value
+    the batch indicator returns for that bar when run over all the bars so
+    far, warm up NaNs included. Only the state the next update needs is
+    kept: a few floats, or the bars of the window for windowed indicators.
+
+    Example:
+        ema = EMA(10)
+        for close in closes:
+            value = ema.update(close)
+    """
+    name = ""
+    inputs = ("close",)  # The arguments of update()
+    optional = ()  # Of the inputs, those a Strategy entry must set
+
+    def __init__(self):
+        self.reset()
+
+    @property
+    def columns(self) -> list:
+        """The names of the values update() returns, as the batch columns."""
+        return [self.name]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name}, bars={self.bars}, value={self.value})"
+
+    @property
+    def state(self) -> dict:
+        """Everything the next update() needs as JSON types (NaN included),
+        to save with json.dumps() and restore() after a restart instead of
+        replaying the history."""
+        return _dump(self)
+
+    def restore(self, state: dict) -> None:
+        """Continues from a saved 'state' of a stream with the same name."""
+        if not isinstance(state, dict) or state.get("name") != self.name:
+            raise ValueError(f"[X] Not the state of {self.name}")
+        _load(self, state)
+
+    def reset(self) -> None:
+        """Forgets all the bars."""
+        self.bars = 0
+        self.value = npNaN
+
+    def update(self, *args) -> float:
+        """Returns the value for the next bar, a tuple for several columns."""
+        raise NotImplementedError()
+
+    def update_many(self, *args):
+        """Updates with every bar of the arrays, oldest first, as update()
+        takes them. Returns the values of each bar: an array of shape
+        (bars,) or (bars, columns). A new stream computes them with the
+        batch indicator and continues from its tail, see _history(), others
+        update bar by bar."""
+        args = [npAsarray(x, dtype=npFloat64) for x in args]
+        values = self._batch(*args)
+        if values is not None: return values
+
+        update = self.update
+        bars = zip(*[x.tolist() for x in args])
+        return npArray([update(*bar) for bar in bars], dtype=npFloat64)
+
+    def _batch(self, *args):
+        """update_many() of a new stream with _history(): the values of the
+        bars or None, then the stream is still new."""
+        if self.bars or not len(args) or not len(args[0]): return None
+        values = self._history(*args)
+        if values is None:
+            self.reset()
+            return None
+
+        self.bars = len(args[0])
+        self.value = tuple(values[-1].tolist()) if values.ndim > 1 else float(values[-1])
+        return values
+
+    def _history(self, *args):
+        """Returns the values of the bars, the arrays of update_many(), from
+        the batch indicator and sets the state update() continues from. Or
+        None when it can not, then update_many() updates bar by bar."""
+        return None
+
+    def _replay(self, bars: int, *args) -> bool:
+        """Sets the state of a stream that only depends on the last 'bars'
+        bars by updating with them. False if they have NaNs."""
+        if len(args[0]) < bars: return False
+        tail = [x[len(x) - bars:] for x in args]
+        if any(npIsnan(x).any() for x in tail): return False
+        update = self.update
+        for bar in zip(*[x.tolist() for x in tail]):
+            update(*bar)
+        return True
+
+
+class Rolling(object):
+    """Rolling Extremum
+
+    The highest (or lowest) of the last 'length' values with a monotonic
+    deque, in amortized O(1), like Series.rolling(length, min_periods).max()
+    (or min()): NaNs are skipped and it is NaN until 'min_periods' of the
+    last 'length' values are valid.
+    """
+    def __init__(self, length: int, highest: bool = True, min_periods: int = None):
+        self.length = length
+        self.highest = highest
+        self.min_periods = min_periods if min_periods is not None else length
+        self.reset()
+
+    def reset(self) -> None:
+        self.bars, self.valid = 0, 0
+        self._window = deque()   # Whether each value of the window is valid
+        self._extrema = deque()  # (bar, value) candidates, the extremum first
+
+    def update(self, x: float) -> float:
+        self.bars += 1
+        if len(self._window) == self.length:
+            self.valid -= self._window.popleft()
+        if len(self._extrema) and self._extrema[0][0] <= self.bars - self.length:
+            self._extrema.popleft()
+
+        valid = x == x
+        self._window.append(valid)
+        if valid:
+            self.valid += 1
+            extrema = self._extrema
+            if self.highest:
+                while len(extrema) and extrema[-1][1] <= x: extrema.pop()
+            else:
+                while len(extrema) and extrema[-1][1] >= x: extrema.pop()
+            extrema.append((self.bars, x))
+
+        if self.valid >= self.min_periods and self.valid > 0:
+            return self._extrema[0][1]
+        return npNaN
+
+    def replay(self, x: npNdarray) -> None:
+        """Continues after the values of 'x', only its last 'length' matter."""
+        for value in x[max(len(x) - self.length, 0):].tolist():
+            self.update(value)
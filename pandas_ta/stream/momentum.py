@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import isnan
+from sys import float_info as sflt
+
+from numpy import abs as npAbs
+from numpy import array as npArray
+from numpy import column_stack as npColumnStack
+from numpy import concatenate as npConcatenate
+from numpy import errstate as npErrstate
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import where as npWhere
+from numpy.lib.stride_tricks import sliding_window_view
+from pandas import Series
+from pandas_ta.momentum import cci, macd, rsi, willr
+from pandas_ta.utils import ewm_mean
+
+from ._base import Rolling, Stream, divide, first_valid, shift, talib_mode, wilder
+from .overlap import EMA, RMA, SMA, ma
+
+
+def _from_first(stream: Stream, x):
+    """The values of 'stream' updated from the first value of 'x' that is
+    not NaN on, NaN before, like an MA that starts at its input. None when
+    it has no _history()."""
+    first = first_valid(x)
+    if first is None: return npFull(x.size, npNaN)
+    values = stream._batch(x[first:])
+    if values is None: return None
+    return npConcatenate([npFull(first, npNaN), values])
+
+
+class _Diff(object):
+    """x - x 'drift' bars ago, NaN for the first 'drift' bars"""
+    def __init__(self, drift: int):
+        self.closes = deque(maxlen=drift + 1)
+
+    def update(self, x: float) -> float:
+        self.closes.append(x)
+        return x - self.closes[0] if len(self.closes) == self.closes.maxlen else npNaN
+
+    def update_many(self, x):
+        self.closes.extend(x[-self.closes.maxlen:].tolist())
+        return x - shift(x, self.closes.maxlen - 1)
+
+
+class RSI(Stream):
+    """Relative Strength Index (RSI), see rsi()
+
+    Follows TA Lib's RSI when it is installed, unless talib=False, which
+    ignores the 'scalar'. Otherwise the RMAs of the gains and losses.
+    """
+    def __init__(self, length: int = None, scalar: float = None, talib: bool = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.scalar = float(scalar) if scalar else 100
+        self.drift = int(drift) if drift and drift > 0 else 1
+        self.talib = talib_mode(talib)
+        self.name = f"RSI_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._diff = _Diff(self.drift)
+        self._positive, self._negative = RMA(self.length), RMA(self.length)
+        # TA Lib: the last close, the changes so far and the average gain and loss
+        self._close, self._count = npNaN, 0
+        self._gain, self._loss = 0.0, 0.0
+
+    def update(self, close: float) -> float:
+        close = float(close)
+        self.bars += 1
+        if not self.talib:
+            diff = self._diff.update(close)
+            positive = self._positive.update(0.0 if diff < 0 else diff)
+            negative = self._negative.update(0.0 if diff > 0 else diff)
+            self.value = divide(self.scalar * positive, positive + abs(negative))
+            return self.value
+
+        if isnan(self._close):
+            self._close = close
+            return npNaN
+        diff, self._close = close - self._close, close
+        self._count += 1
+        length = self.length
+        if self._count > length:
+            self._loss *= (length - 1)
+            self._gain *= (length - 1)
+        if diff < 0:
+            self._loss -= diff
+        else:
+            self._gain += diff
+        if self._count < length: return npNaN
+
+        self._loss /= length
+        self._gain /= length
+        total = self._gain + self._loss
+        self.value = 100.0 * (self._gain / total) if not -1e-14 < total < 1e-14 else 0.0
+        return self.value
+
+    def _history(self, close):
+        if not self.talib:
+            diff = self._diff.update_many(close)
+            positive = self._positive._batch(npWhere(diff < 0, 0.0, diff))
+            negative = self._negative._batch(npWhere(diff > 0, 0.0, diff))
+            if positive is None or negative is None: return None
+            with npErrstate(divide="ignore", invalid="ignore"):
+                return self.scalar * positive / (positive + npAbs(negative))
+
+        # TA Lib's average gain and loss of the changes since the first close
+        first = first_valid(close)
+        if first is None or npIsnan(close[first:]).any(): return None
+        diff = close[first + 1:] - close[first:-1]
+        if diff.size < self.length: return None
+        values = rsi(Series(close), self.length, self.scalar, talib=True, drift=self.drift)
+        if values is None: return None
+
+        self._close, self._count = float(close[-1]), diff.size
+        self._gain = wilder(npWhere(diff < 0, 0.0, diff), self.length)
+        self._loss = wilder(npWhere(diff < 0, -diff, 0.0), self.length)
+        return values.to_numpy(dtype=npFloat64)
+
+
+class MACD(Stream):
+    """Moving Average, Convergence/Divergence (MACD), see macd()
+
+    update() returns (macd, histogram, signal). Follows TA Lib's MACD when
+    it is installed, unless talib=False: the fast EMA starts with the slow
+    one and all three are NaN until the signal is.
+    """
+    def __init__(self, fast: int = None, slow: int = None, signal: int = None, talib: bool = None, **kwargs):
+        fast = int(fast) if fast and fast > 0 else 12
+        slow = int(slow) if slow and slow > 0 else 26
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast, self.slow = fast, slow
+        self.signal = int(signal) if signal and signal > 0 else 9
+        self.talib = talib_mode(talib)
+        self.asmode = kwargs.get("asmode", False)
+
+        _asmode = "AS" if self.asmode else ""
+        _props = f"_{self.fast}_{self.slow}_{self.signal}"
+        self.name = f"MACD{_asmode}{_props}"
+        self._columns = [self.name, f"MACD{_asmode}h{_props}", f"MACD{_asmode}s{_props}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, npNaN)
+        self._fast, self._slow = EMA(self.fast), EMA(self.slow)
+        self._signal, self._as_signal = EMA(self.signal), EMA(self.signal)
+        # TA Lib: the closes seeding the fast EMA, which starts with the slow one
+        self._closes = deque(maxlen=self.fast)
+        self._fast_value = npNaN
+        self._slow_ema = EMA(self.slow, talib=True)
+        self._signal_ema = EMA(self.signal, talib=True)
+
+    def _talib(self, close: float) -> tuple:
+        if not len(self._closes) and isnan(close): return npNaN, npNaN, npNaN
+        self._closes.append(close)
+        slow = self._slow_ema.update(close)
+        if isnan(slow): return npNaN, npNaN, npNaN
+
+        k = 2 / (self.fast + 1)
+        if isnan(self._fast_value):
+            total = 0.0
+            for x in self._closes:
+                total += x
+            self._fast_value = total / self.fast
+        else:
+            self._fast_value = ((close - self._fast_value) * k) + self._fast_value
+
+        macd = self._fast_value - slow
+        signal = self._signal_ema.update(macd)
+        if isnan(signal): return npNaN, npNaN, npNaN
+        return macd, macd - signal, signal
+
+    def update(self, close: float) -> tuple:
+        close = float(close)
+        self.bars += 1
+        if self.talib:
+            macd, histogram, signal = self._talib(close)
+        else:
+            macd = self._fast.update(close) - self._slow.update(close)
+            # The signal starts at the first MACD
+            signal = self._signal.update(macd) if self._signal.bars or not isnan(macd) else npNaN
+            histogram = macd - signal
+
+        if self.asmode:
+            macd = macd - signal
+            signal = self._as_signal.update(macd) if self._as_signal.bars or not isnan(macd) else npNaN
+            histogram = macd - signal
+
+        self.value = (macd, histogram, signal)
+        return self.value
+
+    def _history_talib(self, close):
+        """_history() of TA Lib's MACD: the fast EMA starts with the slow one,
+        seeded with the mean of the last 'fast' closes."""
+        first = first_valid(close)
+        if first is None or npIsnan(close[first:]).any(): return None
+        slow = self._slow_ema._batch(close)
+        start = first_valid(slow) if slow is not None else None
+        if start is None or start + 1 - first < self.fast: return None
+
+        self._closes.extend(close[first:start + 1][-self.fast:].tolist())
+        average = 0.0
+        for x in self._closes:
+            average += x
+        average /= self.fast
+        fast = ewm_mean(Series(npConcatenate([[average], close[start + 1:]])), 2 / (self.fast + 1))
+        self._fast_value = float(fast.iloc[-1])
+
+        macd_ = fast.to_numpy() - slow[start:]
+        signal = self._signal_ema._batch(macd_)
+        if signal is None: return None
+        macd_ = npConcatenate([npFull(start, npNaN), npWhere(npIsnan(signal), npNaN, macd_)])
+        signal = npConcatenate([npFull(start, npNaN), signal])
+        return macd_, signal
+
+    def _history(self, close):
+        if self.talib:
+            seeded = self._history_talib(close)
+            if seeded is None: return None
+            macd_, signal = seeded
+        else:
+            fast, slow = self._fast._batch(close), self._slow._batch(close)
+            if fast is None or slow is None: return None
+            macd_ = fast - slow
+            signal = _from_first(self._signal, macd_)
+            if signal is None: return None
+
+        if self.asmode:
+            macd_ = macd_ - signal
+            signal = _from_first(self._as_signal, macd_)
+            if signal is None: return None
+        return npColumnStack([macd_, macd_ - signal, signal])
+
+
+class STOCH(Stream):
+    """Stochastic Oscillator (STOCH), see stoch()
+
+    update(high, low, close) returns (k, d). Like non_zero_range(), epsilon
+    is added to the ranges once one is zero; stoch() adds it to all of them.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, k: int = None, d: int = None, smooth_k: int = None, mamode: str = None, **kwargs):
+        self.k = k if k and k > 0 else 14
+        self.d = d if d and d > 0 else 3
+        self.smooth_k = smooth_k if smooth_k and smooth_k > 0 else 3
+        self.mamode = mamode if isinstance(mamode, str) else "sma"
+
+        _props = f"_{self.k}_{self.d}_{self.smooth_k}"
+        self.name = f"STOCH{_props}"
+        self._columns = [f"STOCHk{_props}", f"STOCHd{_props}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN)
+        self._lowest, self._highest = Rolling(self.k, highest=False), Rolling(self.k)
+        self._stoch_k = ma(self.mamode, length=self.smooth_k)
+        self._stoch_d = ma(self.mamode, length=self.d)
+        self._epsilon = False
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        self.bars += 1
+        lowest_low = self._lowest.update(float(low))
+        highest_high = self._highest.update(float(high))
+
+        hl_range = highest_high - lowest_low
+        if hl_range == 0:
+            self._epsilon = True
+        if self._epsilon:
+            hl_range += sflt.epsilon
+        stoch = divide(100 * (float(close) - lowest_low), hl_range)
+
+        # Each MA starts at the first value of its input
+        stoch_k = self._stoch_k.update(stoch) if self._stoch_k.bars or not isnan(stoch) else npNaN
+        stoch_d = self._stoch_d.update(stoch_k) if self._stoch_d.bars or not isnan(stoch_k) else npNaN
+        self.value = (stoch_k, stoch_d)
+        return self.value
+
+    def _history(self, high, low, close):
+        lowest_low = Series(low).rolling(self.k).min().to_numpy()
+        highest_high = Series(high).rolling(self.k).max().to_numpy()
+        hl_range = highest_high - lowest_low
+        zero = first_valid(npWhere(hl_range == 0, 0.0, npNaN))
+        if zero is not None:
+            self._epsilon = True
+            hl_range[zero:] += sflt.epsilon
+        with npErrstate(divide="ignore", invalid="ignore"):
+            stoch = 100 * (close - lowest_low) / hl_range
+
+        stoch_k = _from_first(self._stoch_k, stoch)
+        stoch_d = _from_first(self._stoch_d, stoch_k) if stoch_k is not None else None
+        if stoch_d is None: return None
+        self._lowest.replay(low)
+        self._highest.replay(high)
+        return npColumnStack([stoch_k, stoch_d])
+
+
+class CCI(Stream):
+    """Commodity Channel Index (CCI), see cci()
+
+    update(high, low, close). The mean absolute deviation is over the
+    'length' typical prices of the window, O(length) per bar. Follows TA
+    Lib's CCI when it is installed, unless talib=False, which ignores 'c'.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, c: float = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.c = float(c) if c and c > 0 else 0.015
+        self.talib = talib_mode(talib)
+        self.name = f"CCI_{self.length}_{self.c}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._mean = SMA(self.length)
+        self._window = deque(maxlen=self.length)
+        # TA Lib: its circular buffer of typical prices
+        self._buffer, self._index = [0.0] * self.length, 0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        self.bars += 1
+        typical_price = (high + low + close) / 3.0
+        if not self.talib:
+            mean = self._mean.update(typical_price)
+            self._window.append(typical_price)
+            mad = npNaN
+            if len(self._window) == self.length:
+                window = npArray(self._window, dtype=npFloat64)
+                mad = npAbs(window - window.mean()).mean()
+            self.value = divide(typical_price - mean, self.c * mad)
+            return self.value
+
+        if not len(self._window) and isnan(typical_price): return npNaN
+        self._window.append(typical_price)
+        buffer, length = self._buffer, self.length
+        buffer[self._index] = typical_price
+        self._index = (self._index + 1) % length
+        if len(self._window) < length: return npNaN
+
+        average = 0.0
+        for x in buffer:
+            average += x
+        average /= length
+        deviation = 0.0
+        for x in buffer:
+            deviation += abs(x - average)
+        difference = typical_price - average
+        if difference != 0.0 and deviation != 0.0:
+            self.value = difference / (0.015 * (deviation / length))
+        else:
+            self.value = 0.0
+        return self.value
+
+    def _history(self, high, low, close):
+        if high.size < self.length: return None
+        if self.talib:
+            values = cci(Series(high), Series(low), Series(close), self.length, talib=True)
+            if values is None or not self._replay(self.length, high, low, close): return None
+            return values.to_numpy(dtype=npFloat64)
+
+        # cci()'s rolling mad() as one NumPy mean of all the windows
+        typical_price = (high + low + close) / 3.0
+        mean = self._mean._batch(typical_price)
+        if mean is None: return None
+        windows = sliding_window_view(typical_price, self.length)
+        mad = npAbs(windows - windows.mean(axis=1, keepdims=True)).mean(axis=1)
+        mad = npConcatenate([npFull(self.length - 1, npNaN), mad])
+        self._window.extend(typical_price[-self.length:].tolist())
+        with npErrstate(divide="ignore", invalid="ignore"):
+            return (typical_price - mean) / (self.c * mad)
+
+
+class WILLR(Stream):
+    """William's Percent R (WILLR), see willr()
+
+    update(high, low, close). Follows TA Lib's WILLR when it is installed,
+    unless talib=False.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        min_periods = kwargs.get("min_periods")
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        self.talib = talib_mode(talib)
+        self.name = f"WILLR_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        min_periods = self.length if self.talib else self.min_periods
+        self._lowest = Rolling(self.length, highest=False, min_periods=min_periods)
+        self._highest = Rolling(self.length, min_periods=min_periods)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        self.bars += 1
+        # TA Lib starts at the first bar without NaNs
+        if self.talib and not self._highest.bars and isnan(high + low + close): return npNaN
+        lowest_low = self._lowest.update(low)
+        highest_high = self._highest.update(high)
+        if not self.talib:
+            self.value = 100 * (divide(close - lowest_low, highest_high - lowest_low) - 1)
+            return self.value
+
+        diff = (highest_high - lowest_low) / (-100.0)
+        self.value = (highest_high - close) / diff if diff != 0.0 else 0.0
+        return self.value
+
+    def _history(self, high, low, close):
+        values = willr(Series(high), Series(low), Series(close), self.length, talib=self.talib, min_periods=self.min_periods)
+        if values is None or not self._replay(self.length, high, low, close): return None
+        return values.to_numpy(dtype=npFloat64)
+
+
+class TSI(Stream):
+    """True Strength Index (TSI), see tsi()
+
+    update() returns (tsi, signal).
+    """
+    def __init__(self, fast: int = None, slow: int = None, signal: int = None, scalar: float = None, mamode: str = None, drift: int = None, **kwargs):
+        self.fast = int(fast) if fast and fast > 0 else 13
+        self.slow = int(slow) if slow and slow > 0 else 25
+        self.signal = int(signal) if signal and signal > 0 else 13
+        self.scalar = float(scalar) if scalar else 100
+        self.mamode = mamode if isinstance(mamode, str) else "ema"
+        self.drift = int(drift) if drift and drift > 0 else 1
+        self.kwargs = {k: v for k, v in kwargs.items() if k != "length"}
+
+        _props = f"_{self.fast}_{self.slow}_{self.signal}"
+        self.name = f"TSI{_props}"
+        self._columns = [self.name, f"TSIs{_props}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN)
+        self._diff = _Diff(self.drift)
+        self._emas = [EMA(self.slow, **self.kwargs), EMA(self.fast, **self.kwargs)]
+        self._abs_emas = [EMA(self.slow, **self.kwargs), EMA(self.fast, **self.kwargs)]
+        self._signal = ma(self.mamode, length=self.signal)
+
+    def update(self, close: float) -> tuple:
+        self.bars += 1
+        diff = self._diff.update(float(close))
+        fast_slow_ema = self._emas[1].update(self._emas[0].update(diff))
+        abs_fast_slow_ema = self._abs_emas[1].update(self._abs_emas[0].update(abs(diff)))
+
+        tsi = divide(self.scalar * fast_slow_ema, abs_fast_slow_ema)
+        self.value = (tsi, self._signal.update(tsi))
+        return self.value
+
+    def _history(self, close):
+        diff = self._diff.update_many(close)
+        emas = [diff, npAbs(diff)]
+        for ema_, abs_ema in zip(self._emas, self._abs_emas):
+            emas = [ema_._batch(emas[0]), abs_ema._batch(emas[1])]
+            if emas[0] is None or emas[1] is None: return None
+
+        with npErrstate(divide="ignore", invalid="ignore"):
+            tsi = self.scalar * emas[0] / emas[1]
+        signal = self._signal._batch(tsi)
+        if signal is None: return None
+        return npColumnStack([tsi, signal])
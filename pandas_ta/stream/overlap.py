@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import copysign, isnan
+
+from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import float64 as npFloat64
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import where as npWhere
+from pandas import DatetimeIndex, Series, Timestamp
+from pandas_ta.overlap import ema, rma, sma, vwap, wma
+
+from ._base import Stream, divide, first_valid, shift, talib_mode
+
+
+def _nanmean(values: list) -> float:
+    """Mean of the values that are not NaN, summed like Series.mean()"""
+    values = npArray(values, dtype=npFloat64)
+    valid = ~npIsnan(values)
+    if not valid.any():
+        return npNaN
+    return npWhere(valid, values, 0.0).sum() / valid.sum()
+
+
+class EMA(Stream):
+    """Exponential Moving Average (EMA), see ema()
+
+    Follows TA Lib's EMA when it is installed, unless talib=False. Otherwise
+    seeded with the SMA of the first 'length' bars, or the first bar when
+    sma=False, and adjusted when adjust=True, like ema().
+    """
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.talib = talib_mode(talib)
+        self.sma = kwargs.get("sma", True)
+        self.adjust = kwargs.get("adjust", False)
+        self.alpha = 2 / (self.length + 1)
+        self.name = f"EMA_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._seed = []
+        self._count = 0
+        self._total = 0.0
+        self._weight = 0.0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.bars += 1
+        if self.talib:
+            # Leading NaNs are skipped, seeded with the SMA of 'length' bars
+            if not self._count and isnan(x): return npNaN
+            self._count += 1
+            if self._count < self.length:
+                self._total += x
+            elif self._count == self.length:
+                self._total += x
+                self.value = self._total / self.length
+            else:
+                self.value = ((x - self.value) * self.alpha) + self.value
+            return self.value
+
+        if self.sma and self.bars <= self.length:
+            self._seed.append(x)
+            if self.bars < self.length: return npNaN
+            x, self._seed = _nanmean(self._seed), []
+
+        # ewm_mean() from the first value that is not NaN
+        if not self._count and isnan(x): return npNaN
+        self._count += 1
+        decay = 1 - self.alpha
+        if self.adjust:
+            self._total = x + decay * self._total
+            self._weight = 1.0 + decay * self._weight
+            self.value = self._total / self._weight
+        elif self._count == 1:
+            self.value = x
+        else:
+            self.value = self.alpha * x + decay * self.value
+        return self.value
+
+    def _history(self, x):
+        if self.adjust or x.size < self.length: return None
+        values = ema(Series(x), self.length, talib=self.talib, sma=self.sma)
+        if values is None or isnan(values.iloc[-1]): return None
+
+        # The bars since the first that is not NaN, for ewm_mean() its
+        # inputs: the SMA of the first 'length' bars and the bars after
+        if self.talib or not self.sma:
+            self._count = x.size - first_valid(x)
+        else:
+            head = 0 if first_valid(x[:self.length]) is not None else first_valid(x[self.length:]) + 1
+            self._count = x.size - self.length + 1 - head
+        return values.to_numpy(dtype=npFloat64)
+
+
+class RMA(Stream):
+    """wildeR's Moving Average (RMA), see rma()"""
+    def __init__(self, length: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.alpha = 1.0 / self.length
+        self.name = f"RMA_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._count = 0
+        self._total = 0.0
+        self._weight = 0.0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.bars += 1
+        if not self._count and isnan(x): return npNaN
+
+        self._count += 1
+        decay = 1 - self.alpha
+        self._total = x + decay * self._total
+        self._weight = 1.0 + decay * self._weight
+        if self._count >= self.length:
+            self.value = self._total / self._weight
+        return self.value
+
+    def _history(self, x):
+        values = rma(Series(x), self.length)
+        if values is None or isnan(values.iloc[-1]): return None
+
+        # The sums of ewm(adjust=True) since the first bar that is not NaN
+        self._count = x.size - first_valid(x)
+        self._weight = (1.0 - (1.0 - self.alpha) ** self._count) / self.alpha
+        self._total = float(values.iloc[-1]) * self._weight
+        return values.to_numpy(dtype=npFloat64)
+
+
+class SMA(Stream):
+    """Simple Moving Average (SMA), see sma()
+
+    Follows TA Lib's SMA when it is installed, unless talib=False. Otherwise
+    the compensated running sum of Series.rolling(length, min_periods).mean()
+    so both agree to the last bit.
+    """
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        min_periods = kwargs.get("min_periods")
+        self.min_periods = int(min_periods) if min_periods is not None else self.length
+        self.talib = talib_mode(talib)
+        self.name = f"SMA_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = deque()
+        self._total = 0.0
+        # Rolling mean state: valid bars, negative ones, compensations of
+        # the additions and removals and the run of equal values
+        self._nobs, self._neg = 0, 0
+        self._add, self._remove = 0.0, 0.0
+        self._same, self._last = 0, npNaN
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.bars += 1
+        if self.talib:
+            if not len(self._window) and isnan(x): return npNaN
+            self._window.append(x)
+            self._total += x
+            if len(self._window) == self.length:
+                self.value = self._total / self.length
+                self._total -= self._window.popleft()
+            return self.value
+
+        if len(self._window) == self.length:
+            old = self._window.popleft()
+            if old == old:
+                self._nobs -= 1
+                y = -old - self._remove
+                t = self._total + y
+                self._remove = t - self._total - y
+                self._total = t
+                if copysign(1.0, old) < 0: self._neg -= 1
+
+        self._window.append(x)
+        if x == x:
+            self._nobs += 1
+            y = x - self._add
+            t = self._total + y
+            self._add = t - self._total - y
+            self._total = t
+            if copysign(1.0, x) < 0: self._neg += 1
+            self._same = self._same + 1 if x == self._last else 1
+            self._last = x
+
+        nobs = self._nobs
+        if nobs >= self.min_periods and nobs > 0:
+            result = self._total / nobs
+            if self._same >= nobs:
+                result = self._last
+            elif self._neg == 0 and result < 0:
+                result = 0.0
+            elif self._neg == nobs and result > 0:
+                result = 0.0
+        else:
+            result = npNaN
+        self.value = result
+        return self.value
+
+    def _history(self, x):
+        values = sma(Series(x), self.length, talib=self.talib, min_periods=self.min_periods)
+        if values is None or not self._replay(self.length, x): return None
+        return values.to_numpy(dtype=npFloat64)
+
+
+class WMA(Stream):
+    """Weighted Moving Average (WMA), see wma()
+
+    The running sums of TA Lib's WMA: the weighted sum is reduced by the
+    window's sum every bar. Without TA Lib, or with talib=False, a window
+    with a NaN is NaN and the sums restart after it, like wma().
+    """
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.talib = talib_mode(talib)
+        self.name = f"WMA_{self.length}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._window = deque()
+        self._sum, self._sub, self._trailing = 0.0, 0.0, 0.0
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.bars += 1
+        if isnan(x) and (not self.talib or not len(self._window)):
+            if len(self._window):
+                self._window.clear()
+                self._sum, self._sub, self._trailing = 0.0, 0.0, 0.0
+            self.value = npNaN
+            return self.value
+
+        self._window.append(x)
+        n = len(self._window)
+        if n < self.length:
+            self._sub += x
+            self._sum += x * n
+            return npNaN
+
+        self._sub += x
+        self._sub -= self._trailing
+        self._sum += x * self.length
+        self._trailing = self._window.popleft()
+        self.value = self._sum / ((self.length * (self.length + 1)) >> 1)
+        self._sum -= self._sub
+        return self.value
+
+    def _history(self, x):
+        values = wma(Series(x), self.length, talib=self.talib)
+        if values is None or not self._replay(self.length, x): return None
+        return values.to_numpy(dtype=npFloat64)
+
+
+class DEMA(Stream):
+    """Double Exponential Moving Average (DEMA), see dema()"""
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.talib = talib_mode(talib)
+        self.name = f"DEMA_{self.length}"
+        # TA Lib's DEMA is made of TA Lib's EMAs, as is dema() with it
+        self._ema1, self._ema2 = EMA(self.length), EMA(self.length)
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._ema1.reset()
+        self._ema2.reset()
+
+    def update(self, x: float) -> float:
+        self.bars += 1
+        ema1 = self._ema1.update(x)
+        ema2 = self._ema2.update(ema1)
+        self.value = 2 * ema1 - ema2
+        return self.value
+
+    def _history(self, x):
+        ema1 = self._ema1._batch(x)
+        ema2 = self._ema2._batch(ema1) if ema1 is not None else None
+        if ema2 is None: return None
+        return 2 * ema1 - ema2
+
+
+class TEMA(Stream):
+    """Triple Exponential Moving Average (TEMA), see tema()"""
+    def __init__(self, length: int = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.talib = talib_mode(talib)
+        self.name = f"TEMA_{self.length}"
+        kwargs = {} if self.talib else kwargs
+        self._emas = [EMA(self.length, **kwargs) for _ in range(3)]
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        for ema in self._emas:
+            ema.reset()
+
+    def update(self, x: float) -> float:
+        self.bars += 1
+        ema1 = self._emas[0].update(x)
+        ema2 = self._emas[1].update(ema1)
+        ema3 = self._emas[2].update(ema2)
+        if self.talib:
+            self.value = ema3 + ((3.0 * ema1) - (3.0 * ema2))
+        else:
+            self.value = 3 * (ema1 - ema2) + ema3
+        return self.value
+
+    def _history(self, x):
+        e = [x]
+        for ema_ in self._emas:
+            e.append(ema_._batch(e[-1]))
+            if e[-1] is None: return None
+        if self.talib:
+            return e[3] + ((3.0 * e[1]) - (3.0 * e[2]))
+        return 3 * (e[1] - e[2]) + e[3]
+
+
+class T3(Stream):
+    """T3, see t3()
+
+    Follows TA Lib's T3 when it is installed, unless talib=False: each of
+    the six EMAs is seeded with the average of the previous one's first
+    'length' values. Otherwise t3()'s six chained EMAs.
+    """
+    def __init__(self, length: int = None, a: float = None, talib: bool = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.a = a = float(a) if a and a > 0 and a < 1 else 0.7
+        self.talib = talib_mode(talib)
+        self.name = f"T3_{self.length}_{self.a}"
+        self.k = 2.0 / (self.length + 1.0)
+
+        if self.talib:
+            aa = a * a
+            c1 = -(aa * a)
+            self._c = (c1, 3.0 * (aa - c1), -6.0 * aa - 3.0 * (a - c1), 1.0 + 3.0 * a - c1 + 3.0 * aa)
+            self._emas = []
+        else:
+            self._c = (-a * a**2, 3 * a**2 + 3 * a**3, -6 * a**2 - 3 * a - 3 * a**3, a**3 + 3 * a**2 + 3 * a + 1)
+            self._emas = [EMA(self.length, **kwargs) for _ in range(6)]
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        for ema in self._emas:
+            ema.reset()
+        # TA Lib: the seeded EMAs, the sum and count seeding the next one
+        self._e = []
+        self._total, self._count = 0.0, 0
+
+    def update(self, x: float) -> float:
+        self.bars += 1
+        c1, c2, c3, c4 = self._c
+        if not self.talib:
+            e = [float(x)]
+            for ema in self._emas:
+                e.append(ema.update(e[-1]))
+            self.value = c1 * e[6] + c2 * e[5] + c3 * e[4] + c4 * e[3]
+            return self.value
+
+        x = float(x)
+        if not len(self._e) and not self._count and isnan(x): return npNaN
+
+        e, k = self._e, self.k
+        if len(e):
+            e[0] = (k * x) + ((1.0 - k) * e[0])
+            for i in range(1, len(e)):
+                e[i] = (k * e[i - 1]) + ((1.0 - k) * e[i])
+
+        if len(e) < 6:
+            self._total += e[-1] if len(e) else x
+            self._count += 1
+            while len(e) < 6 and self._count >= self.length:
+                e.append(self._total / self.length)
+                self._total, self._count = e[-1], 1
+            if len(e) < 6: return npNaN
+
+        self.value = c1 * e[5] + c2 * e[4] + c3 * e[3] + c4 * e[2]
+        return self.value
+
+    def _history(self, x):
+        # TA Lib's seeding of the EMAs is only streamed
+        if self.talib: return None
+        e = [x]
+        for ema_ in self._emas:
+            e.append(ema_._batch(e[-1]))
+            if e[-1] is None: return None
+        c1, c2, c3, c4 = self._c
+        return c1 * e[6] + c2 * e[5] + c3 * e[4] + c4 * e[3]
+
+
+class ZLMA(Stream):
+    """Zero Lag Moving Average (ZLMA), see zlma() and ma() for the 'mamode'"""
+    def __init__(self, length: int = None, mamode: str = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 10
+        self.mamode = mamode.lower() if isinstance(mamode, str) else "ema"
+        self.lag = int(0.5 * (self.length - 1))
+        self._ma = ma(self.mamode, length=self.length, **kwargs)
+        self.name = f"ZL_{self._ma.name}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._ma.reset()
+        self._closes = deque(maxlen=self.lag + 1)
+
+    def update(self, x: float) -> float:
+        x = float(x)
+        self.bars += 1
+        self._closes.append(x)
+        lagged = self._closes[0] if len(self._closes) > self.lag else npNaN
+        self.value = self._ma.update(2 * x - lagged)
+        return self.value
+
+    def _history(self, x):
+        values = self._ma._batch(2 * x - shift(x, self.lag))
+        if values is None: return None
+        self._closes.extend(x[-self.lag - 1:].tolist())
+        return values
+
+
+class VWAP(Stream):
+    """Volume Weighted Average Price (VWAP), see vwap()
+
+    update(high, low, close, volume, timestamp) keeps the sums of the
+    session, the 'anchor' period of the timestamp, and starts new ones when
+    a timestamp is outside of it. Returns the vwap, or with 'bands', a
+    tuple of the vwap and the lower and upper band of each. update_many()
+    takes the timestamps from volume's DatetimeIndex when not given.
+    """
+    inputs = ("high", "low", "close", "volume", "timestamp")
+
+    def __init__(self, anchor: str = None, bands: list = None, **kwargs):
+        self.anchor = anchor.upper() if anchor and isinstance(anchor, str) and len(anchor) >= 1 else "D"
+        self.bands = list(bands) if isinstance(bands, (list, tuple)) else [bands] if bands else []
+        self.name = f"VWAP_{self.anchor}"
+        self._columns = [self.name]
+        for band in self.bands:
+            self._columns += [f"VWAPL_{self.anchor}_{band}", f"VWAPU_{self.anchor}_{band}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        if self.bands:
+            self.value = tuple([npNaN] * len(self._columns))
+        # The session's first and last nanosecond, and its sums of volume,
+        # price * volume and price^2 * volume
+        self.session = (0, -1)
+        self._sums, self._compensations = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+
+    def _sum(self, i: int, x: float) -> float:
+        """Adds x to the i-th sum with Kahan summation, like cumsum() of a
+        groupby(). NaNs are NaN and skipped."""
+        if x != x: return npNaN
+        total, compensation = self._sums[i], self._compensations[i]
+        y = x - compensation
+        t = total + y
+        self._compensations[i] = t - total - y
+        self._sums[i] = t
+        return t
+
+    def _update(self, high: float, low: float, close: float, volume: float, timestamp: int):
+        """update() with the timestamp in nanoseconds, local time."""
+        self.bars += 1
+        if not self.session[0] <= timestamp <= self.session[1]:
+            period = Timestamp(timestamp).to_period(self.anchor)
+            self.session = (period.start_time.value, period.end_time.value)
+            self._sums, self._compensations = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+
+        typical_price = (high + low + close) / 3.0
+        wp = typical_price * volume
+        cum_volume = self._sum(0, volume)
+        vwap = divide(self._sum(1, wp), cum_volume)
+        if not self.bands:
+            self.value = vwap
+            return vwap
+
+        variance = divide(self._sum(2, wp * typical_price), cum_volume) - vwap * vwap
+        stdev = (variance if not variance < 0 else 0.0) ** 0.5
+        value = [vwap]
+        for band in self.bands:
+            value += [vwap - band * stdev, vwap + band * stdev]
+        self.value = tuple(value)
+        return self.value
+
+    def update(self, high: float, low: float, close: float, volume: float, timestamp):
+        timestamp = Timestamp(timestamp)
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.tz_localize(None)  # Like to_period()
+        return self._update(float(high), float(low), float(close), float(volume), timestamp.value)
+
+    def update_many(self, high, low, close, volume, timestamps=None):
+        timestamps = DatetimeIndex(volume.index if timestamps is None else timestamps)
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_localize(None)
+        bars = [npAsarray(x, dtype=npFloat64) for x in (high, low, close, volume)]
+        values = self._batch(*bars, timestamps)
+        if values is not None: return values
+
+        update = self._update
+        result = [update(*bar) for bar in zip(*[x.tolist() for x in bars], timestamps.asi8.tolist())]
+        return npArray(result, dtype=npFloat64)
+
+    def _history(self, high, low, close, volume, timestamps):
+        if not timestamps.is_monotonic_increasing: return None
+        high, low, close, volume = [Series(x, index=timestamps) for x in (high, low, close, volume)]
+        values = vwap(high, low, close, volume, anchor=self.anchor, bands=self.bands)
+        if values is None: return None
+
+        # The sums of the last session, from its first bar
+        period = timestamps[-1].to_period(self.anchor)
+        first = timestamps.searchsorted(period.start_time)
+        update = self._update
+        bars = [x.to_numpy()[first:].tolist() for x in (high, low, close, volume)]
+        for bar in zip(*bars, timestamps.asi8[first:].tolist()):
+            update(*bar)
+        return values.to_numpy(dtype=npFloat64)
+
+
+def ma(name: str = None, **kwargs) -> Stream:
+    """Streaming MA Utility, see ta.ma()
+
+    Returns the streaming "dema", "ema", "rma", "sma", "t3", "tema", "wma"
+    or "zlma" with the kwargs. Other names are "ema", like ta.ma(), except
+    ta.ma()'s MAs that do not stream, they raise a ValueError.
+    """
+    mas = {"dema": DEMA, "ema": EMA, "rma": RMA, "sma": SMA, "t3": T3, "tema": TEMA, "wma": WMA, "zlma": ZLMA}
+    name = name.lower() if isinstance(name, str) else "ema"
+    if name not in mas:
+        from pandas_ta.overlap import ma as batch_ma
+        if name in batch_ma():
+            raise ValueError(f"[X] Streams {', '.join(mas)}, not '{name}'")
+        name = "ema"
+    return mas[name](**kwargs)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from inspect import signature
+
+from numpy import array as npArray
+from numpy import float64 as npFloat64
+from numpy import nan as npNaN
+from pandas import DataFrame
+from pandas_ta.core import AnalysisIndicators, Strategy
+
+from .momentum import CCI, MACD, RSI, STOCH, TSI, WILLR
+from .overlap import DEMA, EMA, RMA, SMA, T3, TEMA, VWAP, WMA, ZLMA
+from .trend import CKSP, PSAR, SUPERTREND
+from .volatility import ATR
+
+# The streaming indicator of each kind
+STREAMS = {
+    "atr": ATR, "cci": CCI, "cksp": CKSP, "dema": DEMA, "ema": EMA,
+    "macd": MACD, "psar": PSAR, "rma": RMA, "rsi": RSI, "sma": SMA,
+    "stoch": STOCH, "supertrend": SUPERTREND, "t3": T3, "tema": TEMA,
+    "tsi": TSI, "vwap": VWAP, "willr": WILLR, "wma": WMA, "zlma": ZLMA,
+}
+
+# Strategy keys that are not arguments of the indicator
+_STRATEGY_KEYS = (
+    "kind", "params", "prefix", "suffix", "delimiter", "col_names",
+    "col_numbers", "offset", "append", "verbose", "timed",
+    "open", "high", "low", "close", "volume",
+)
+
+
+class _Task(object):
+    """A Strategy entry: its stream, input columns, selected values and
+    their column names, and the delay of its 'offset'."""
+    def __init__(self, ind: dict):
+        kind = ind["kind"].lower()
+        params = ind["params"] if "params" in ind and isinstance(ind["params"], tuple) else ()
+        kwargs = {k: v for k, v in ind.items() if k not in _STRATEGY_KEYS}
+
+        # 'params' are the positional arguments of df.ta's method
+        names = list(signature(getattr(AnalysisIndicators, kind)).parameters)[1:]
+        kwargs.update(zip(names, params))
+        self.stream = STREAMS[kind](**kwargs)
+
+        # Its inputs are columns of the bars or of the earlier entries.
+        # Optional ones, like psar's close, only when the entry sets them
+        self.inputs = [
+            ind.get(x, x) for x in self.stream.inputs
+            if x != "timestamp" and (x not in self.stream.optional or x in ind)
+        ]
+        self.timestamp = "timestamp" in self.stream.inputs
+
+        columns = self.stream.columns
+        self.single = len(columns) == 1
+        self.numbers = list(range(len(columns)))
+        self.selected = ind.get("col_numbers") is not None and not self.single
+        if self.selected:
+            self.numbers = [int(n) for n in ind["col_numbers"]]
+        delimiter = ind.get("delimiter", "_")
+        prefix = f"{ind['prefix']}{delimiter}" if "prefix" in ind else ""
+        suffix = f"{delimiter}{ind['suffix']}" if "suffix" in ind else ""
+        self.columns = [prefix + columns[n] + suffix for n in self.numbers]
+
+        col_names = ind.get("col_names")
+        if col_names is not None:
+            col_names = col_names if isinstance(col_names, tuple) else (col_names,)
+            if len(col_names) < len(self.columns):
+                raise ValueError(f"[X] Not enough col_names for {kind}: got {len(col_names)}, expected {len(self.columns)}")
+            self.columns = list(col_names[:len(self.columns)])
+
+        offset = int(ind.get("offset") or 0)
+        if offset < 0:
+            raise ValueError(f"[X] Streams can not look ahead, {kind} has offset {offset}")
+        self.delay = deque([(npNaN,) * len(self.columns)] * offset, maxlen=offset + 1) if offset else None
+
+
+class StreamingStrategy(object):
+    """Streaming Strategy
+
+    Runs a custom Strategy one bar at a time with the streaming indicators,
+    the columns of df.ta.strategy() with the same values for each bar.
+    Entries keep their 'params', 'prefix', 'suffix', 'col_names',
+    'col_numbers' and 'offset' and read other input columns, like
+    {"close": "volume"}, from the bars or from the columns of the earlier
+    entries. Kinds without a streaming indicator, see STREAMS, raise a
+    ValueError.
+
+    Args:
+        strategy (Strategy): A custom Strategy.
+
+    Example:
+        stream = StreamingStrategy(ta.CommonStrategy)
+        stream.update_many(df)  # History, as a DataFrame
+        row = stream.update(bar)  # Then a dict of the columns per bar
+    """
+    def __init__(self, strategy: Strategy):
+        if not isinstance(strategy, Strategy) or not strategy.total_ta():
+            raise ValueError("[X] StreamingStrategy requires a custom Strategy")
+        missing = [ind["kind"] for ind in strategy.ta if ind["kind"].lower() not in STREAMS]
+        if len(missing):
+            raise ValueError(f"[X] No streaming indicator for {', '.join(missing)}")
+
+        self.strategy = strategy
+        self.tasks = [_Task(ind) for ind in strategy.ta]
+        self.columns = [c for task in self.tasks for c in task.columns]
+        self.bars = 0
+
+    def __repr__(self) -> str:
+        return f"StreamingStrategy({self.strategy.name}, columns={len(self.columns)}, bars={self.bars})"
+
+    def reset(self) -> None:
+        """Forgets all the bars."""
+        self.tasks = [_Task(ind) for ind in self.strategy.ta]
+        self.bars = 0
+
+    def update(self, bar, timestamp=None) -> dict:
+        """Returns the Strategy's columns for the next bar, a dict or Series
+        of its 'open', 'high', 'low', 'close' and 'volume'. The 'timestamp',
+        for vwap, defaults to the bar's name."""
+        if timestamp is None:
+            timestamp = getattr(bar, "name", None)
+        row = {}
+        for task in self.tasks:
+            args = [row[x] if x in row else bar[x] for x in task.inputs]
+            if task.timestamp:
+                args.append(timestamp)
+            values = task.stream.update(*args)
+            if task.single:
+                values = (values,)
+            elif task.selected:
+                values = tuple([values[n] for n in task.numbers])
+            if task.delay is not None:
+                task.delay.append(values)
+                values = task.delay[0]
+            row.update(zip(task.columns, values))
+        self.bars += 1
+        return row
+
+    def update_many(self, df: DataFrame) -> DataFrame:
+        """Updates with every bar of 'df' and returns the Strategy's columns,
+        indexed like 'df'. The timestamps for vwap are its DatetimeIndex."""
+        columns = {}
+        for task in self.tasks:
+            args = [columns[x] if x in columns else df[x].to_numpy(dtype=npFloat64) for x in task.inputs]
+            if task.timestamp:
+                args.append(df.index)
+            values = task.stream.update_many(*args).reshape(df.shape[0], -1)[:, task.numbers]
+            if task.delay is not None:
+                # The last 'offset' values are pending
+                offset = task.delay.maxlen - 1
+                values = [*list(task.delay)[-offset:], *map(tuple, values)]
+                task.delay.extend(values[-offset - 1:])
+                values = npArray(values[:df.shape[0]], dtype=npFloat64).reshape(df.shape[0], -1)
+            columns.update(zip(task.columns, values.T))
+        self.bars += df.shape[0]
+        return DataFrame(columns, index=df.index, columns=self.columns)
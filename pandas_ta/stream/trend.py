@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from sys import float_info as sflt
+
+from numpy import column_stack as npColumnStack
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from pandas import Series
+from pandas_ta import Imports
+from pandas_ta.overlap.supertrend import _supertrend_kernel, _supertrend_step
+from pandas_ta.trend.psar import _psar_step, psar
+from pandas_ta.utils._incremental import _psar_state
+
+from ._base import Rolling, Stream
+from .volatility import ATR
+
+
+class CKSP(Stream):
+    """Chande Kroll Stop (CKSP), see cksp()
+
+    update(high, low, close) returns the (long, short) stops: the highest
+    high less 'x' ATRs and the lowest low plus 'x' ATRs, trailed over 'q'
+    bars.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, p: int = None, x: float = None, q: int = None, tvmode: bool = None, **kwargs):
+        self.p = int(p) if p and p > 0 else 10
+        self.x = float(x) if x and x > 0 else 1 if tvmode is True else 3
+        self.q = int(q) if q and q > 0 else 9 if tvmode is True else 20
+        self.tvmode = tvmode if isinstance(tvmode, bool) else True
+        self.mamode = "rma" if self.tvmode is True else "sma"
+
+        _props = f"_{self.p}_{self.x}_{self.q}"
+        self.name = f"CKSP{_props}"
+        self._columns = [f"CKSPl{_props}", f"CKSPs{_props}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN)
+        self._atr = ATR(self.p, mamode=self.mamode)
+        self._highest, self._lowest = Rolling(self.p), Rolling(self.p, highest=False)
+        self._long, self._short = Rolling(self.q), Rolling(self.q, highest=False)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        high, low, close = float(high), float(low), float(close)
+        self.bars += 1
+        atr = self._atr.update(high, low, close)
+        long_stop = self._long.update(self._highest.update(high) - self.x * atr)
+        short_stop = self._short.update(self._lowest.update(low) + self.x * atr)
+        self.value = (long_stop, short_stop)
+        return self.value
+
+    def _history(self, high, low, close):
+        atr = self._atr._batch(high, low, close)
+        if atr is None: return None
+        long_stop = Series(high).rolling(self.p).max().to_numpy() - self.x * atr
+        short_stop = Series(low).rolling(self.p).min().to_numpy() + self.x * atr
+
+        self._highest.replay(high)
+        self._lowest.replay(low)
+        self._long.replay(long_stop)
+        self._short.replay(short_stop)
+        return npColumnStack([
+            Series(long_stop).rolling(self.q).max().to_numpy(),
+            Series(short_stop).rolling(self.q).min().to_numpy(),
+        ])
+
+
+class PSAR(Stream):
+    """Parabolic Stop and Reverse (PSAR), see psar()
+
+    update(high, low, close=None) returns (long, short, af, reversal), the
+    steps of psar()'s kernel. The direction is set by the second bar, the
+    initial SAR is the first bar's close when given.
+    """
+    inputs = ("high", "low", "close")
+    optional = ("close",)  # Like psar(), only when given
+
+    def __init__(self, af0: float = None, af: float = None, max_af: float = None, **kwargs):
+        self.af = float(af) if af and af > 0 else 0.02
+        self.af0 = float(af0) if af0 and af0 > 0 else self.af
+        self.max_af = float(max_af) if max_af and max_af > 0 else 0.2
+
+        _params = f"_{self.af0}_{self.max_af}"
+        self.name = f"PSAR{_params}"
+        self._columns = [f"PSARl{_params}", f"PSARs{_params}", f"PSARaf{_params}", f"PSARr{_params}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, npNaN, self.af0, 0)
+        # Starts at 'af', then steps by and resets to 'af0' like psar()
+        self.falling, self.sar, self.ep, self.acceleration = False, npNaN, npNaN, self.af
+        self._highs, self._lows = deque(maxlen=2), deque(maxlen=2)
+        self._close = npNaN
+
+    def update(self, high: float, low: float, close: float = None) -> tuple:
+        high, low = float(high), float(low)
+        self.bars += 1
+        highs, lows = self._highs, self._lows
+        if self.bars == 1:
+            highs.append(high)
+            lows.append(low)
+            self._close = float(close) if close is not None else npNaN
+            self.value = (npNaN, npNaN, self.af0, 0)
+            return self.value
+
+        if self.bars == 2:
+            # Falling if the first -DM is positive, not zero()
+            up, dn = high - highs[0], lows[0] - low
+            self.falling = dn > up and dn >= sflt.epsilon
+            self.sar = highs[0] if self.falling else lows[0]
+            self.ep = lows[0] if self.falling else highs[0]
+            if close is not None:
+                self.sar = self._close
+
+        # The kernel's step in Python, a numba call costs more per bar
+        falling, _sar, ep, af, reverse = _psar_step.py_func(
+            high, low, highs[-1], highs[0], lows[-1], lows[0],
+            self.falling, self.sar, self.ep, self.acceleration, self.af0, self.max_af
+        )
+
+        highs.append(high)
+        lows.append(low)
+        self.falling, self.sar, self.ep, self.acceleration = falling, _sar, ep, af
+        if falling:
+            self.value = (npNaN, _sar, af, int(reverse))
+        else:
+            self.value = (_sar, npNaN, af, int(reverse))
+        return self.value
+
+    def _history(self, high, low, close=None):
+        if high.size < 3 or npIsnan(high).any() or npIsnan(low).any(): return None
+        close = Series(close) if close is not None else None
+        values = psar(Series(high), Series(low), close, self.af0, self.af, self.max_af).to_numpy(dtype=float)
+
+        # The state the incremental strategy() resumes from
+        state = _psar_state({"high": high, "low": low}, values.T)
+        self.falling, self.sar, self.ep, self.acceleration = state["falling"], state["sar"], state["ep"], state["af"]
+        self._highs.extend(high[-2:].tolist())
+        self._lows.extend(low[-2:].tolist())
+        return values
+
+
+class SUPERTREND(Stream):
+    """Supertrend (SUPERT), see supertrend()
+
+    update(high, low, close) returns (trend, direction, long, short), the
+    steps of supertrend()'s kernel. 'reversal' is True when the direction
+    changed on the last bar.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, multiplier: float = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 7
+        self.multiplier = float(multiplier) if multiplier and multiplier > 0 else 3.0
+
+        _props = f"_{self.length}_{self.multiplier}"
+        self.name = f"SUPERT{_props}"
+        self._columns = [self.name, f"SUPERTd{_props}", f"SUPERTl{_props}", f"SUPERTs{_props}"]
+        super().__init__()
+
+    @property
+    def columns(self) -> list:
+        return self._columns
+
+    def reset(self) -> None:
+        super().reset()
+        self.value = (npNaN, 1, npNaN, npNaN)
+        self.direction, self.reversal = 1, False
+        self.upperband, self.lowerband = npNaN, npNaN
+        self._atr = ATR(self.length)
+
+    def update(self, high: float, low: float, close: float) -> tuple:
+        high, low, close = float(high), float(low), float(close)
+        self.bars += 1
+        hl2 = 0.5 * (high + low)
+        matr = self.multiplier * self._atr.update(high, low, close)
+        upperband, lowerband = hl2 + matr, hl2 - matr
+        if self.bars == 1:
+            self.upperband, self.lowerband = upperband, lowerband
+            self.value = (0.0, 1, npNaN, npNaN)
+            return self.value
+
+        direction, upperband, lowerband = _supertrend_step.py_func(
+            close, upperband, lowerband, self.direction, self.upperband, self.lowerband
+        )
+        self.reversal = direction != self.direction
+        self.direction = direction
+        self.upperband, self.lowerband = upperband, lowerband
+        if direction > 0:
+            self.value = (lowerband, direction, lowerband, npNaN)
+        else:
+            self.value = (upperband, direction, npNaN, upperband)
+        return self.value
+
+    def _history(self, high, low, close):
+        atr = self._atr._batch(high, low, close)
+        if atr is None: return None
+        hl2 = 0.5 * (high + low)
+        upperband, lowerband = hl2 + self.multiplier * atr, hl2 - self.multiplier * atr
+
+        # supertrend()'s kernel leaves the final bands in place
+        kernel = _supertrend_kernel if Imports["numba"] else _supertrend_kernel.py_func
+        trend, direction, long, short = kernel(close, upperband, lowerband)
+        self.direction = int(direction[-1])
+        self.reversal = bool(direction.size > 1 and direction[-1] != direction[-2])
+        self.upperband, self.lowerband = float(upperband[-1]), float(lowerband[-1])
+        return npColumnStack([trend, direction, long, short])
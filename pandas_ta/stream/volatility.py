@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from math import isnan
+from sys import float_info as sflt
+
+from numpy import abs as npAbs
+from numpy import fmax as npFmax
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import where as npWhere
+from pandas import Series
+from pandas_ta.volatility import atr
+
+from ._base import Stream, first_valid, shift, talib_mode, wilder
+from .overlap import ma
+
+
+class ATR(Stream):
+    """Average True Range (ATR), see atr()
+
+    update(high, low, close). Follows TA Lib's ATR when it is installed,
+    unless talib=False. Otherwise the 'mamode' MA of the True Range. Without
+    TA Lib, like non_zero_range(), epsilon is added to the high-low ranges
+    once one is zero; true_range() adds it to all of them.
+    """
+    inputs = ("high", "low", "close")
+
+    def __init__(self, length: int = None, mamode: str = None, talib: bool = None, drift: int = None, **kwargs):
+        self.length = int(length) if length and length > 0 else 14
+        self.mamode = mamode.lower() if mamode and isinstance(mamode, str) else "rma"
+        self.drift = int(drift) if drift and drift > 0 else 1
+        self.talib = talib_mode(talib)
+        # true_range() uses TA Lib's TRANGE when it is installed
+        self.trange = talib_mode(None)
+        self.percent = kwargs.get("percent", False)
+        self.name = f"ATR{self.mamode[0]}_{self.length}{'p' if self.percent else ''}"
+        super().__init__()
+
+    def reset(self) -> None:
+        super().reset()
+        self._closes = deque(maxlen=1 if self.trange else self.drift)
+        self._ma = ma(self.mamode, length=self.length)
+        self._epsilon = False
+        # TA Lib: the True Ranges so far and their sum until the first ATR
+        self._count, self._total, self._atr = 0, 0.0, npNaN
+
+    def _true_range(self, high: float, low: float, close: float) -> float:
+        # TA Lib starts at the first bar without NaNs
+        if self.trange and not len(self._closes) and isnan(high + low + close): return npNaN
+        if len(self._closes) < self._closes.maxlen:
+            self._closes.append(close)
+            return npNaN
+        prev_close = self._closes[0]
+        self._closes.append(close)
+
+        hl_range = high - low
+        if self.trange:
+            tr = hl_range
+            if abs(high - prev_close) > tr: tr = abs(high - prev_close)
+            if abs(low - prev_close) > tr: tr = abs(low - prev_close)
+            return tr
+
+        if hl_range == 0:
+            self._epsilon = True
+        if self._epsilon:
+            hl_range += sflt.epsilon
+        # The largest that is not NaN, like DataFrame.max(axis=1)
+        ranges = [abs(x) for x in (hl_range, high - prev_close, prev_close - low) if x == x]
+        return max(ranges) if len(ranges) else npNaN
+
+    def _talib(self, high: float, low: float, close: float) -> float:
+        # Seeded with the SMA of the first 'length' True Ranges
+        tr = self._true_range(high, low, close)
+        if not self._count and isnan(tr): return npNaN
+        self._count += 1
+        length = self.length
+        if self._count <= length:
+            self._total += tr
+            if self._count < length: return npNaN
+            self._atr = self._total / length
+        else:
+            self._atr = ((self._atr * (length - 1)) + tr) / length
+        return self._atr
+
+    def update(self, high: float, low: float, close: float) -> float:
+        high, low, close = float(high), float(low), float(close)
+        self.bars += 1
+        if self.talib:
+            atr = self._talib(high, low, close)
+        else:
+            atr = self._ma.update(self._true_range(high, low, close))
+
+        if self.percent:
+            atr *= 100 / close
+        self.value = atr
+        return atr
+
+    def _true_ranges(self, high, low, close):
+        """_true_range() of every bar."""
+        if self.trange:
+            # From the bar after the first without NaNs
+            first = first_valid(high + low + close)
+            if first is None: return None
+            prev_close = shift(close, 1)
+            tr = high - low
+            tr = npWhere(npAbs(high - prev_close) > tr, npAbs(high - prev_close), tr)
+            tr = npWhere(npAbs(low - prev_close) > tr, npAbs(low - prev_close), tr)
+            tr[:first + 1] = npNaN
+            self._closes.append(float(close[-1]))
+            return tr
+
+        prev_close = shift(close, self.drift)
+        hl_range = high - low
+        hl_range[:self.drift] = npNaN
+        zero = first_valid(npWhere(hl_range == 0, 0.0, npNaN))
+        if zero is not None:
+            self._epsilon = True
+            hl_range[zero:] += sflt.epsilon
+        tr = npFmax(npFmax(npAbs(hl_range), npAbs(high - prev_close)), npAbs(prev_close - low))
+        self._closes.extend(close[-self.drift:].tolist())
+        return tr
+
+    def _history(self, high, low, close):
+        if self.talib:
+            first = first_valid(high + low + close)
+            if first is None or npIsnan((high + low + close)[first:]).any(): return None
+            values = atr(Series(high), Series(low), Series(close), self.length, talib=True, percent=self.percent)
+            tr = self._true_ranges(high, low, close)[first + 1:]
+            if values is None or tr.size < self.length: return None
+
+            # TA Lib's ATR is the Wilder average of the True Ranges
+            self._count, self._atr = tr.size, wilder(tr, self.length)
+            self._total = float(tr[:self.length].sum())
+            return values.to_numpy(dtype=float)
+
+        tr = self._true_ranges(high, low, close)
+        values = self._ma._batch(tr) if tr is not None else None
+        if values is None: return None
+        if self.percent:
+            values = values * (100 / close)
+        return values
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from pandas_ta.utils import get_drift, get_offset, is_percent, verify_series
+from pandas_ta.utils import consecutive, get_drift, get_offset, is_percent, verify_series
 
 def decreasing(close, length=None, strict=None, asint=None, percent=None, drift=None, offset=None, **kwargs):
     """Indicator: Decreasing"""
@@ -17,13 +17,12 @@ def decreasing(close, length=None, strict=None, asint=None, percent=None, drift=
     # Calculate Result
     close_ = (1 - 0.01 * percent) * close if percent else close
     if strict:
-        # Returns value as float64? Have to cast to bool
+        # Also needs the length - 2 one bar changes before 'drift' - 2 bars
+        # ago, i.e. a run of them ending there
         decreasing = close < close_.shift(drift)
-        for x in range(3, length + 1):
-            decreasing = decreasing & (close.shift(x - (drift + 1)) < close_.shift(x - drift))
-
-        decreasing.fillna(0, inplace=True)
-        decreasing = decreasing.astype(bool)
+        if length > 2:
+            steps = consecutive(close < close_.shift(1)).shift(2 - drift)
+            decreasing = decreasing & (steps >= length - 2)
     else:
         decreasing = close_.diff(length) < 0
 
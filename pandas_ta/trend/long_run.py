@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from .decreasing import decreasing
 from .increasing import increasing
 from pandas_ta.utils import get_offset, verify_series
 
@@ -15,9 +14,9 @@ def long_run(fast, slow, length=None, offset=None, **kwargs):
     if fast is None or slow is None: return
 
     # Calculate Result
-    pb = increasing(fast, length) & decreasing(slow, length)  # potential bottom or bottom
-    bi = increasing(fast, length) & increasing(slow, length)  # fast and slow are increasing
-    long_run = pb | bi
+    fast_ = increasing(fast, length)
+    slow_ = (slow.diff(length).abs() > 0).astype(int)  # increasing or decreasing
+    long_run = fast_ & slow_  # potential bottom or bottom, or both increasing
 
     # Offset
     if offset != 0:
@@ -1,7 +1,79 @@
 # -*- coding: utf-8 -*-
+from numpy import full as npFull
+from numpy import int64 as npInt64
 from numpy import nan as npNaN
+from numpy import zeros as npZeros
 from pandas import DataFrame, Series
-from pandas_ta.utils import get_offset, verify_series, zero
+from pandas_ta import Imports
+from pandas_ta.utils import get_offset, njit, verify_series, zero
+
+
+@njit
+def _psar_step(high_, low_, high1, high2, low1, low2, falling, sar, ep, af, af0, max_af):
+    """One bar of the PSAR kernel from its state: falling, sar, ep and af.
+    high1, low1 and high2, low2 are the previous two bars. Returns the next
+    state and whether it reversed. max() and min() are spelled out to keep
+    Python's NaN handling."""
+    _sar = sar + af * (ep - sar)
+    if falling:
+        reverse = high_ > _sar
+        if low_ < ep:
+            ep = low_
+            af = af + af0
+            if max_af < af: af = max_af
+
+        # max(high1, high2, _sar)
+        extreme = high1
+        if high2 > extreme: extreme = high2
+        if _sar > extreme: extreme = _sar
+    else:
+        reverse = low_ < _sar
+        if high_ > ep:
+            ep = high_
+            af = af + af0
+            if max_af < af: af = max_af
+
+        # min(low1, low2, _sar)
+        extreme = low1
+        if low2 < extreme: extreme = low2
+        if _sar < extreme: extreme = _sar
+    _sar = extreme
+
+    if reverse:
+        _sar = ep
+        af = af0
+        falling = not falling # Must come before next line
+        ep = low_ if falling else high_
+
+    return falling, _sar, ep, af, reverse
+
+
+@njit
+def _psar_kernel(high, low, falling, sar, ep, af, af0, max_af):
+    """PSAR kernel, see psar(). Returns the long, short, af and reversal
+    arrays, a _psar_step() per bar."""
+    m = high.shape[0]
+    long, short = npFull(m, npNaN), npFull(m, npNaN)
+    _af, reversal = npFull(m, npNaN), npZeros(m, dtype=npInt64)
+    _af[:2] = af0
+
+    for row in range(1, m):
+        prev = max(row - 2, 0)
+        falling, sar, ep, af, reverse = _psar_step(
+            high[row], low[row], high[row - 1], high[prev], low[row - 1], low[prev],
+            falling, sar, ep, af, af0, max_af
+        )
+
+        # Seperate long/short sar based on falling
+        if falling:
+            short[row] = sar
+        else:
+            long[row] = sar
+
+        _af[row] = af
+        reversal[row] = int(reverse)
+
+    return long, short, _af, reversal
 
 
 def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **kwargs):
@@ -35,53 +107,16 @@ def psar(high, low, close=None, af0=None, af=None, max_af=None, offset=None, **k
         close = verify_series(close)
         sar = close.iloc[0]
 
-    long = Series(npNaN, index=high.index)
-    short = long.copy()
-    reversal = Series(0, index=high.index)
-    _af = long.copy()
-    _af.iloc[0:2] = af0
-
     # Calculate Result
-    m = high.shape[0]
-    for row in range(1, m):
-        high_ = high.iloc[row]
-        low_ = low.iloc[row]
-
-        if falling:
-            _sar = sar + af * (ep - sar)
-            reverse = high_ > _sar
-
-            if low_ < ep:
-                ep = low_
-                af = min(af + af0, max_af)
-
-            _sar = max(high.iloc[row - 1], high.iloc[row - 2], _sar)
-        else:
-            _sar = sar + af * (ep - sar)
-            reverse = low_ < _sar
-
-            if high_ > ep:
-                ep = high_
-                af = min(af + af0, max_af)
-
-            _sar = min(low.iloc[row - 1], low.iloc[row - 2], _sar)
-
-        if reverse:
-            _sar = ep
-            af = af0
-            falling = not falling # Must come before next line
-            ep = low_ if falling else high_
-
-        sar = _sar # Update SAR
-
-        # Seperate long/short sar based on falling
-        if falling:
-            short.iloc[row] = sar
-        else:
-            long.iloc[row] = sar
-
-        _af.iloc[row] = af
-        reversal.iloc[row] = int(reverse)
+    kernel = _psar_kernel if Imports["numba"] else _psar_kernel.py_func
+    long, short, _af, reversal = kernel(
+        high.to_numpy(dtype=float), low.to_numpy(dtype=float),
+        bool(falling), float(sar), float(ep), af, af0, max_af
+    )
+    long = Series(long, index=high.index)
+    short = Series(short, index=high.index)
+    _af = Series(_af, index=high.index)
+    reversal = Series(reversal, index=high.index)
 
     # Offset
     if offset != 0:
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 from .decreasing import decreasing
-from .increasing import increasing
 from pandas_ta.utils import get_offset, verify_series
 
 
@@ -15,9 +14,9 @@ def short_run(fast, slow, length=None, offset=None, **kwargs):
     if fast is None or slow is None: return
 
     # Calculate Result
-    pt = decreasing(fast, length) & increasing(slow, length)  # potential top or top
-    bd = decreasing(fast, length) & decreasing(slow, length)  # fast and slow are decreasing
-    short_run = pt | bd
+    fast_ = decreasing(fast, length)
+    slow_ = (slow.diff(length).abs() > 0).astype(int)  # increasing or decreasing
+    short_run = fast_ & slow_  # potential top or top, or both decreasing
 
     # Offset
     if offset != 0:
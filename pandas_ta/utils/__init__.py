@@ -1,7 +1,15 @@
 # -*- coding: utf-8 -*-
+from ._cache import *
 from ._candles import *
 from ._core import *
+from ._incremental import *
 from ._math import *
+from ._numba import *
+from ._plan import *
+from ._pool import *
+from ._rolling import *
+from ._schedule import *
+from ._shm import *
 from ._signals import *
 from ._time import *
 from ._metrics import *
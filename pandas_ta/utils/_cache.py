@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from contextlib import contextmanager
+from hashlib import blake2b
+from json import dumps as jsonDumps
+from json import loads as jsonLoads
+from os import replace as osReplace
+from os import utime as osUtime
+from pathlib import Path
+from threading import local, RLock
+from uuid import uuid4
+
+from numpy import ascontiguousarray as npAscontiguousarray
+from numpy import asarray as npAsarray
+from numpy import load as npLoad
+from numpy import ndarray as npNdarray
+from numpy import savez as npSavez
+from pandas import DataFrame, DatetimeIndex, Index, RangeIndex, Series
+from pandas.util import hash_pandas_object
+
+from pandas_ta import Imports
+
+# Default size limits of the tiers, in bytes
+CACHE_MEMORY = 256 * 2 ** 20
+CACHE_DISK = 2 ** 30
+
+# Input columns read by the running indicator methods, per thread
+_reads = local()
+
+
+def _update(h, x) -> bool:
+    """Feeds the content of x into the hash h. Returns False when x has no
+    stable content to hash, for example: a function."""
+    if x is None or isinstance(x, (bool, int, float, str)):
+        h.update(f"{type(x).__name__}:{x!r};".encode())
+    elif isinstance(x, (list, tuple)):
+        h.update(f"{type(x).__name__}:{len(x)}[".encode())
+        if not all(_update(h, _) for _ in x): return False
+        h.update(b"]")
+    elif isinstance(x, dict):
+        h.update(f"dict:{len(x)}{{".encode())
+        for k, v in sorted(x.items(), key=lambda kv: str(kv[0])):
+            if not _update(h, k) or not _update(h, v): return False
+        h.update(b"}")
+    elif isinstance(x, RangeIndex):
+        h.update(f"RangeIndex:{x.start},{x.stop},{x.step};".encode())
+    elif isinstance(x, DatetimeIndex):
+        h.update(f"DatetimeIndex:{x.dtype}:{len(x)};".encode())
+        h.update(npAscontiguousarray(x.asi8).view("u1"))
+    elif isinstance(x, Index):
+        h.update(f"Index:{x.dtype}:{len(x)};".encode())
+        _update_values(h, x)
+    elif isinstance(x, Series):
+        h.update(f"Series:{x.dtype}:{len(x)};".encode())
+        _update(h, x.index)
+        _update_values(h, x)
+    elif isinstance(x, DataFrame):
+        h.update(f"DataFrame:{x.shape};".encode())
+        _update(h, x.index)
+        for column, series in x.items():
+            _update(h, column)
+            _update_values(h, series)
+    elif isinstance(x, npNdarray) and x.dtype.kind in "biufcmM":
+        h.update(f"ndarray:{x.dtype.str}:{x.shape};".encode())
+        h.update(npAscontiguousarray(x).view("u1"))
+    else:
+        return False
+    return True
+
+
+def _update_values(h, x) -> None:
+    """Feeds the values of a Series or Index into the hash h."""
+    values = x.values
+    if isinstance(values, npNdarray) and values.dtype.kind in "biufcmM":
+        h.update(npAscontiguousarray(values).view("u1"))
+    else:
+        h.update(hash_pandas_object(x, index=False).values.view("u1"))
+
+
+def fingerprint(*objects) -> str:
+    """Fingerprint
+
+    Returns a short hex digest of the content of the objects: scalars,
+    containers, numpy arrays and pandas Series, DataFrames and Indexes. Equal
+    content gives an equal fingerprint, wherever it is stored. Returns None
+    when an object can not be fingerprinted.
+    """
+    h = blake2b(digest_size=16)
+    if not all(_update(h, x) for x in objects):
+        return None
+    return h.hexdigest()
+
+
+def _nbytes(result) -> int:
+    """Memory used by the values of a result."""
+    if isinstance(result, tuple):
+        return sum(_nbytes(x) for x in result)
+    if isinstance(result, Series):
+        return int(result.memory_usage(index=False, deep=True))
+    if isinstance(result, DataFrame):
+        return int(result.memory_usage(index=False, deep=True).sum())
+    return 0
+
+
+def _copy(result):
+    """Callers rename and fill results in place, so they get a copy."""
+    if isinstance(result, tuple):
+        return tuple(_copy(x) for x in result)
+    if not isinstance(result, (Series, DataFrame)):
+        return result
+    copied = result.copy()
+    for attr in ("name", "category"):
+        if attr in result.__dict__:
+            object.__setattr__(copied, attr, result.__dict__[attr])
+    return copied
+
+
+class ResultCache(object):
+    """Result Cache
+
+    An opt-in cache of the indicator results of the 'ta' DataFrame extension
+    and strategy(). Results are addressed by the content of their inputs:
+    a fingerprint of the input columns and index, the indicator name and its
+    normalized arguments. So the same data under another DataFrame, or after
+    a restart with a disk tier, is still a hit while any changed value is a
+    miss. The least recently used results are evicted when a tier is full.
+
+    In memory only:
+    >>> ta.cache.enable()  # Default: 256 MB
+    >>> df.ta.rsi()        # Computed
+    >>> df.ta.rsi()        # Cached
+    >>> ta.cache.stats
+    >>> ta.cache.disable()
+
+    With a disk tier, shared by processes and sessions. Parquet when pyarrow
+    is installed, otherwise numpy NPZ files:
+    >>> with ta.cache(path="~/.cache/pandas_ta", disk=2 ** 30):
+    ...     df.ta.strategy("All")
+
+    Skip the cache for one call with: df.ta.rsi(cache=False)
+    """
+
+    def __init__(self):
+        self._enabled = False
+        self._lock = RLock()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._max_memory = CACHE_MEMORY
+        self._path = None
+        self._disk_bytes = 0
+        self._max_disk = CACHE_DISK
+        self._format = "npy"
+        self._inputs = {}
+        self._requested = {}
+        self.reset_stats()
+
+    def __call__(self, **kwargs):
+        """Sets the enable() arguments for the next 'with' block."""
+        self._requested = kwargs
+        return self
+
+    def __enter__(self):
+        self.enable(**self._requested)
+        return self
+
+    def __exit__(self, *args):
+        self._requested = {}
+        self.disable()
+
+    def __repr__(self) -> str:
+        if not self._enabled:
+            return "ResultCache(disabled)"
+        disk = f", disk={self._path}" if self._path is not None else ""
+        return f"ResultCache({len(self._memory)} results{disk}, hits={self.hits}, misses={self.misses})"
+
+    @property
+    def enabled(self) -> bool:
+        """Returns True if the cache is enabled."""
+        return self._enabled
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of results served from the cache."""
+        return self._stats["memory_hits"] + self._stats["disk_hits"]
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of results that were computed."""
+        return self._stats["misses"]
+
+    @property
+    def stats(self) -> dict:
+        """Returns the counters and sizes of the cache."""
+        return {
+            "hits": self.hits, **self._stats,
+            "memory_results": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """Resets the hit, miss and eviction counters."""
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def enable(self, memory: int = CACHE_MEMORY, path: Path = None, disk: int = CACHE_DISK, format: str = None):
+        """Enables the cache.
+
+        Args:
+            memory (int): Size of the memory tier in bytes. Default: 256 MB
+            path (Path): Directory of the disk tier. Default: None, no disk tier
+            disk (int): Size of the disk tier in bytes. Default: 1 GB
+            format (str): "parquet" or "npy". Default: "parquet" when
+                pyarrow is installed, otherwise "npy"
+        """
+        with self._lock:
+            self._max_memory = int(memory) if isinstance(memory, int) and memory >= 0 else CACHE_MEMORY
+            self._max_disk = int(disk) if isinstance(disk, int) and disk >= 0 else CACHE_DISK
+            if format not in ("parquet", "npy"):
+                format = "parquet" if Imports["pyarrow"] else "npy"
+            if format == "parquet" and not Imports["pyarrow"]:
+                print(f"[X] Please install pyarrow for the parquet format (pip install pyarrow). Using npy.")
+                format = "npy"
+            self._format = format
+
+            self._path, self._disk_bytes = None, 0
+            if path is not None:
+                self._path = Path(path).expanduser()
+                self._path.mkdir(parents=True, exist_ok=True)
+                self._disk_bytes = sum(x.stat().st_size for x in self._path.glob("*.*") if x.is_file())
+
+            self._enabled = True
+            self._evict_memory()
+            self._evict_disk()
+        return self
+
+    def disable(self, clear: bool = True) -> None:
+        """Disables the cache. The disk tier is always kept."""
+        with self._lock:
+            self._enabled = False
+            if clear:
+                self.clear()
+
+    def clear(self, disk: bool = False) -> None:
+        """Removes the results in memory, and on disk when disk=True."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._inputs.clear()
+            if disk and self._path is not None:
+                for file in self._path.glob("*.*"):
+                    file.unlink(missing_ok=True)
+                self._disk_bytes = 0
+
+    # Inputs: the columns an indicator call reads, learned on its first run
+    @contextmanager
+    def recording(self):
+        """Records the input columns read, see record(), while active."""
+        stack = getattr(_reads, "stack", None)
+        if stack is None:
+            stack = _reads.stack = []
+        reads = []
+        stack.append(reads)
+        try:
+            yield reads
+        finally:
+            stack.pop()
+
+    @staticmethod
+    def record(name) -> None:
+        """Records an input column read by the running indicator methods."""
+        for reads in getattr(_reads, "stack", ()):
+            if name not in reads:
+                reads.append(name)
+
+    def inputs(self, call: str) -> tuple:
+        """Returns the input columns read by the call or None if unknown."""
+        if call in self._inputs:
+            return self._inputs[call]
+        if self._path is not None:
+            try:
+                inputs = tuple(jsonLoads((self._path / f"{call}.inputs").read_text()))
+                self._inputs[call] = inputs
+                return inputs
+            except (OSError, ValueError):
+                pass
+        return None
+
+    def set_inputs(self, call: str, inputs: tuple) -> None:
+        """Stores the input columns read by the call."""
+        inputs = tuple(inputs)
+        if self._inputs.get(call) == inputs: return
+        self._inputs[call] = inputs
+        if self._path is not None:
+            self._write(self._path / f"{call}.inputs", lambda f: f.write(jsonDumps(inputs).encode()))
+
+    # Results
+    def get(self, key: str, index: Index):
+        """Returns a copy of the cached result or None. 'index' is the index
+        of the DataFrame the result belongs to."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return _copy(self._memory[key][0])
+
+            result = self._load(key, index)
+            if result is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._store(key, result)
+            return _copy(result)
+
+    def put(self, key: str, result, index: Index) -> None:
+        """Caches a copy of the result in memory and on disk."""
+        if not isinstance(result, (Series, DataFrame, tuple)): return
+        if isinstance(result, tuple) and not all(isinstance(x, (Series, DataFrame)) for x in result):
+            return
+        result = _copy(result)
+        with self._lock:
+            self._store(key, result)
+            if self._path is not None and not isinstance(result, tuple):
+                self._save(key, result, index)
+
+    def _store(self, key: str, result) -> None:
+        nbytes = _nbytes(result)
+        if nbytes > self._max_memory: return
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        self._memory[key] = (result, nbytes)
+        self._memory_bytes += nbytes
+        self._evict_memory()
+
+    def _evict_memory(self) -> None:
+        while self._memory_bytes > self._max_memory and len(self._memory):
+            _, (_, nbytes) = self._memory.popitem(last=False)
+            self._memory_bytes -= nbytes
+            self._stats["evictions"] += 1
+
+    def _evict_disk(self) -> None:
+        if self._path is None or self._disk_bytes <= self._max_disk: return
+        files = {}
+        for file in self._path.glob("*.*"):
+            if file.suffix in (".npz", ".parquet", ".json") and file.is_file():
+                stat = file.stat()
+                mtime, size = files.get(file.stem, (0, 0))
+                files[file.stem] = (max(mtime, stat.st_mtime), size + stat.st_size)
+
+        self._disk_bytes = sum(size for _, size in files.values()) + sum(
+            x.stat().st_size for x in self._path.glob("*.inputs")
+        )
+        for key, (_, size) in sorted(files.items(), key=lambda x: x[1][0]):
+            if self._disk_bytes <= self._max_disk: break
+            for ext in (".npz", ".parquet", ".json"):
+                (self._path / f"{key}{ext}").unlink(missing_ok=True)
+            self._disk_bytes -= size
+            self._stats["evictions"] += 1
+
+    def _write(self, file: Path, write) -> int:
+        """Writes a file atomically, so other processes never read a partial
+        one. Returns its size."""
+        tmp = file.with_name(f".{file.name}.{uuid4().hex}")
+        try:
+            with open(tmp, "wb") as f:
+                write(f)
+            osReplace(tmp, file)
+            return file.stat().st_size
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return 0
+
+    def _save(self, key: str, result, index: Index) -> None:
+        frame = result.to_frame() if isinstance(result, Series) else result
+        if not all(x.kind in "biufmM" for x in frame.dtypes): return
+
+        # Rows are stored as positions of the DataFrame's index
+        positions = None
+        if not result.index.equals(index):
+            positions = index.get_indexer(result.index)
+            if (positions < 0).any(): return
+
+        meta = {
+            "type": type(result).__name__,
+            "name": result.__dict__.get("name") if isinstance(result, DataFrame) else result.name,
+            "category": result.__dict__.get("category"),
+            "columns": list(frame.columns),
+        }
+        try:
+            meta = jsonDumps(meta).encode()
+        except (TypeError, ValueError):
+            return
+
+        values = {f"c{i}": frame.iloc[:, i].values for i in range(frame.shape[1])}
+        if positions is not None:
+            values["positions"] = positions
+
+        if self._format == "parquet":
+            size = self._write(self._path / f"{key}.parquet", lambda f: DataFrame(values).to_parquet(f))
+        else:
+            size = self._write(self._path / f"{key}.npz", lambda f: npSavez(f, **values))
+        if size > 0:
+            size += self._write(self._path / f"{key}.json", lambda f: f.write(meta))
+        self._disk_bytes += size
+        self._evict_disk()
+
+    def _load(self, key: str, index: Index):
+        if self._path is None: return None
+        meta_file = self._path / f"{key}.json"
+        try:
+            meta = jsonLoads(meta_file.read_text())
+            if (self._path / f"{key}.parquet").is_file():
+                from pandas import read_parquet
+                frame = read_parquet(self._path / f"{key}.parquet")
+                values = {k: frame[k].values for k in frame.columns}
+            else:
+                with npLoad(self._path / f"{key}.npz", allow_pickle=False) as f:
+                    values = {k: f[k] for k in f.files}
+            osUtime(meta_file)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        positions = values.pop("positions", None)
+        index_ = index if positions is None else index[npAsarray(positions)]
+        columns = meta["columns"]
+        if len(values) != len(columns) or any(len(x) != len(index_) for x in values.values()):
+            return None
+
+        if meta["type"] == "Series":
+            result = Series(values["c0"], index=index_, name=meta["name"])
+        else:
+            result = DataFrame({f"c{i}": values[f"c{i}"] for i in range(len(columns))}, index=index_)
+            result.columns = columns
+            if meta["name"] is not None:
+                result.name = meta["name"]
+        if meta["category"] is not None:
+            result.category = meta["category"]
+        return result
+
+
+cache = ResultCache()
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+from hashlib import md5
+from sys import float_info as sflt
+
+from numpy import array as npArray
+from numpy import array_equal as npArrayEqual
+from numpy import column_stack as npColumnStack
+from numpy import concatenate as npConcatenate
+from numpy import float64 as npFloat64
+from numpy import isfinite as npIsfinite
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import nonzero as npNonzero
+from numpy import ones as npOnes
+from numpy import zeros as npZeros
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._math import linear_filter
+
+# The DataFrame.attrs key of the incremental strategy() state
+INCREMENTAL_KEY = "pandas_ta"
+
+# Rows of the previous run that are recomputed and compared with the stored
+# values before a tail is accepted.
+INCREMENTAL_CHECK = 3
+
+# Rows of history passed to the resume functions before the new rows
+INCREMENTAL_HISTORY = 2
+
+# Declared lookback of windowed indicators: rows of history needed before the
+# first new value. {kind: ({param: default, ...}, extra)} is the sum of the
+# (nested) window params plus 'extra' rows. A (default, weight) param is
+# counted 'weight' times. Recursive indicators are resumed from their state
+# instead, see TA_RESUME. The rest is fully recomputed.
+TA_LOOKBACK = {
+    "accbands": ({"length": 20}, 1),
+    "alma": ({"length": 10}, 2),
+    "ao": ({"fast": 5, "slow": 34}, 0),
+    "aroon": ({"length": 14}, 1),
+    "bbands": ({"length": 5}, 0),
+    "bias": ({"length": 26}, 0),
+    "bop": ({}, 0),
+    "brar": ({"length": 26}, 1),
+    "cci": ({"length": 14}, 0),
+    "cdl_z": ({"length": 30}, 0),
+    "cfo": ({"length": 9}, 0),
+    "cg": ({"length": 10}, 0),
+    "chop": ({"length": 14, "atr_length": 1}, 1),
+    "cmf": ({"length": 20}, 0),
+    "coppock": ({"length": 10, "slow": 14}, 0),
+    "cti": ({"length": 12}, 0),
+    "donchian": ({"lower_length": 20, "upper_length": 20}, 0),
+    "entropy": ({"length": (10, 2)}, 0),
+    "eom": ({"length": 14}, 1),
+    "er": ({"length": 10}, 1),
+    "fwma": ({"length": 10}, 0),
+    "hl2": ({}, 0),
+    "hlc3": ({}, 0),
+    "hma": ({"length": (10, 2)}, 0),
+    "increasing": ({"length": 1}, 1),
+    "decreasing": ({"length": 1}, 1),
+    "kst": ({"roc4": 30, "sma4": 15, "signal": 9}, 1),
+    "kurtosis": ({"length": 30}, 0),
+    "linreg": ({"length": 14}, 0),
+    "log_return": ({"length": 1}, 0),
+    "mad": ({"length": 30}, 0),
+    "median": ({"length": 30}, 0),
+    "mfi": ({"length": 14}, 1),
+    "midpoint": ({"length": 2}, 0),
+    "midprice": ({"length": 2}, 0),
+    "mom": ({"length": 10}, 0),
+    "ohlc4": ({}, 0),
+    "pdist": ({"drift": 1}, 0),
+    "percent_return": ({"length": 1}, 0),
+    "psl": ({"length": 12}, 1),
+    "pvol": ({}, 0),
+    "pvr": ({}, 1),
+    "pwma": ({"length": 10}, 0),
+    "qstick": ({"length": 10}, 0),
+    "quantile": ({"length": 30}, 0),
+    "roc": ({"length": 10}, 0),
+    "rvgi": ({"length": 14, "swma_length": 4}, 4),
+    "sinwma": ({"length": 14}, 0),
+    "skew": ({"length": 30}, 0),
+    "slope": ({"length": 1}, 0),
+    "sma": ({"length": 10}, 0),
+    "stdev": ({"length": 30}, 0),
+    "stoch": ({"k": 14, "d": 3, "smooth_k": 3}, 0),
+    "swma": ({"length": 10}, 0),
+    "trima": ({"length": 10}, 0),
+    "true_range": ({"drift": 1}, 0),
+    "ttm_trend": ({"length": 6}, 0),
+    "ui": ({"length": (14, 2)}, 0),
+    "uo": ({"slow": 28}, 1),
+    "variance": ({"length": 30}, 0),
+    "vhf": ({"length": 28}, 1),
+    "vortex": ({"length": 14}, 1),
+    "vwma": ({"length": 10}, 0),
+    "wcp": ({}, 0),
+    "willr": ({"length": 14}, 0),
+    "wma": ({"length": 10}, 0),
+    "zscore": ({"length": 30}, 0),
+}
+
+# Kwargs that make an indicator depend on all of its history
+_full_kwargs = ("cumulative", "fill_method", "fillna", "offset")
+
+
+def ta_lookback(kind: str, kwargs: dict = None) -> int:
+    """Returns the declared lookback of an indicator for its kwargs or None
+    when it has to be fully recomputed."""
+    kwargs = kwargs if isinstance(kwargs, dict) else {}
+    if kind not in TA_LOOKBACK or any(kwargs.get(k) for k in _full_kwargs):
+        return None
+
+    params, extra = TA_LOOKBACK[kind]
+    lookback = extra
+    for param, default in params.items():
+        default, weight = default if isinstance(default, tuple) else (default, 1)
+        value = kwargs.get(param)
+        value = int(value) if isinstance(value, (int, float)) and value > 0 else default
+        lookback += weight * value
+    return lookback
+
+
+def ta_incremental(kind: str, params: tuple = None, kwargs: dict = None) -> str:
+    """Returns how an indicator is updated for appended rows: "resume" from
+    its state, "tail" with its lookback or None when fully recomputed."""
+    kwargs = kwargs if isinstance(kwargs, dict) else {}
+    if params or any(kwargs.get(k) for k in _full_kwargs):
+        return None
+    if kind in TA_RESUME and kwargs.get("col_numbers") is None:
+        return "resume"
+    if kind in TA_LOOKBACK:
+        return "tail"
+    return None
+
+
+def strategy_key(tasks: list, *args) -> str:
+    """Returns a key that identifies a strategy's tasks and settings."""
+    ignored = ("append", "timed", "verbose")
+    tasks = [
+        (method, params, sorted((k, repr(v)) for k, v in kwargs.items() if k not in ignored))
+        for method, params, kwargs in tasks
+    ]
+    return md5(repr((tasks, args)).encode()).hexdigest()
+
+
+def incremental_state(df, key: str, columns: list) -> dict:
+    """Returns the incremental state of the last strategy() run with the same
+    'key' if the DataFrame only had rows appended since. Otherwise None."""
+    state = df.attrs.get(INCREMENTAL_KEY, {}).get("incremental")
+    if not isinstance(state, dict) or state.get("key") != key:
+        return None
+
+    rows = state["rows"]
+    if rows < 1 or rows > df.shape[0] or df.index[rows - 1] != state["last"]:
+        return None
+    if not npArrayEqual(_bar(df, rows - 1, columns), state["bar"], equal_nan=True):
+        return None
+    if any(c not in df.columns for task in state["tasks"] for c in task["columns"]):
+        return None
+    return state
+
+
+def save_incremental_state(df, key: str, columns: list, tasks: list) -> None:
+    """Stores the incremental state in df.attrs, see incremental_state()."""
+    rows = df.shape[0]
+    state = {
+        "key": key,
+        "rows": rows,
+        "last": df.index[rows - 1] if rows else None,
+        "bar": _bar(df, rows - 1, columns) if rows else None,
+        "tasks": tasks,
+    }
+    # Replaced, never mutated: copies of the DataFrame share the attrs' values
+    df.attrs[INCREMENTAL_KEY] = {**df.attrs.get(INCREMENTAL_KEY, {}), "incremental": state}
+
+
+def _bar(df, row: int, columns: list):
+    """Returns the input values of a row."""
+    columns = [c for c in columns if c in df.columns]
+    return npArray(df[columns].iloc[row].values, dtype=npFloat64)
+
+
+def _length(value, default):
+    return int(value) if value and value > 0 else default
+
+
+def _float(value, default):
+    return float(value) if value and value > 0 else default
+
+
+def _ewm_resume(x, value, alpha, weight=None):
+    """Continues an exponentially weighted mean. Without a 'weight', like
+    ewm(adjust=False) and TA Lib, otherwise like ewm(adjust=True)."""
+    x = npArray(x, dtype=npFloat64)
+    if not x.size:
+        return x, value, weight
+    if weight is None:
+        result = linear_filter(x, [alpha], [1, alpha - 1], y0=[value])
+        return result, result[-1], weight
+
+    # Weighted sum and sum of the weights, continued from the state
+    sums = linear_filter(npColumnStack([x, npOnes(x.size)]), [1], [1, alpha - 1], y0=[[value * weight, weight]])
+    result = sums[:, 0] / sums[:, 1]
+    return result, result[-1], sums[-1, 1]
+
+
+# Exponential Moving Average
+def _ema_state(inputs, outputs, length=None, **kwargs):
+    close, value = inputs["close"], outputs[0][-1]
+    if kwargs.get("adjust", False) or npIsnan(close).any() or not npIsfinite(value):
+        return None
+    return {"value": float(value)}
+
+
+def _ema_resume(state, inputs, length=None, **kwargs):
+    alpha = 2 / (_length(length, 10) + 1)
+    close = inputs["close"][INCREMENTAL_HISTORY:]
+    ema, value, _ = _ewm_resume(close, state["value"], alpha)
+    return [ema], {"value": float(value)}
+
+
+# wildeR's Moving Average
+def _rma_state(inputs, outputs, length=None, **kwargs):
+    close, value = inputs["close"], outputs[0][-1]
+    if npIsnan(close).any() or not npIsfinite(value):
+        return None
+    alpha = 1.0 / _length(length, 10)
+    weight = (1 - (1 - alpha) ** close.size) / alpha
+    return {"value": float(value), "weight": float(weight)}
+
+
+def _rma_resume(state, inputs, length=None, **kwargs):
+    alpha = 1.0 / _length(length, 10)
+    close = inputs["close"][INCREMENTAL_HISTORY:]
+    rma, value, weight = _ewm_resume(close, state["value"], alpha, state["weight"])
+    return [rma], {"value": float(value), "weight": float(weight)}
+
+
+# Fisher Transform
+def _fisher_position(hl2_, length, epsilon):
+    """The positions of the last hl2_.size - length + 1 bars, see fisher()."""
+    windows = sliding_window_view(hl2_, length)
+    highest, lowest = windows.max(axis=1), windows.min(axis=1)
+    hlr = highest - lowest
+    if epsilon:
+        hlr += sflt.epsilon
+    hlr[hlr < 0.001] = 0.001
+    return ((hl2_[length - 1:] - lowest) / hlr) - 0.5
+
+
+def _fisher_state(inputs, outputs, length=None, signal=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.momentum.fisher import _fisher_kernel
+
+    length = _length(length, 9)
+    signal = _length(signal, 1)
+    high, low = inputs["high"], inputs["low"]
+    if high.size <= max(length, signal) or npIsnan(high).any() or npIsnan(low).any():
+        return None
+
+    # high_low_range() adds epsilon to all the ranges when one is zero
+    hl2_ = 0.5 * (high + low)
+    windows = sliding_window_view(hl2_, length)
+    epsilon = bool((windows.max(axis=1) == windows.min(axis=1)).any())
+
+    position = _fisher_position(hl2_, length, epsilon)[1:]
+    kernel = _fisher_kernel if Imports["numba"] else _fisher_kernel.py_func
+    _, state = kernel(position, npZeros(2))
+    return {
+        "state": state.tolist(), "epsilon": epsilon,
+        "hl2": hl2_[high.size - length + 1:].tolist(),
+        "fisher": outputs[0][-signal:].tolist(),
+    }
+
+
+def _fisher_resume(state, inputs, length=None, signal=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.momentum.fisher import _fisher_kernel
+
+    length = _length(length, 9)
+    high, low = inputs["high"][INCREMENTAL_HISTORY:], inputs["low"][INCREMENTAL_HISTORY:]
+    hl2_ = npConcatenate([state["hl2"], 0.5 * (high + low)])
+
+    # A first zero range would add epsilon to every range of the full run
+    windows = sliding_window_view(hl2_, length)
+    if not state["epsilon"] and (windows.max(axis=1) == windows.min(axis=1)).any():
+        return [], None
+
+    position = _fisher_position(hl2_, length, state["epsilon"])
+    kernel = _fisher_kernel if Imports["numba"] else _fisher_kernel.py_func
+    fisher, _state = kernel(position, npArray(state["state"], dtype=npFloat64))
+
+    fishers = npConcatenate([state["fisher"], fisher])
+    signalma = fishers[:fisher.size]
+    state = {
+        "state": _state.tolist(), "epsilon": state["epsilon"],
+        "hl2": hl2_[hl2_.size - length + 1:].tolist(),
+        "fisher": fishers[fishers.size - len(state["fisher"]):].tolist(),
+    }
+    return [fisher, signalma], state
+
+
+# Parabolic Stop and Reverse
+def _psar_state(inputs, outputs, **kwargs):
+    high, low = inputs["high"], inputs["low"]
+    long, short, af, reversal = outputs
+    if high.size < INCREMENTAL_HISTORY + 1: return None
+
+    # The extreme point since the last reversal
+    falling = not npIsnan(short[-1])
+    reversals = npNonzero(reversal)[0]
+    start = reversals[-1] if reversals.size else 0
+    ep = low[start:].min() if falling else high[start:].max()
+    sar = short[-1] if falling else long[-1]
+    return {"falling": bool(falling), "sar": float(sar), "ep": float(ep), "af": float(af[-1])}
+
+
+def _psar_resume(state, inputs, af0=None, af=None, max_af=None, **kwargs):
+    from pandas_ta.trend.psar import _psar_step
+
+    step = _float(af, 0.02)
+    af0 = _float(af0, step)
+    max_af = _float(max_af, 0.2)
+    high, low = inputs["high"].tolist(), inputs["low"].tolist()
+    falling, sar, ep, af = state["falling"], state["sar"], state["ep"], state["af"]
+
+    m = len(high) - INCREMENTAL_HISTORY
+    long, short = npArray([npNaN] * m), npArray([npNaN] * m)
+    _af, reversal = npArray([npNaN] * m), npArray([0] * m)
+    for i in range(m):
+        row = i + INCREMENTAL_HISTORY
+        falling, sar, ep, af, reverse = _psar_step.py_func(
+            high[row], low[row], high[row - 1], high[row - 2], low[row - 1], low[row - 2],
+            falling, sar, ep, af, af0, max_af
+        )
+        if falling:
+            short[i] = sar
+        else:
+            long[i] = sar
+        _af[i] = af
+        reversal[i] = int(reverse)
+
+    state = {"falling": bool(falling), "sar": float(sar), "ep": float(ep), "af": float(af)}
+    return [long, short, _af, reversal], state
+
+
+# Relative Strength Xtra
+def _rsx_state(inputs, outputs, length=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.momentum.rsx import RSX_STATE, _rsx_kernel
+
+    length = _length(length, 14)
+    close = inputs["close"]
+    if kwargs.get("signal_indicators") or close.size <= length or npIsnan(close).any():
+        return None
+
+    kernel = _rsx_kernel if Imports["numba"] else _rsx_kernel.py_func
+    _, state = kernel(close[length:], length, npZeros(RSX_STATE))
+    return {"state": state.tolist()}
+
+
+def _rsx_resume(state, inputs, length=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.momentum.rsx import _rsx_kernel
+
+    length = _length(length, 14)
+    close = inputs["close"][INCREMENTAL_HISTORY:]
+
+    kernel = _rsx_kernel if Imports["numba"] else _rsx_kernel.py_func
+    rsx, state = kernel(close, length, npArray(state["state"], dtype=npFloat64))
+    return [rsx], {"state": state.tolist()}
+
+
+# Supertrend
+def _supertrend_state(inputs, outputs, length=None, multiplier=None, **kwargs):
+    from pandas import Series
+    from pandas_ta import Imports
+    from pandas_ta.volatility import atr
+
+    length = _length(length, 7)
+    multiplier = _float(multiplier, 3.0)
+    high, low, close = inputs["high"], inputs["low"], inputs["close"]
+    _, dir_, long, short = outputs
+    if close.size <= length or npIsnan(close).any(): return None
+
+    atr_ = atr(Series(high), Series(low), Series(close), length).values[-1]
+    if not npIsfinite(atr_): return None
+
+    # The final band of the current direction is the one stored
+    hl2_ = 0.5 * (high[-1] + low[-1])
+    upper, lower = hl2_ + multiplier * atr_, hl2_ - multiplier * atr_
+    if dir_[-1] > 0:
+        lower = long[-1]
+    else:
+        upper = short[-1]
+
+    # ATR is TA Lib's or the ewm(adjust=True) of the True Range
+    alpha = 1.0 / length
+    weight = None if Imports["talib"] else (1 - (1 - alpha) ** (close.size - 1)) / alpha
+    return {
+        "atr": float(atr_), "weight": weight, "upper": float(upper),
+        "lower": float(lower), "dir": int(dir_[-1]),
+    }
+
+
+def _supertrend_resume(state, inputs, length=None, multiplier=None, **kwargs):
+    from pandas_ta.overlap.supertrend import _supertrend_step
+
+    length = _length(length, 7)
+    multiplier = _float(multiplier, 3.0)
+    high, low, close = inputs["high"], inputs["low"], inputs["close"]
+    atr_, weight = state["atr"], state["weight"]
+    upper, lower, dir_ = state["upper"], state["lower"], state["dir"]
+
+    m = close.size - INCREMENTAL_HISTORY
+    trend, direction = npArray([npNaN] * m), npArray([1] * m)
+    long, short = npArray([npNaN] * m), npArray([npNaN] * m)
+    for i in range(m):
+        row = i + INCREMENTAL_HISTORY
+        prev_close = close[row - 1]
+        tr = max(high[row], prev_close) - min(low[row], prev_close)
+        if weight is None:
+            atr_ = (atr_ * (length - 1) + tr) / length
+        else:
+            decayed = (1 - 1.0 / length) * weight
+            weight = decayed + 1
+            atr_ = (decayed * atr_ + tr) / weight
+
+        hl2_ = 0.5 * (high[row] + low[row])
+        dir_, upper, lower = _supertrend_step.py_func(
+            close[row], hl2_ + multiplier * atr_, hl2_ - multiplier * atr_,
+            dir_, upper, lower
+        )
+
+        direction[i] = dir_
+        if dir_ > 0:
+            trend[i] = long[i] = lower
+        else:
+            trend[i] = short[i] = upper
+
+    state = {
+        "atr": float(atr_), "weight": weight, "upper": float(upper),
+        "lower": float(lower), "dir": int(dir_),
+    }
+    return [trend, direction, long, short], state
+
+
+# Even Better SineWave
+def _ebsw_state(inputs, outputs, length=None, bars=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.cycles.ebsw import EBSW_STATE, _ebsw_kernel
+
+    length = int(length) if length and length > 38 else 40
+    bars = _length(bars, 10)
+    close = inputs["close"]
+    if close.size <= length or npIsnan(close).any(): return None
+
+    kernel = _ebsw_kernel if Imports["numba"] else _ebsw_kernel.py_func
+    _, state = kernel(close[length:], length, bars, npZeros(EBSW_STATE))
+    return {"state": state.tolist()}
+
+
+def _ebsw_resume(state, inputs, length=None, bars=None, **kwargs):
+    from pandas_ta import Imports
+    from pandas_ta.cycles.ebsw import _ebsw_kernel
+
+    length = int(length) if length and length > 38 else 40
+    bars = _length(bars, 10)
+    close = inputs["close"][INCREMENTAL_HISTORY:]
+
+    kernel = _ebsw_kernel if Imports["numba"] else _ebsw_kernel.py_func
+    ebsw, state = kernel(close, length, bars, npArray(state["state"], dtype=npFloat64))
+    return [ebsw], {"state": state.tolist()}
+
+
+# Recursive indicators resumed from their state:
+# {kind: (inputs, state(inputs, outputs, **kwargs), resume(state, inputs, **kwargs))}
+TA_RESUME = {
+    "ebsw": (("close",), _ebsw_state, _ebsw_resume),
+    "ema": (("close",), _ema_state, _ema_resume),
+    "fisher": (("high", "low"), _fisher_state, _fisher_resume),
+    "psar": (("high", "low"), _psar_state, _psar_resume),
+    "rma": (("close",), _rma_state, _rma_resume),
+    "rsx": (("close",), _rsx_state, _rsx_resume),
+    "supertrend": (("high", "low", "close"), _supertrend_state, _supertrend_resume),
+}
@@ -8,22 +8,80 @@ from typing import List, Optional, Tuple
 from numpy import ones, triu
 from numpy import all as npAll
 from numpy import append as npAppend
+from numpy import arange as npArange
 from numpy import array as npArray
+from numpy import asarray as npAsarray
+from numpy import column_stack as npColumnStack
 from numpy import corrcoef as npCorrcoef
+from numpy import cumsum as npCumsum
 from numpy import dot as npDot
 from numpy import fabs as npFabs
+from numpy import empty_like as npEmptyLike
 from numpy import exp as npExp
+from numpy import float64 as npFloat64
+from numpy import int64 as npInt64
+from numpy import maximum as npMaximum
+from numpy import full as npFull
+from numpy import isnan as npIsnan
 from numpy import log as npLog
+from numpy import moveaxis as npMoveaxis
+from numpy import nanmean as npNanmean
 from numpy import nan as npNaN
 from numpy import ndarray as npNdArray
 from numpy import seterr
 from numpy import sqrt as npSqrt
 from numpy import sum as npSum
+from numpy import where as npWhere
+from numpy import zeros as npZeros
+from numpy.fft import irfft as npIrfft
+from numpy.fft import rfft as npRfft
 
 from pandas import DataFrame, Series
 
 from pandas_ta import Imports
 from ._core import verify_series
+from ._numba import njit
+
+# Windows longer than this are convolved through an FFT, see rolling_dot()
+ROLLING_DOT_FFT = 64
+
+
+@njit
+def _bars_since_kernel(x, length, highest):
+    """Bars since the most recent extremum of each window, see bars_since()"""
+    n = x.shape[0]
+    result = npFull(n, npNaN)
+    # Monotonic deque of positions, its front is the window's extremum
+    deque = npZeros(n, dtype=npInt64)
+    head, tail, last_nan = 0, 0, -length
+    for i in range(n):
+        if npIsnan(x[i]):
+            last_nan = i
+        else:
+            while tail > head and (x[deque[tail - 1]] <= x[i] if highest else x[deque[tail - 1]] >= x[i]):
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        while tail > head and deque[head] <= i - length:
+            head += 1
+        if i >= length - 1 and last_nan <= i - length:
+            result[i] = i - deque[head]
+    return result
+
+
+def bars_since(x: Series, length: int, highest: bool = True) -> Series:
+    """Bars Since Highest or Lowest
+
+    The number of bars since the most recent highest (or lowest) value of
+    every window of 'length' values. Same as
+    x.rolling(length).apply(recent_maximum_index, raw=True) but in O(n)
+    with a monotonic deque, compiled when numba is installed. Incomplete
+    windows and windows with a NaN are NaN.
+    """
+    x = verify_series(x)
+    values, length = x.to_numpy(dtype=npFloat64), int(length)
+    kernel = _bars_since_kernel if Imports["numba"] else _bars_since_kernel.py_func
+    return Series(kernel(values, length, bool(highest)), index=x.index, name=x.name)
 
 
 def combination(**kwargs: dict) -> int:
@@ -44,6 +102,21 @@ def combination(**kwargs: dict) -> int:
     return numerator // denominator
 
 
+def consecutive(x: Series) -> Series:
+    """Consecutive True
+
+    The length of the run of True values ending at each bar, 0 where x is
+    False or NaN. In O(n): the running count of True minus its value at the
+    last False, which is its running maximum where x is False. So a streak
+    of 'length' rises is consecutive(x.diff() > 0) >= length.
+    """
+    x = verify_series(x)
+    values = x.fillna(False).to_numpy(dtype=bool)
+    count = npCumsum(values)
+    result = count - npMaximum.accumulate(npWhere(values, 0, count))
+    return Series(result, index=x.index, name=x.name)
+
+
 def erf(x):
     """Error Function erf(x)
     The algorithm comes from Handbook of Mathematical Functions, formula 7.1.26.
@@ -67,6 +140,33 @@ def erf(x):
     return sign * y # erf(-x) = -erf(x)
 
 
+def ewm_mean(x: Series, alpha: float, adjust: bool = False, min_periods: int = 0) -> Series:
+    """Exponentially Weighted Mean
+
+    Same as x.ewm(alpha=alpha, adjust=adjust, min_periods=min_periods).mean()
+    but run through linear_filter() when scipy is installed. Leading NaNs are
+    supported, pandas' ewm is used when there are NaNs after the first value.
+    """
+    x = verify_series(x)
+    values = x.to_numpy(dtype=npFloat64)
+    valid = ~npIsnan(values)
+    first = valid.argmax()
+    if not Imports["scipy"] or not valid[first:].all() or not valid.any():
+        return x.ewm(alpha=alpha, adjust=adjust, min_periods=min_periods).mean()
+
+    result = npFull(values.size, npNaN)
+    tail = values[first:]
+    if adjust:
+        # Weighted sum of the values over the sum of the weights
+        sums = linear_filter(npColumnStack([tail, npFull(tail.size, 1.0)]), [1.0], [1.0, alpha - 1])
+        result[first:] = sums[:, 0] / sums[:, 1]
+    else:
+        result[first] = tail[0]
+        result[first + 1:] = linear_filter(tail[1:], [alpha], [1.0, alpha - 1], y0=[tail[0]])
+    result[first:first + max(min_periods - 1, 0)] = npNaN
+    return Series(result, index=x.index, name=x.name)
+
+
 def fibonacci(n: int = 2, **kwargs: dict) -> npNdArray:
     """Fibonacci Sequence as a numpy array"""
     n = int(npFabs(n)) if n >= 0 else 2
@@ -109,6 +209,71 @@ def geometric_mean(series: Series) -> float:
     return 0
 
 
+def linear_filter(x, b: list, a: list = None, y0: list = None, x0: list = None, axis: int = 0):
+    """Linear Filter
+
+    Runs the linear recursive (IIR) filter along 'axis' of x:
+        a[0] * y[n] = b[0] * x[n] + ... + b[M] * x[n - M]
+                    - a[1] * y[n - 1] - ... - a[N] * y[n - N]
+    The columns of a 2-D x are filtered independently, all at once. Uses
+    scipy.signal.lfilter if installed, otherwise a NumPy loop over the rows.
+
+    Args:
+        x (np.ndarray, pd.Series, pd.DataFrame): The values to filter.
+        b (list): Input coefficients.
+        a (list): Output coefficients, a[0] != 0. Default: [1]
+        y0 (list): Initial conditions, the outputs before x, most recent
+            first: y[-1], y[-2], ... Each one a scalar or one value per
+            column. Default: zeros
+        x0 (list): The inputs before x, most recent first. Default: zeros
+        axis (int): Default: 0
+
+    Returns:
+        np.ndarray, pd.Series or pd.DataFrame: Same shape and type as x.
+    """
+    values = npMoveaxis(npAsarray(x, dtype=npFloat64), axis, 0)
+    b = npAsarray(b, dtype=npFloat64)
+    a = npAsarray(a if a is not None else [1.0], dtype=npFloat64)
+    b, a = b / a[0], a / a[0]
+
+    # Coefficients of equal length: order + 1
+    order = max(a.size, b.size) - 1
+    b = npAppend(b, npZeros(order + 1 - b.size))
+    a = npAppend(a, npZeros(order + 1 - a.size))
+
+    # Initial state of the transposed direct form II, as scipy's lfiltic()
+    shape = values.shape[1:]
+    past_y, past_x = npZeros((order, *shape)), npZeros((order, *shape))
+    for past, initial in ((past_y, y0), (past_x, x0)):
+        if initial is not None and order > 0:
+            initial = npAsarray(initial, dtype=npFloat64)[:order]
+            past[:initial.shape[0]] = initial.reshape(initial.shape[0], *((1,) * len(shape))) if initial.ndim == 1 else initial
+    zi = npZeros((order, *shape))
+    for k in range(order):
+        for j in range(k + 1, order + 1):
+            zi[k] += b[j] * past_x[j - k - 1] - a[j] * past_y[j - k - 1]
+
+    if order == 0:
+        result = b[0] * values
+    elif Imports["scipy"]:
+        from scipy.signal import lfilter
+        result = lfilter(b, a, values, axis=0, zi=zi)[0]
+    else:
+        result = npEmptyLike(values)
+        for n in range(values.shape[0]):
+            result[n] = b[0] * values[n] + zi[0]
+            for k in range(order - 1):
+                zi[k] = b[k + 1] * values[n] + zi[k + 1] - a[k + 1] * result[n]
+            zi[order - 1] = b[order] * values[n] - a[order] * result[n]
+    result = npMoveaxis(result, 0, axis)
+
+    if isinstance(x, Series):
+        return Series(result, index=x.index, name=x.name)
+    if isinstance(x, DataFrame):
+        return DataFrame(result, index=x.index, columns=x.columns)
+    return result
+
+
 def linear_regression(x: Series, y: Series) -> dict:
     """Classic Linear Regression in Numpy or Scikit-Learn"""
     x, y = verify_series(x), verify_series(y)
@@ -163,6 +328,111 @@ def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
     return triangle
 
 
+def rolling_argmax(x: Series, length: int) -> Series:
+    """Position of the most recent maximum of every window of 'length'
+    values, 0 being the oldest value of the window. See bars_since()."""
+    return int(length) - 1 - bars_since(x, length, highest=True)
+
+
+def rolling_argmin(x: Series, length: int) -> Series:
+    """Position of the most recent minimum of every window of 'length'
+    values, 0 being the oldest value of the window. See bars_since()."""
+    return int(length) - 1 - bars_since(x, length, highest=False)
+
+
+def rolling_dot(x, w: list, axis: int = 0):
+    """Rolling Dot Product
+
+    The dot product of the weights 'w' with every window of len(w) values
+    along 'axis' of x, oldest value first. Same as
+    x.rolling(len(w)).apply(weights(w), raw=True) but as one convolution:
+    shifted slices for short windows and an FFT for windows longer than
+    ROLLING_DOT_FFT. The columns of a 2-D x are convolved all at once.
+    Incomplete windows and windows with a NaN are NaN.
+
+    Args:
+        x (np.ndarray, pd.Series, pd.DataFrame): The values.
+        w (list): The weights.
+        axis (int): Default: 0
+
+    Returns:
+        np.ndarray, pd.Series or pd.DataFrame: Same shape and type as x.
+    """
+    values = npMoveaxis(npAsarray(x, dtype=npFloat64), axis, 0)
+    w = npAsarray(w, dtype=npFloat64).ravel()
+    n, length = values.shape[0], w.size
+
+    result = npFull(values.shape, npNaN)
+    if 0 < length <= n:
+        nans = npIsnan(values)
+        clean = npWhere(nans, 0.0, values)
+        m = n - length + 1
+
+        if length > ROLLING_DOT_FFT:
+            size = 1 << (n + length - 2).bit_length()
+            kernel = w[::-1].reshape(length, *((1,) * (values.ndim - 1)))
+            full = npIrfft(npRfft(clean, size, axis=0) * npRfft(kernel, size, axis=0), size, axis=0)
+            dot = full[length - 1:n]
+        else:
+            dot = w[0] * clean[:m]
+            for k in range(1, length):
+                dot += w[k] * clean[k:k + m]
+
+        # Number of NaNs in each window
+        counts = npCumsum(nans, axis=0)
+        window_nans = counts[length - 1:].copy()
+        window_nans[1:] -= counts[:m - 1]
+        result[length - 1:] = npWhere(window_nans > 0, npNaN, dot)
+    result = npMoveaxis(result, 0, axis)
+
+    if isinstance(x, Series):
+        return Series(result, index=x.index, name=x.name)
+    if isinstance(x, DataFrame):
+        return DataFrame(result, index=x.index, columns=x.columns)
+    return result
+
+
+def rolling_ols(y: Series, length: int) -> dict:
+    """Rolling Linear Regression
+
+    Ordinary least squares of every window of 'length' values of y against
+    x = 1, 2, ..., length, in O(n) from the rolling sums of y, x * y and
+    y * y, where x * y is a rolling_dot. Windows with a NaN are NaN.
+
+    Args:
+        y (pd.Series): The values.
+        length (int): The window size, at least 2.
+
+    Returns:
+        dict: Series of each window's "slope", "intercept" (at x = 0) and
+            correlation "r".
+    """
+    y = verify_series(y)
+    length = int(length)
+    values = y.to_numpy(dtype=npFloat64)
+
+    # Shifted by the mean for precision, only the intercept depends on it
+    shift = npNanmean(values) if (~npIsnan(values)).any() else 0.0
+    values = Series(values - shift, index=y.index)
+
+    x_sum = 0.5 * length * (length + 1)
+    x2_sum = x_sum * (2 * length + 1) / 3
+    divisor = length * x2_sum - x_sum * x_sum
+
+    y_sum = values.rolling(length, min_periods=length).sum()
+    y2_sum = (values * values).rolling(length, min_periods=length).sum()
+    # x is local to each window, a global index loses precision on long series
+    xy_sum = rolling_dot(values, npArange(1, length + 1))
+
+    rn = length * xy_sum - x_sum * y_sum
+    slope = rn / divisor
+    intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor + shift
+    rd = (divisor * (length * y2_sum - y_sum * y_sum).clip(lower=0)) ** 0.5
+    r = rn / rd.where(rd > 0)
+
+    return {"slope": slope, "intercept": intercept, "r": r}
+
+
 def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
     """Symmetric Triangle with n >= 2
 
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from types import FunctionType
+
+from pandas_ta import Imports
+
+
+def _compile(fn):
+    """Returns numba's njit of 'fn'. The kernels it calls, like a kernel's
+    single step, are compiled with it."""
+    from numba import njit as nbNjit
+    kernels = {
+        name: fn.__globals__[name].compiled()
+        for name in fn.__code__.co_names
+        if hasattr(fn.__globals__.get(name), "compiled")
+    }
+    if len(kernels):
+        fn = FunctionType(fn.__code__, {**fn.__globals__, **kernels}, fn.__name__, fn.__defaults__, fn.__closure__)
+    return nbNjit(cache=True, nogil=True, error_model="numpy")(fn)
+
+
+def njit(fn):
+    """Numba Kernel Decorator
+
+    Marks a NumPy in, NumPy out kernel to be compiled with numba's njit. It
+    is compiled on its first call, so importing Pandas TA does not import
+    numba, and cached on disk. Indicators only call their kernels when
+    Imports["numba"] is True and run their Python code otherwise. Kernels
+    may call other kernels, which run their Python code without numba.
+    """
+    compiled = []
+
+    def _compiled():
+        if not len(compiled):
+            compiled.append(_compile(fn))
+        return compiled[0]
+
+    @wraps(fn)
+    def _kernel(*args):
+        if not Imports["numba"]:
+            return fn(*args)
+        return _compiled()(*args)
+
+    _kernel.compiled = _compiled
+    _kernel.py_func = fn
+    return _kernel
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+from functools import wraps
+from inspect import signature, unwrap
+from threading import local
+from uuid import uuid4
+
+from pandas import DataFrame, Series
+
+# Memoized intermediates by name: {"atr": atr, "ema": ema, ...}
+_memoized = {}
+
+
+class _Memo(local):
+    """The shared intermediates of the active strategy run, per thread."""
+    def __init__(self):
+        self.run, self.active, self.results, self.saved = None, False, {}, {}
+
+
+_memo = _Memo()
+
+# Accessor and strategy kwargs that do not change an indicator's values
+_ignored_kwargs = (
+    "append", "col_names", "col_numbers", "delimiter", "kind", "params",
+    "prefix", "suffix", "timed", "verbose",
+)
+
+
+def _token(x):
+    """Returns a hashable token for an argument or raises TypeError."""
+    if isinstance(x, Series):
+        values = x.values
+        interface = getattr(values, "__array_interface__", None)
+        if interface is None:
+            return ("S", id(x))
+        # Same memory, layout and index => same input. The input is kept
+        # alive by the run, so its address can not be reused meanwhile.
+        return ("S", interface["data"][0], values.shape, values.strides, values.dtype.str, id(x.index))
+    if isinstance(x, DataFrame):
+        return ("D", id(x))
+    if isinstance(x, (list, tuple)):
+        return tuple(_token(_) for _ in x)
+    if isinstance(x, dict):
+        return tuple((k, _token(v)) for k, v in sorted(x.items()))
+    hash(x)
+    return x
+
+
+def _copy_result(result):
+    """Callers rename and fill results in place, so they get a copy."""
+    if not isinstance(result, (Series, DataFrame)):
+        return result
+    copied = result.copy()
+    for attr in ("name", "category"):
+        if attr in result.__dict__:
+            object.__setattr__(copied, attr, result.__dict__[attr])
+    return copied
+
+
+def memoize(fn):
+    """Memoize Decorator
+
+    Marks an indicator as a shared intermediate. While a strategy run is
+    active, each distinct (function, inputs, params) call is computed once
+    and reused by every indicator that calls it, for example: 'atr' by
+    'supertrend', 'adx', 'natr' and 'chop'. Outside of a run it is a plain
+    function call.
+    """
+    sig = signature(fn)
+
+    @wraps(fn)
+    def _memoized_fn(*args, **kwargs):
+        if not _memo.active:
+            return fn(*args, **kwargs)
+
+        try:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            extra = {
+                k: v for k, v in arguments.pop("kwargs", {}).items()
+                if k not in _ignored_kwargs
+            }
+            key = (fn.__name__, _token(arguments), _token(extra))
+        except TypeError:
+            return fn(*args, **kwargs)
+
+        results = _memo.results
+        if key in results:
+            _memo.saved[fn.__name__] = _memo.saved.get(fn.__name__, 0) + 1
+            return _copy_result(results[key][0])
+
+        result = fn(*args, **kwargs)
+        # Keep the inputs alive with the result, see _token()
+        results[key] = (result, args, kwargs)
+        return _copy_result(result)
+
+    _memoized[fn.__name__] = _memoized_fn
+    return _memoized_fn
+
+
+def memo_start(run: str = None) -> str:
+    """Activates the shared intermediates for a strategy run. Starting a
+    different run discards the intermediates of the previous one."""
+    run = run if isinstance(run, str) else uuid4().hex
+    if _memo.run != run:
+        _memo.results.clear()
+        _memo.saved = {}
+        _memo.run = run
+    _memo.active = True
+    return run
+
+
+def memo_stop(clear: bool = True) -> dict:
+    """Deactivates the shared intermediates. Returns the number of
+    computations saved per intermediate."""
+    saved = _memo.saved
+    _memo.active = False
+    if clear:
+        _memo.results.clear()
+        _memo.saved = {}
+        _memo.run = None
+    return saved
+
+
+def memo_call(run: str, fn, *args, **kwargs) -> tuple:
+    """Calls fn within a strategy run's shared intermediates, which are kept
+    for the next call of the same run. Used by the multiprocessing workers.
+    Returns a tuple: (result, saved)."""
+    memo_start(run)
+    before = dict(_memo.saved)
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        _memo.active = False
+    saved = {
+        k: v - before.get(k, 0) for k, v in _memo.saved.items()
+        if v > before.get(k, 0)
+    }
+    return result, saved
+
+
+def ta_dependencies(kind: str) -> set:
+    """Returns the memoized intermediates an indicator may call, directly or
+    through other indicators, by walking the global names of its code."""
+    import pandas_ta
+
+    seen, stack, deps = set(), [kind], set()
+    while len(stack):
+        name = stack.pop()
+        if name in seen: continue
+        seen.add(name)
+
+        fn = getattr(pandas_ta, name, None)
+        code = getattr(unwrap(fn), "__code__", None) if callable(fn) else None
+        if code is None: continue
+
+        for global_name in code.co_names:
+            if global_name in _memoized and global_name != kind:
+                deps.add(global_name)
+            if global_name not in seen and hasattr(pandas_ta, global_name):
+                stack.append(global_name)
+    return deps
+
+
+def strategy_plan(ta: list, groups: bool = False) -> list:
+    """Strategy Plan
+
+    Builds the dependency graph between the Strategy's indicators and the
+    memoized intermediates they share and returns the order in which to
+    dispatch them: indicators that share intermediates are placed next to
+    each other so they land in the same worker chunk.
+
+    Args:
+        ta (list): Indicator names or Strategy 'ta' dicts.
+        groups (bool): Return the positions grouped by the intermediates
+            they share. Default: False
+
+    Returns:
+        list: Positions of 'ta' in dispatch order or lists of positions.
+    """
+    kinds = [x["kind"] if isinstance(x, dict) else x for x in ta]
+    deps = {kind: ta_dependencies(kind) for kind in set(kinds)}
+
+    # Nodes with more than one consumer are worth grouping around
+    consumers = {}
+    for kind in kinds:
+        for dep in deps[kind]:
+            consumers[dep] = consumers.get(dep, 0) + 1
+    shared = {k for k, v in consumers.items() if v > 1}
+
+    def _group(i):
+        group = sorted(deps[kinds[i]] & shared)
+        return (len(group) == 0, group)
+
+    order = sorted(range(len(kinds)), key=_group)
+    if not groups:
+        return order
+
+    result, last = [], None
+    for i in order:
+        key = _group(i)
+        if key[0] or key != last:
+            result.append([i])
+        else:
+            result[-1].append(i)
+        last = key
+    return result
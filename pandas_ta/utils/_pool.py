@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from atexit import register as atexitRegister
+from multiprocessing import cpu_count, Pool
+
+
+def _pool_initializer() -> None:
+    """Imports Pandas TA once per worker so every task can use it."""
+    import pandas_ta
+
+
+class WorkerPool(object):
+    """Persistent Worker Pool
+
+    A long-lived multiprocessing Pool that the strategy method reuses across
+    calls and across DataFrames instead of building and tearing down a new
+    Pool on every call. The workers import Pandas TA once when started.
+
+    Start and stop it explicitly:
+    >>> ta.pool.start()  # Default: cpu_count() workers
+    >>> df.ta.strategy("All")
+    >>> other_df.ta.strategy(ta.CommonStrategy)
+    >>> ta.pool.stop()
+
+    Or as a context manager:
+    >>> with ta.pool(cores=4):
+    ...     for df in dfs:
+    ...         df.ta.strategy("Momentum")
+
+    Setting df.ta.cores = 0 still runs that DataFrame's strategy without
+    multiprocessing.
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._cores = 0
+        self._requested = None
+
+    def __call__(self, cores: int = None):
+        """Sets the number of workers for the next 'with' block."""
+        self._requested = cores
+        return self
+
+    def __enter__(self):
+        self.start(self._requested)
+        return self
+
+    def __exit__(self, *args):
+        self._requested = None
+        self.stop()
+
+    def __repr__(self) -> str:
+        status = f"{self._cores} workers" if self.active else "stopped"
+        return f"WorkerPool({status})"
+
+    @property
+    def active(self) -> bool:
+        """Returns True if the workers are running."""
+        return self._pool is not None
+
+    @property
+    def cores(self) -> int:
+        """Returns the number of running workers."""
+        return self._cores
+
+    @property
+    def pool(self):
+        """Returns the running multiprocessing Pool or None."""
+        return self._pool
+
+    def start(self, cores: int = None):
+        """Starts the workers. Restarts them if 'cores' changed."""
+        cpus = cpu_count()
+        cores = int(cores) if isinstance(cores, int) and 0 < cores <= cpus else cpus
+
+        if self.active:
+            if cores == self._cores: return self
+            self.stop()
+
+        try:
+            # Workers must share this process' tracker for ta.shm_publish()
+            from multiprocessing.resource_tracker import ensure_running
+            ensure_running()
+        except ImportError:
+            pass
+
+        self._pool = Pool(cores, initializer=_pool_initializer)
+        self._cores = cores
+        return self
+
+    def stop(self) -> None:
+        """Stops the workers and waits for them to exit."""
+        if not self.active: return
+        self._pool.close()
+        self._pool.join()
+        self._pool, self._cores = None, 0
+
+
+# The Persistent Worker Pool: ta.pool
+pool = WorkerPool()
+atexitRegister(pool.stop)
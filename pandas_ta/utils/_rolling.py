@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from numpy import abs as npAbs
+from numpy import float64 as npFloat64
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import median as npMedian
+from numpy import nan as npNaN
+from numpy import quantile as npQuantile
+from numpy.lib.stride_tricks import sliding_window_view
+from pandas import Series
+
+from ._core import verify_series
+
+# Bytes of window copies and temporaries a rolling statistic holds at once.
+# Larger windows are processed in fewer rows per block.
+ROLLING_MEMORY = 64 * 1024 * 1024
+
+
+def _rolling_blocks(x: Series, length: int, min_periods: int, memory: int, statistic, skipna: bool = False) -> Series:
+    """Applies 'statistic', a function of a 2-D array of windows (one per
+    row) returning one value per row, to every window of x in blocks of at
+    most 'memory' bytes. Windows shorter than 'length' at the start are
+    computed when they have at least 'min_periods' values. Windows with a
+    NaN are NaN unless 'skipna', then they need 'min_periods' valid values.
+    """
+    x = verify_series(x)
+    length = int(length)
+    min_periods = int(min_periods) if min_periods is not None else length
+    min_periods = min(max(min_periods, 1), length)
+    memory = int(memory) if memory is not None and memory > 0 else ROLLING_MEMORY
+
+    values = x.to_numpy(dtype=npFloat64)
+    n = values.size
+    result = npFull(n, npNaN)
+
+    def _apply(windows):
+        if not skipna:
+            return statistic(windows) # NaN propagates
+        nans = npIsnan(windows)
+        if not nans.any():
+            return statistic(windows)
+        block = npFull(windows.shape[0], npNaN)
+        clean = ~nans.any(axis=1)
+        block[clean] = statistic(windows[clean])
+        for i in (~clean).nonzero()[0]:
+            valid = windows[i][~nans[i]]
+            if valid.size >= min_periods:
+                block[i] = statistic(valid[None, :])[0]
+        return block
+
+    # Incomplete windows at the start
+    for i in range(min_periods - 1, min(length - 1, n)):
+        result[i] = _apply(values[None, :i + 1])[0]
+
+    # Full windows, a block of rows at a time. Each row is copied at most a
+    # few times by the statistic.
+    if n >= length:
+        windows = sliding_window_view(values, length)
+        rows = max(memory // (4 * 8 * length), 1)
+        for start in range(0, windows.shape[0], rows):
+            block = windows[start:start + rows]
+            result[length - 1 + start:length - 1 + start + block.shape[0]] = _apply(block)
+
+    return Series(result, index=x.index, name=x.name)
+
+
+def rolling_mad(x: Series, length: int, min_periods: int = None, median: bool = False, memory: int = None) -> Series:
+    """Rolling Absolute Deviation
+
+    The mean absolute deviation from the mean of every window of 'length'
+    values, or with 'median' the median absolute deviation from the median.
+    Same as x.rolling(length, min_periods).apply(f, raw=True) without a
+    Python call per window: the windows are sliding_window_view() rows,
+    processed in blocks of at most 'memory' bytes. Windows with a NaN are
+    NaN.
+
+    Args:
+        x (pd.Series): The values.
+        length (int): The window size.
+        min_periods (int): Values needed by the first windows. Default: length
+        median (bool): Median absolute deviation instead. Default: False
+        memory (int): Block size ceiling in bytes. Default: ROLLING_MEMORY
+
+    Returns:
+        pd.Series: Same index as x.
+    """
+    def _mean_ad(windows):
+        deviations = npAbs(windows - windows.mean(axis=1)[:, None])
+        return deviations.mean(axis=1)
+
+    def _median_ad(windows):
+        deviations = npAbs(windows - npMedian(windows, axis=1)[:, None])
+        return npMedian(deviations, axis=1)
+
+    statistic = _median_ad if median else _mean_ad
+    return _rolling_blocks(x, length, min_periods, memory, statistic)
+
+
+def rolling_quantile(x: Series, length: int, q: float = 0.5, min_periods: int = None, memory: int = None) -> Series:
+    """Rolling Quantile
+
+    The linearly interpolated 'q' quantile of every window of 'length'
+    values, like x.rolling(length, min_periods).quantile(q): NaNs are
+    skipped and a window needs 'min_periods' valid values. The windows are
+    sliding_window_view() rows, processed in blocks of at most 'memory'
+    bytes. For a single quantile of a Series, pandas' own rolling quantile
+    is faster on long windows.
+
+    Args:
+        x (pd.Series): The values.
+        length (int): The window size.
+        q (float): The quantile, 0 <= q <= 1. Default: 0.5
+        min_periods (int): Valid values needed. Default: length
+        memory (int): Block size ceiling in bytes. Default: ROLLING_MEMORY
+
+    Returns:
+        pd.Series: Same index as x.
+    """
+    q = float(q)
+
+    def _quantile(windows):
+        return npQuantile(windows, q, axis=1)
+
+    return _rolling_blocks(x, length, min_periods, memory, _quantile, skipna=True)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+from json import dump as jsonDump
+from json import load as jsonLoad
+from pathlib import Path
+from time import perf_counter
+
+from numpy import median as npMedian
+from pandas_ta import Imports
+
+# Calibrated costs stored with the package, see calibrate_costs()
+COSTS_PATH = Path(__file__).parent / "costs.json"
+
+# Calibrated seconds per row above which an indicator is a pure Python loop,
+# or a rolling apply, that holds the GIL. Vectorized ones are below 1e-6.
+GIL_PER_ROW = 1e-6
+
+# Indicators whose loops are numba kernels, see njit(). They release the GIL
+# with numba and are pure Python loops without it, whatever their cost in
+# costs.json, which was calibrated with numba.
+NUMBA_KINDS = {
+    "aroon", "ebsw", "fisher", "hilo", "hwma", "jma", "kama", "mcgd", "psar",
+    "qqe", "rsx", "ssf", "supertrend", "vidya",
+}
+
+_costs = {}
+
+
+def ta_costs(path: Path = None, reload: bool = False) -> dict:
+    """Returns the calibrated indicator costs:
+    {kind: {"overhead": seconds, "per_row": seconds}}"""
+    global _costs
+    if len(_costs) and not reload and path is None:
+        return _costs
+
+    path = Path(path) if path is not None else COSTS_PATH
+    try:
+        with open(path) as f:
+            costs = jsonLoad(f)["costs"]
+    except (OSError, ValueError, KeyError):
+        costs = {}
+
+    if path == COSTS_PATH:
+        _costs = costs
+    return costs
+
+
+def ta_cost(kind: str, rows: int, costs: dict = None) -> float:
+    """Returns the expected seconds to run an indicator over 'rows' rows.
+    Indicators without a calibrated cost get the median cost."""
+    costs = costs if costs is not None else ta_costs()
+    if kind in costs:
+        cost = costs[kind]
+    elif len(costs):
+        cost = {
+            "overhead": npMedian([x["overhead"] for x in costs.values()]),
+            "per_row": npMedian([x["per_row"] for x in costs.values()]),
+        }
+    else:
+        cost = {"overhead": 1e-3, "per_row": 1e-7}
+    return cost["overhead"] + cost["per_row"] * rows
+
+
+def ta_holds_gil(kind: str, costs: dict = None) -> bool:
+    """Returns True if the calibrated cost of an indicator suggests a pure
+    Python loop, which holds the GIL and is better run in a process than in
+    a thread. Uncalibrated indicators are assumed to be vectorized. Those
+    with numba kernels, see NUMBA_KINDS, hold it only without numba."""
+    if kind in NUMBA_KINDS:
+        return not Imports["numba"]
+    costs = costs if costs is not None else ta_costs()
+    return kind in costs and costs[kind]["per_row"] >= GIL_PER_ROW
+
+
+def calibrate_costs(rows: tuple = (1000, 10000), repeats: int = 3, save: bool = True, path: Path = None, verbose: bool = False) -> dict:
+    """Calibrate Costs
+
+    Measures the cost of every indicator, once, on a synthetic OHLCV random
+    walk. Each indicator is timed at two sizes to fit the cost model:
+        seconds = overhead + per_row * rows
+    The costs are used by strategy() to schedule the indicators among the
+    workers. Recalibrate after upgrading or on very different hardware.
+
+    Args:
+        rows (tuple): The two DataFrame sizes. Default: (1000, 10000)
+        repeats (int): Best of 'repeats' timings. Default: 3
+        save (bool): Save the costs to 'path'. Default: True
+        path (Path): Default: The costs.json stored with the package.
+        verbose (bool): Print each indicator's cost. Default: False
+
+    Returns:
+        dict: {kind: {"overhead": seconds, "per_row": seconds}}
+    """
+    from contextlib import redirect_stdout
+    from io import StringIO
+    from warnings import catch_warnings, simplefilter
+    from numpy import cumsum as npCumsum
+    from numpy import exp as npExp
+    from numpy.random import default_rng
+    from pandas import DataFrame, date_range
+
+    small, large = int(min(rows)), int(max(rows))
+    rng = default_rng(42)
+    walk = 100 * npExp(npCumsum(rng.normal(0, 0.01, large)))
+    spread = walk * rng.uniform(0, 0.01, large)
+    data = DataFrame({
+        "open": walk + rng.normal(0, 0.5, large) * spread,
+        "high": walk + spread,
+        "low": walk - spread,
+        "close": walk + rng.normal(0, 0.5, large) * spread,
+        "volume": rng.integers(1e5, 1e7, large).astype(float),
+    }, index=date_range("2000-01-01", periods=large, freq="min"))
+
+    kinds = DataFrame().ta.indicators(as_list=True)
+    costs = {}
+    # Indicators that need more than OHLCV print their errors, mute them
+    with catch_warnings(), redirect_stdout(StringIO()):
+        simplefilter("ignore")
+        for kind in kinds:
+            timings = []
+            for n in (small, large):
+                df = data.iloc[-n:].copy()
+                best = None
+                for _ in range(max(int(repeats), 1)):
+                    stime = perf_counter()
+                    try:
+                        getattr(df.ta, kind)()
+                    except Exception:
+                        best = None
+                        break
+                    elapsed = perf_counter() - stime
+                    best = elapsed if best is None else min(best, elapsed)
+                timings.append(best)
+            if None in timings: continue
+
+            per_row = max((timings[1] - timings[0]) / (large - small), 0)
+            overhead = max(timings[1] - per_row * large, 0)
+            costs[kind] = {"overhead": overhead, "per_row": per_row}
+
+    if verbose:
+        for kind, cost in costs.items():
+            print(f"[i] {kind}: {1e3 * cost['overhead']:.4f} ms + {1e6 * cost['per_row']:.4f} us/row")
+
+    if save:
+        path = Path(path) if path is not None else COSTS_PATH
+        with open(path, "w") as f:
+            jsonDump({"rows": [small, large], "costs": costs}, f, indent=1, sort_keys=True)
+        ta_costs(path, reload=True)
+    return costs
+
+
+def strategy_schedule(groups: list, costs: dict, cores: int, chunksize: int = None) -> tuple:
+    """Strategy Schedule
+
+    Packs the Strategy's tasks into batches for the workers, longest expected
+    first. A batch holds either one expensive task or several cheap ones, up
+    to a target cost so that every core gets several batches to balance
+    with. Groups of tasks sharing intermediates (see strategy_plan()) are
+    kept in the same batch when they fit.
+
+    Args:
+        groups (list): Lists of task positions.
+        costs (dict): Expected seconds of each task, {position: seconds},
+            keyed by the task's position in the Strategy.
+        cores (int): Number of workers.
+        chunksize (int): Fixed number of tasks per batch instead. Default: None
+
+    Returns:
+        tuple: (batches, makespan). 'batches' are lists of task positions in
+            dispatch order and 'makespan' is the predicted seconds.
+    """
+    cores = max(int(cores), 1)
+    positions = [i for group in groups for i in group]
+
+    if isinstance(chunksize, int) and chunksize > 0:
+        batches = [positions[i:i + chunksize] for i in range(0, len(positions), chunksize)]
+        return batches, makespan([sum(costs[i] for i in b) for b in batches], cores)
+
+    total = sum(costs[i] for i in positions)
+    target = total / (4 * cores) if total > 0 else 0
+
+    # Split groups larger than the target, heaviest tasks first
+    items = []
+    for group in groups:
+        item, item_cost = [], 0
+        for i in sorted(group, key=lambda x: costs[x], reverse=True):
+            if len(item) and item_cost + costs[i] > target:
+                items.append((item_cost, item))
+                item, item_cost = [], 0
+            item.append(i)
+            item_cost += costs[i]
+        if len(item):
+            items.append((item_cost, item))
+
+    # Longest Processing Time first, cheap items are packed together
+    items.sort(key=lambda x: x[0], reverse=True)
+    batches, batch, batch_cost = [], [], 0
+    for item_cost, item in items:
+        batch += item
+        batch_cost += item_cost
+        if batch_cost >= target:
+            batches.append(batch)
+            batch, batch_cost = [], 0
+    if len(batch):
+        batches.append(batch)
+
+    return batches, makespan([sum(costs[i] for i in b) for b in batches], cores)
+
+
+def makespan(costs: list, cores: int) -> float:
+    """Predicted seconds to run the batches, in order, on the first free
+    worker of 'cores' workers."""
+    workers = [0.0] * max(int(cores), 1)
+    for cost in costs:
+        i = workers.index(min(workers))
+        workers[i] += cost
+    return max(workers)
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+from gc import collect as gcCollect
+
+from numpy import float64 as npFloat64
+from numpy import int64 as npInt64
+from numpy import ndarray as npNdArray
+from pandas import DataFrame, DatetimeIndex, Index
+
+# Attached shared blocks of the current process: {name: (SharedMemory, DataFrame)}
+_attached = {}
+
+
+def shm_publish(df: DataFrame, columns: list = None) -> tuple:
+    """Shared Memory Publish
+
+    Copies the numeric columns of a DataFrame, once, into a single shared
+    memory block so that worker processes can attach to them without
+    pickling the DataFrame. The columns are stored as one contiguous float64
+    block with the index values in front of it.
+
+    Args:
+        df (pd.DataFrame): DataFrame to publish.
+        columns (list): Columns to publish. Default: All numeric columns.
+
+    Returns:
+        tuple: (spec, shm). 'spec' is a small picklable dict used by
+            shm_attach() and 'shm' is the SharedMemory handle that the owner
+            must pass to shm_release() when done.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    if columns is None:
+        positions = [i for i, t in enumerate(df.dtypes) if t.kind in "biuf"]
+    else:
+        positions = [df.columns.get_loc(c) for c in columns]
+    columns = [df.columns[i] for i in positions]
+    m, k = df.shape[0], len(columns)
+
+    # Only 8 byte numeric or datetime indexes are shared, others are pickled
+    index, index_kind, index_tz = df.index, None, None
+    if isinstance(index, DatetimeIndex):
+        index_kind, index_tz = "M", index.tz
+    elif index.dtype.kind in "iuf":
+        index_kind = "f" if index.dtype.kind == "f" else "i"
+
+    shm = SharedMemory(create=True, size=max(8 * m * (k + 1), 1))
+    buffer = npNdArray((k + 1, m), dtype=npFloat64, buffer=shm.buf)
+
+    if index_kind is not None:
+        index_values = index.asi8 if index_kind == "M" else index.values
+        buffer[0].view(npInt64 if index_kind in "Mi" else npFloat64)[:] = index_values
+    for i, j in enumerate(positions):
+        buffer[i + 1] = df.iloc[:, j].to_numpy(dtype=npFloat64, na_value=float("nan"))
+
+    spec = {
+        "name": shm.name,
+        "shape": (k, m),
+        "columns": list(columns),
+        "index_kind": index_kind,
+        "index_tz": index_tz,
+        "index_name": index.name,
+        "index": index if index_kind is None else None,
+    }
+    return spec, shm
+
+
+def shm_attach(spec: dict) -> DataFrame:
+    """Shared Memory Attach
+
+    Attaches to a block created by shm_publish() and returns a read-only,
+    zero-copy DataFrame view of it. Attachments are cached per process, so
+    a worker only attaches once per published block.
+    """
+    name = spec["name"]
+    if name in _attached:
+        return _attached[name][1]
+
+    from multiprocessing.shared_memory import SharedMemory
+    # A new block means the previous strategy run is over
+    shm_detach()
+
+    # Pool workers share the publisher's resource tracker, so the block is
+    # tracked once and unlinked by the publisher in shm_release()
+    shm = SharedMemory(name=name)
+    k, m = spec["shape"]
+    buffer = npNdArray((k + 1, m), dtype=npFloat64, buffer=shm.buf)
+    buffer.flags.writeable = False
+
+    index_kind = spec["index_kind"]
+    if index_kind == "M":
+        index = DatetimeIndex(buffer[0].view(npInt64), name=spec["index_name"])
+        if spec["index_tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(spec["index_tz"])
+    elif index_kind == "i":
+        index = Index(buffer[0].view(npInt64), name=spec["index_name"])
+    elif index_kind == "f":
+        index = Index(buffer[0], name=spec["index_name"])
+    else:
+        index = spec["index"]
+
+    df = DataFrame(buffer[1:].T, index=index, columns=spec["columns"], copy=False)
+    _attached[name] = (shm, df)
+    return df
+
+
+def shm_detach() -> None:
+    """Closes all the shared memory blocks attached by this process."""
+    for name in list(_attached.keys()):
+        shm, df = _attached.pop(name)
+        del df
+        try:
+            shm.close()
+        except BufferError:
+            # The DataFrame and its 'ta' accessor reference each other
+            gcCollect()
+            try:
+                shm.close()
+            except BufferError:
+                pass
+
+
+def shm_release(shm) -> None:
+    """Closes and unlinks a block created by shm_publish()."""
+    if shm is None: return
+    shm_detach()
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
@@ -3,9 +3,10 @@ from pandas import DataFrame
 from pandas_ta import Imports
 from pandas_ta.overlap import ma
 from pandas_ta.statistics import stdev
-from pandas_ta.utils import get_offset, non_zero_range, tal_ma, verify_series
+from pandas_ta.utils import get_offset, memoize, non_zero_range, tal_ma, verify_series
 
 
+@memoize
 def bbands(close, length=None, std=None, ddof=0, mamode=None, talib=None, offset=None, **kwargs):
     """Indicator: Bollinger Bands (BBANDS)"""
     # Validate arguments
@@ -13,6 +13,7 @@ setup(
         "pandas_ta.overlap",
         "pandas_ta.performance",
         "pandas_ta.statistics",
+        "pandas_ta.stream",
         "pandas_ta.trend",
         "pandas_ta.utils",
         "pandas_ta.utils.data",
@@ -49,6 +50,7 @@ setup(
     ],
     package_data={
         "data": ["data/*.csv"],
+        "pandas_ta.utils": ["costs.json"],
     },
     install_requires=["pandas"],
     # List additional groups of dependencies here (e.g. development dependencies).
@@ -56,7 +58,7 @@ setup(
     # $ pip install -e .[dev,test]
     extras_require={
         "dev": [
-            "alphaVantage-api", "matplotlib", "mplfinance", "scipy",
+            "alphaVantage-api", "matplotlib", "mplfinance", "numba", "scipy",
             "sklearn", "statsmodels", "stochastic",
             "talib", "tqdm", "vectorbt", "yfinance",
         ],
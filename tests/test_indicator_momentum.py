@@ -484,12 +484,12 @@ class TestMomentum(TestCase):
             except Exception as ex:
                 error_analysis(result.iloc[:, 0], CORRELATION, ex, newline=False)
 
-    @skip
     def test_td_seq(self):
-        """TS Sequential: Working but SLOW implementation"""
         result = pandas_ta.td_seq(self.close)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "TD_SEQ")
+        pdt.assert_index_equal(result.index, self.close.index)
+        self.assertLessEqual(result.max().max(), 13)
 
     def test_trix(self):
         result = pandas_ta.trix(self.close)
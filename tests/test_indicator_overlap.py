@@ -1,7 +1,8 @@
 from .config import CORRELATION, CORRELATION_THRESHOLD, error_analysis, sample_data, VERBOSE
 from .context import pandas_ta
 
-from unittest import TestCase
+from unittest import skipUnless, TestCase
+from unittest.mock import patch
 import pandas.testing as pdt
 from pandas import DataFrame, Series
 
@@ -250,6 +251,24 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "MCGD_10")
 
+    @skipUnless(pandas_ta.Imports["numba"], "numba is not installed")
+    def test_numba_kernels(self):
+        close = self.close.copy()
+        close.iloc[100:103] = None
+        kernels = [
+            ("hwma", {"na": 0.5, "nb": 0.3, "nc": 0.05}), ("jma", {"phase": 50}),
+            ("kama", {"fast": 3}), ("mcgd", {"c": 0.6}), ("ssf", {}),
+            ("ssf", {"poles": 3}), ("vidya", {}),
+        ]
+        # Without scipy, ssf runs its kernel instead of linear_filter
+        with patch.dict(pandas_ta.Imports, {"scipy": False}):
+            for kind, kwargs in kernels:
+                for series in [self.close, close]:
+                    result = getattr(pandas_ta, kind)(series, **kwargs)
+                    with patch.dict(pandas_ta.Imports, {"numba": False}):
+                        expected = getattr(pandas_ta, kind)(series, **kwargs)
+                    pdt.assert_series_equal(result, expected, check_exact=False, rtol=1e-10)
+
     def test_midpoint(self):
         result = pandas_ta.midpoint(self.close, talib=False)
         self.assertIsInstance(result, Series)
@@ -413,6 +432,23 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "VWAP_D")
 
+        bands = pandas_ta.vwap(self.high, self.low, self.close, self.volume, anchor="M", bands=[1, 2])
+        self.assertIsInstance(bands, DataFrame)
+        self.assertEqual(bands.name, "VWAP_M")
+        self.assertEqual(list(bands.columns), ["VWAP_M", "VWAPL_M_1", "VWAPU_M_1", "VWAPL_M_2", "VWAPU_M_2"])
+        pdt.assert_series_equal(bands["VWAP_M"], pandas_ta.vwap(self.high, self.low, self.close, self.volume, anchor="M"))
+        self.assertTrue((bands["VWAPL_M_2"] <= bands["VWAPL_M_1"]).all())
+        self.assertTrue((bands["VWAPU_M_1"] <= bands["VWAPU_M_2"]).all())
+
+        result = pandas_ta.vwap(self.high, self.low, self.close, self.volume, offset=1)
+        self.assertEqual(result.name, "VWAP_D")
+        self.assertEqual(result.category, "overlap")
+
+        shifted = pandas_ta.vwap(self.high, self.low, self.close, self.volume, anchor="M", bands=[1, 2], offset=1)
+        self.assertEqual(shifted.name, "VWAP_M")
+        self.assertEqual(shifted.category, "overlap")
+        pdt.assert_frame_equal(shifted, bands.shift(1))
+
     def test_vwma(self):
         result = pandas_ta.vwma(self.close, self.volume)
         self.assertIsInstance(result, Series)
@@ -0,0 +1,234 @@
+from .config import sample_data
+from .context import pandas_ta
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import pandas.testing as pdt
+from pandas import DataFrame, Series, date_range
+
+
+# Reference bar by bar loops the state machine kernels replaced, kept as
+# they were to check that the kernels return identical outputs.
+def psar_loop(high, low, close=None, af0=None, af=None, max_af=None):
+    af = float(af) if af and af > 0 else 0.02
+    af0 = float(af0) if af0 and af0 > 0 else af
+    max_af = float(max_af) if max_af and max_af > 0 else 0.2
+
+    up = high.iloc[:2] - high.iloc[:2].shift(1)
+    dn = low.iloc[:2].shift(1) - low.iloc[:2]
+    falling = (((dn > up) & (dn > 0)) * dn).apply(pandas_ta.utils.zero).iloc[-1] > 0
+    sar, ep = (high.iloc[0], low.iloc[0]) if falling else (low.iloc[0], high.iloc[0])
+    if close is not None:
+        sar = close.iloc[0]
+
+    long = Series(np.nan, index=high.index)
+    short = long.copy()
+    reversal = Series(0, index=high.index)
+    _af = long.copy()
+    _af.iloc[0:2] = af0
+
+    for row in range(1, high.shape[0]):
+        high_, low_ = high.iloc[row], low.iloc[row]
+        if falling:
+            _sar = sar + af * (ep - sar)
+            reverse = high_ > _sar
+            if low_ < ep:
+                ep = low_
+                af = min(af + af0, max_af)
+            _sar = max(high.iloc[row - 1], high.iloc[max(row - 2, 0)], _sar)
+        else:
+            _sar = sar + af * (ep - sar)
+            reverse = low_ < _sar
+            if high_ > ep:
+                ep = high_
+                af = min(af + af0, max_af)
+            _sar = min(low.iloc[row - 1], low.iloc[max(row - 2, 0)], _sar)
+
+        if reverse:
+            _sar = ep
+            af = af0
+            falling = not falling
+            ep = low_ if falling else high_
+
+        sar = _sar
+        if falling:
+            short.iloc[row] = sar
+        else:
+            long.iloc[row] = sar
+        _af.iloc[row] = af
+        reversal.iloc[row] = int(reverse)
+
+    return [long, short, _af, reversal]
+
+
+def supertrend_loop(high, low, close, length=7, multiplier=3.0):
+    m = close.size
+    dir_, trend = [1] * m, [0] * m
+    long, short = [np.nan] * m, [np.nan] * m
+
+    hl2_ = pandas_ta.hl2(high, low)
+    matr = multiplier * pandas_ta.atr(high, low, close, length)
+    upperband = hl2_ + matr
+    lowerband = hl2_ - matr
+
+    for i in range(1, m):
+        if close.iloc[i] > upperband.iloc[i - 1]:
+            dir_[i] = 1
+        elif close.iloc[i] < lowerband.iloc[i - 1]:
+            dir_[i] = -1
+        else:
+            dir_[i] = dir_[i - 1]
+            if dir_[i] > 0 and lowerband.iloc[i] < lowerband.iloc[i - 1]:
+                lowerband.iloc[i] = lowerband.iloc[i - 1]
+            if dir_[i] < 0 and upperband.iloc[i] > upperband.iloc[i - 1]:
+                upperband.iloc[i] = upperband.iloc[i - 1]
+
+        if dir_[i] > 0:
+            trend[i] = long[i] = lowerband.iloc[i]
+        else:
+            trend[i] = short[i] = upperband.iloc[i]
+
+    return [Series(x, index=close.index) for x in (trend, dir_, long, short)]
+
+
+def hilo_loop(high, low, close, high_length=13, low_length=21, mamode="sma"):
+    hilo = Series(np.nan, index=close.index)
+    long = Series(np.nan, index=close.index)
+    short = Series(np.nan, index=close.index)
+
+    high_ma = pandas_ta.ma(mamode, high, length=high_length)
+    low_ma = pandas_ta.ma(mamode, low, length=low_length)
+
+    for i in range(1, close.size):
+        if close.iloc[i] > high_ma.iloc[i - 1]:
+            hilo.iloc[i] = long.iloc[i] = low_ma.iloc[i]
+        elif close.iloc[i] < low_ma.iloc[i - 1]:
+            hilo.iloc[i] = short.iloc[i] = high_ma.iloc[i]
+        else:
+            hilo.iloc[i] = hilo.iloc[i - 1]
+            long.iloc[i] = short.iloc[i] = hilo.iloc[i - 1]
+
+    return [hilo, long, short]
+
+
+def qqe_loop(close, length=14, smooth=5, factor=4.236):
+    wilders_length = 2 * length - 1
+    rsi_ma = pandas_ta.ma("ema", pandas_ta.rsi(close, length), length=smooth)
+    rsi_ma_tr = rsi_ma.diff(1).abs()
+    smoothed_rsi_tr_ma = pandas_ta.ma("ema", rsi_ma_tr, length=wilders_length)
+    dar = factor * pandas_ta.ma("ema", smoothed_rsi_tr_ma, length=wilders_length)
+    upperband = rsi_ma + dar
+    lowerband = rsi_ma - dar
+
+    long = Series(0, index=close.index)
+    short = Series(0, index=close.index)
+    trend = Series(1, index=close.index)
+    qqe = Series(rsi_ma.iloc[0], index=close.index)
+    qqe_long = Series(np.nan, index=close.index)
+    qqe_short = Series(np.nan, index=close.index)
+
+    for i in range(1, close.size):
+        c_rsi, p_rsi = rsi_ma.iloc[i], rsi_ma.iloc[i - 1]
+        c_long, p_long = long.iloc[i - 1], long.iloc[i - 2]
+        c_short, p_short = short.iloc[i - 1], short.iloc[i - 2]
+
+        if p_rsi > c_long and c_rsi > c_long:
+            long.iloc[i] = np.maximum(c_long, lowerband.iloc[i])
+        else:
+            long.iloc[i] = lowerband.iloc[i]
+
+        if p_rsi < c_short and c_rsi < c_short:
+            short.iloc[i] = np.minimum(c_short, upperband.iloc[i])
+        else:
+            short.iloc[i] = upperband.iloc[i]
+
+        if (c_rsi > c_short and p_rsi < p_short) or (c_rsi <= c_short and p_rsi >= p_short):
+            trend.iloc[i] = 1
+            qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+        elif (c_rsi > c_long and p_rsi < p_long) or (c_rsi <= c_long and p_rsi >= p_long):
+            trend.iloc[i] = -1
+            qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
+        else:
+            trend.iloc[i] = trend.iloc[i - 1]
+            if trend.iloc[i] == 1:
+                qqe.iloc[i] = qqe_long.iloc[i] = long.iloc[i]
+            else:
+                qqe.iloc[i] = qqe_short.iloc[i] = short.iloc[i]
+
+    return [qqe, rsi_ma, qqe_long, qqe_short]
+
+
+def random_walk(n, seed):
+    """OHLC random walk rounded to ticks, so that it has ties"""
+    rng = np.random.default_rng(seed)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, n)), 1)
+    spread = np.round(rng.uniform(0, 2, n), 1)
+    return DataFrame({
+        "open": close + np.round(rng.normal(0, 0.5, n), 1),
+        "high": close + spread, "low": close - spread, "close": close,
+    }, index=date_range("2000-01-01", periods=n, freq="min"))
+
+
+class TestRegression(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.datasets = [sample_data, random_walk(2000, 0), random_walk(30, 1)]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.datasets
+
+    def assertLoopEqual(self, result, expected):
+        self.assertEqual(result.shape[1], len(expected))
+        for i, column in enumerate(expected):
+            pdt.assert_series_equal(result.iloc[:, i], column, check_names=False)
+
+    def assertRegression(self, indicator, loop, *args, **kwargs):
+        for df in self.datasets:
+            expected = loop(*[df[x] for x in args], **kwargs)
+            for numba in (True, False):
+                with patch.dict(pandas_ta.Imports, {"numba": numba and pandas_ta.Imports["numba"]}):
+                    result = indicator(*[df[x] for x in args], **kwargs)
+                self.assertLoopEqual(result, expected)
+
+    def assertKernelResumes(self, kernel, x, size, *args):
+        """Runs the kernel over x in one piece and in chunks, each starting
+        from the state the previous one returned. Both must be identical."""
+        for fn in (kernel, kernel.py_func):
+            if fn is kernel and not pandas_ta.Imports["numba"]: continue
+            expected, expected_state = fn(x, *args, np.zeros(size))
+            result, state = [], np.zeros(size)
+            for chunk in np.array_split(x, 7):
+                values, state = fn(chunk, *args, state)
+                result.append(values)
+            np.testing.assert_array_equal(np.concatenate(result), expected)
+            np.testing.assert_array_equal(state, expected_state)
+
+    def test_kernel_state(self):
+        from pandas_ta.cycles.ebsw import EBSW_STATE, _ebsw_kernel
+        from pandas_ta.momentum.fisher import _fisher_kernel
+        from pandas_ta.momentum.rsx import RSX_STATE, _rsx_kernel
+
+        for df in self.datasets:
+            close = df["close"].to_numpy(dtype=float)
+            self.assertKernelResumes(_rsx_kernel, close, RSX_STATE, 14)
+            self.assertKernelResumes(_ebsw_kernel, close, EBSW_STATE, 40, 10)
+            self.assertKernelResumes(_fisher_kernel, np.sin(close), 2)
+
+    def test_hilo(self):
+        self.assertRegression(pandas_ta.hilo, hilo_loop, "high", "low", "close")
+        self.assertRegression(pandas_ta.hilo, hilo_loop, "high", "low", "close", high_length=5, low_length=8, mamode="ema")
+
+    def test_psar(self):
+        self.assertRegression(pandas_ta.psar, psar_loop, "high", "low")
+        self.assertRegression(pandas_ta.psar, psar_loop, "high", "low", "close", af0=0.01, af=0.03, max_af=0.3)
+
+    def test_qqe(self):
+        self.assertRegression(pandas_ta.qqe, qqe_loop, "close")
+        self.assertRegression(pandas_ta.qqe, qqe_loop, "close", length=7, smooth=3, factor=3)
+
+    def test_supertrend(self):
+        self.assertRegression(pandas_ta.supertrend, supertrend_loop, "high", "low", "close")
+        self.assertRegression(pandas_ta.supertrend, supertrend_loop, "high", "low", "close", length=10, multiplier=2.0)
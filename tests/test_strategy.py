@@ -1,5 +1,8 @@
 # Must run seperately from the rest of the tests
 # in order to successfully run
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
 from multiprocessing import cpu_count
 from time import perf_counter
 
@@ -7,7 +10,9 @@ from .config import sample_data
 from .context import pandas_ta
 
 from unittest import skip, skipUnless, TestCase
-from pandas import DataFrame
+from unittest.mock import patch
+import numpy.testing as npt
+from pandas import concat, DataFrame
 
 # Strategy Testing Parameters
 cores = cpu_count()
@@ -99,6 +104,29 @@ class TestStrategyMethods(TestCase):
         self.data.ta.strategy(self.category, fast=5, slow=10, verbose=verbose, timed=strategy_timed)
         self.category = "All Multiruns with diff Args" # Rename for Speed Table
 
+    def test_all_persistent_pool(self):
+        self.category = "All"
+        with pandas_ta.pool(cores):
+            self.data.ta.strategy(verbose=verbose, timed=strategy_timed)
+            self.data.ta.strategy(shm=True, verbose=verbose, timed=strategy_timed)
+        self.assertFalse(pandas_ta.pool.active)
+        self.category = "All Persistent Pool" # Rename for Speed Table
+
+    def test_all_chunksize(self):
+        self.category = "All"
+        self.data.ta.strategy(chunksize=8, verbose=verbose, timed=strategy_timed)
+        self.category = "All Chunksize 8" # Rename for Speed Table
+
+    def test_all_thread(self):
+        self.category = "All"
+        self.data.ta.strategy(backend="thread", verbose=verbose, timed=strategy_timed)
+        self.category = "All Threads" # Rename for Speed Table
+
+    def test_all_shm(self):
+        self.category = "All"
+        self.data.ta.strategy(shm=True, verbose=verbose, timed=strategy_timed)
+        self.category = "All Shared Memory" # Rename for Speed Table
+
     # @skip
     def test_candles_category(self):
         self.category = "Candles"
@@ -138,6 +166,100 @@ class TestStrategyMethods(TestCase):
         self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
         self.assertEqual(len(self.data.columns), 15)
 
+    def test_custom_cache(self):
+        self.category = "Custom Cache"
+
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        expected = ohlcv.copy()
+        expected.ta.strategy(pandas_ta.CommonStrategy, backend="serial")
+        with pandas_ta.cache():
+            pandas_ta.cache.reset_stats()
+            for backend in ["serial", "process", "thread"]:
+                df = ohlcv.copy()
+                df.ta.strategy(pandas_ta.CommonStrategy, backend=backend, verbose=verbose, timed=strategy_timed)
+                self.assertTrue(df.equals(expected))
+            self.assertEqual(pandas_ta.cache.misses, 5)
+            self.assertEqual(pandas_ta.cache.hits, 10)
+            self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+
+    def test_custom_features(self):
+        self.category = "Custom Features"
+
+        features = self.data.ta.strategy(pandas_ta.CommonStrategy, append=False, verbose=verbose, timed=strategy_timed)
+        self.assertIsInstance(features, DataFrame)
+        self.assertEqual(len(self.data.columns), self.init_cols)
+        self.assertEqual(list(features.columns), ["SMA_10", "SMA_20", "SMA_50", "SMA_200", "VOL_SMA_20"])
+
+        self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+        self.assertTrue(features.equals(self.data[features.columns]))
+
+        # Without DataFrame._update_inplace(), the columns are inserted
+        df = self.data.iloc[:, :self.init_cols].copy()
+        with patch.object(DataFrame, "_update_inplace", None):
+            df.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+        self.assertTrue(features.equals(df[features.columns]))
+
+    def test_custom_incremental(self):
+        self.category = "Custom Incremental"
+
+        custom = pandas_ta.Strategy("Incremental", [
+            {"kind": "sma", "length": 50},
+            {"kind": "ema", "length": 20},
+            {"kind": "rma", "length": 7},
+            {"kind": "bbands", "length": 20},
+            {"kind": "macd"},
+            {"kind": "psar"},
+            {"kind": "supertrend", "length": 10},
+            {"kind": "rsx"},
+            {"kind": "fisher", "signal": 3},
+            {"kind": "ebsw"},
+        ])
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        df = ohlcv.iloc[:-5].copy()
+        df.ta.strategy(custom, incremental=True, verbose=verbose, timed=strategy_timed)
+        for i in range(-5, 0):
+            df.loc[ohlcv.index[i], ohlcv.columns] = ohlcv.iloc[i]
+            df.ta.strategy(custom, incremental=True, verbose=verbose, timed=strategy_timed)
+
+        expected = ohlcv.copy()
+        expected.ta.cores = 0
+        expected.ta.strategy(custom)
+        self.assertEqual(list(df.columns), list(expected.columns))
+        for column in expected.columns:
+            npt.assert_allclose(df[column].astype(float), expected[column].astype(float), rtol=1e-9)
+
+        # pd.concat() with new bars drops df.attrs and the saved state
+        new_bars = ohlcv.iloc[-1:].copy()
+        new_bars.attrs = {}
+        appended = concat([df.iloc[:-1], new_bars])
+        with redirect_stdout(StringIO()) as stdout:
+            appended.ta.strategy(custom, incremental=True, verbose=True, timed=strategy_timed)
+        self.assertIn("No incremental state", stdout.getvalue())
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
+    def test_run_strategy(self):
+        self.category = "Run Strategy"
+
+        frames = {"A": self.data, "B": self.data.iloc[:500].copy(), "X": None}
+        with ThreadPoolExecutor(2) as executor:
+            results = pandas_ta.run_strategy(frames, pandas_ta.CommonStrategy, executor=executor, verbose=verbose)
+            results = {result.symbol: result for result in results}
+
+        self.assertEqual(sorted(results.keys()), ["A", "B", "X"])
+        self.assertTrue(results["A"].ok)
+        self.assertIs(results["A"].df, self.data)
+        self.assertEqual(self.data.ta.cores, cores)
+        self.assertIn("SMA_200", results["B"].df.columns)
+        self.assertFalse(results["X"].ok)
+        self.assertIsNone(results["X"].df)
+        self.assertIn("AttributeError", results["X"].error)
+
+        frames = {"B": self.data.iloc[:500].copy(), "C": self.data.iloc[500:].copy()}
+        columns = list(frames["B"].columns)
+        results = list(pandas_ta.run_strategy(frames, "momentum", cores=cores, append=False))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(list(frames["B"].columns), columns)
+
     # @skip
     def test_custom_args_tuple(self):
         self.category = "Custom B"
@@ -179,6 +301,44 @@ class TestStrategyMethods(TestCase):
         )
         self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
 
+    def test_custom_chained_levels(self):
+        self.category = "Custom Chained Levels"
+
+        custom = pandas_ta.Strategy("Chained Levels", [
+            {"kind": "ohlc4"},
+            {"kind": "bbands", "length": 20, "col_names": ("BBL", "BBM", "BBU", "BBB", "BBP")},
+            {"kind": "ema", "close": "OHLC4", "length": 10, "suffix": "OHLC4"},
+            {"kind": "macd", "close": "BBM", "col_names": ("MACD", "MACD_H", "MACD_S")},
+            {"kind": "rsi", "close": "MACD", "length": 5},
+            {"kind": "atr"},
+        ])
+        ohlcv = self.data[["open", "high", "low", "close", "volume"]]
+        expected = ohlcv.copy()
+        expected.ta.strategy(custom, backend="serial")
+        for backend in ["process", "thread"]:
+            df = ohlcv.copy()
+            df.ta.strategy(custom, backend=backend, verbose=verbose, timed=strategy_timed)
+            self.assertEqual(list(df.columns), list(expected.columns))
+            self.assertTrue(df.equals(expected))
+        self.assertGreater(expected["RSI_5"].notna().sum(), 0)
+
+        # Like a serial run, ema can not read the MACD of a later macd
+        later = pandas_ta.Strategy("Chained Later", [
+            {"kind": "sma", "length": 10},
+            {"kind": "ema", "close": "MACD", "length": 5},
+            {"kind": "macd", "col_names": ("MACD", "MACD_H", "MACD_S")},
+            {"kind": "rsi", "close": "MACD", "length": 5},
+        ])
+        expected = ohlcv.copy()
+        with redirect_stdout(StringIO()):
+            expected.ta.strategy(later, backend="serial")
+            for backend in ["process", "thread"]:
+                df = ohlcv.copy()
+                df.ta.strategy(later, backend=backend, timed=strategy_timed)
+                self.assertNotIn("EMA_5", df.columns)
+                self.assertTrue(df.equals(expected))
+        self.data.ta.strategy(custom, verbose=verbose, timed=strategy_timed)
+
     # @skip
     def test_custom_a(self):
         self.category = "Custom E"
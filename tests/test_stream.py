@@ -0,0 +1,263 @@
+from .config import sample_data
+from .context import pandas_ta
+from .test_regression import random_walk
+
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import numpy.testing as npt
+from pandas import DataFrame, Series, date_range
+
+from pandas_ta import stream
+
+
+class TestStream(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.close = sample_data["close"]
+        # Leading NaNs, like the lagged input of zlma()
+        cls.lead = cls.close.copy()
+        cls.lead.iloc[:7] = np.nan
+
+        cls.high = sample_data["high"]
+        cls.low = sample_data["low"]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.close
+        del cls.lead
+        del cls.high
+        del cls.low
+
+    def assertStreams(self, kind, cls, exact=False, **kwargs):
+        """Streams the closes one at a time and compares every value with
+        the batch indicator, with and without TA Lib."""
+        for talib in (True, False):
+            with patch.dict(pandas_ta.Imports, {"talib": talib and pandas_ta.Imports["talib"]}):
+                for close in (self.close, self.lead):
+                    expected = getattr(pandas_ta, kind)(close, **kwargs)
+                    indicator = cls(**kwargs)
+                    result = Series([indicator.update(x) for x in close], index=close.index)
+
+                    self.assertEqual(indicator.name, expected.name)
+                    self.assertEqual(indicator.bars, close.size)
+                    if exact and not pandas_ta.Imports["talib"]:
+                        npt.assert_array_equal(result, expected)
+                    else:
+                        npt.assert_allclose(result, expected, rtol=1e-10)
+
+                    indicator.reset()
+                    self.assertEqual(indicator.bars, 0)
+                    npt.assert_array_equal([indicator.update(x) for x in close], result)
+
+                    # Seeded with the batch values, then bar by bar
+                    indicator.reset()
+                    seeded = list(indicator.update_many(close[:-100]))
+                    seeded += [indicator.update(x) for x in close[-100:]]
+                    npt.assert_allclose(seeded, expected, rtol=1e-10)
+
+    def assertStreamsMany(self, kind, cls, inputs="close", **kwargs):
+        """Replays the bars with update_many() and compares every column
+        with the batch indicator, with and without TA Lib."""
+        for talib in (True, False):
+            with patch.dict(pandas_ta.Imports, {"talib": talib and pandas_ta.Imports["talib"]}):
+                for close in (self.close, self.lead):
+                    bars = [{"high": self.high, "low": self.low, "close": close}[x] for x in inputs.split()]
+                    expected = getattr(pandas_ta, kind)(*bars, **kwargs)
+                    indicator = cls(**kwargs)
+                    result = indicator.update_many(*bars)
+
+                    self.assertEqual(indicator.bars, close.size)
+                    if isinstance(expected, Series):
+                        self.assertEqual(indicator.columns, [expected.name])
+                    else:
+                        self.assertEqual(indicator.columns, list(expected.columns))
+                        self.assertEqual(result.shape, (close.size, expected.shape[1]))
+                    expected = expected.reindex(close.index)  # stoch() drops its warm up
+                    if not pandas_ta.Imports["talib"]:
+                        npt.assert_array_equal(result, expected)
+                    else:
+                        npt.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+                    # The batch values, bar by bar or seeded then bar by bar
+                    indicator.reset()
+                    replayed = [indicator.update(*bar) for bar in zip(*bars)]
+                    npt.assert_allclose(replayed, result, rtol=1e-10, atol=1e-10)
+
+                    indicator.reset()
+                    seeded = list(indicator.update_many(*[x[:-100] for x in bars]))
+                    seeded += [indicator.update(*bar) for bar in zip(*[x[-100:] for x in bars])]
+                    npt.assert_allclose(seeded, expected, rtol=1e-10, atol=1e-10)
+
+    def test_atr(self):
+        self.assertStreamsMany("atr", stream.ATR, inputs="high low close")
+        self.assertStreamsMany("atr", stream.ATR, inputs="high low close", length=10, mamode="sma", percent=True, talib=False)
+
+    def test_cksp(self):
+        self.assertStreamsMany("cksp", stream.CKSP, inputs="high low close")
+        self.assertStreamsMany("cksp", stream.CKSP, inputs="high low close", p=5, x=2, q=7, tvmode=False)
+
+    def test_psar(self):
+        self.assertStreamsMany("psar", stream.PSAR, inputs="high low")
+        self.assertStreamsMany("psar", stream.PSAR, inputs="high low close", af0=0.01, af=0.03, max_af=0.3)
+
+    def test_supertrend(self):
+        self.assertStreamsMany("supertrend", stream.SUPERTREND, inputs="high low close")
+        self.assertStreamsMany("supertrend", stream.SUPERTREND, inputs="high low close", length=10, multiplier=2)
+
+        indicator, reversals = stream.SUPERTREND(), []
+        for bar in zip(self.high, self.low, self.close):
+            indicator.update(*bar)
+            reversals.append(indicator.reversal)
+        direction = pandas_ta.supertrend(self.high, self.low, self.close).iloc[:, 1]
+        npt.assert_array_equal(reversals, direction.diff().fillna(0) != 0)
+
+    def test_state(self):
+        """A stream restored from its JSON state continues like the stream."""
+        bars = {"high": self.high, "low": self.low, "close": self.close, "volume": sample_data["volume"]}
+        streams = [
+            (stream.MACD, {"asmode": True}, "close"), (stream.T3, {}, "close"),
+            (stream.TSI, {}, "close"), (stream.ZLMA, {"mamode": "wma"}, "close"),
+            (stream.CCI, {"talib": False}, "high low close"), (stream.CKSP, {}, "high low close"),
+            (stream.PSAR, {}, "high low close"), (stream.SUPERTREND, {}, "high low close"),
+            (stream.VWAP, {"anchor": "W", "bands": [1]}, "high low close volume"),
+        ]
+        for cls, kwargs, inputs in streams:
+            inputs = [bars[x] for x in inputs.split()]
+            expected = cls(**kwargs).update_many(*inputs)
+
+            indicator = cls(**kwargs)
+            result = [indicator.update_many(*[x[:1000] for x in inputs])]
+            state = json.loads(json.dumps(indicator.state))
+            restored = cls(**kwargs)
+            restored.restore(state)
+            result.append(restored.update_many(*[x[1000:] for x in inputs]))
+            npt.assert_allclose(np.concatenate(result), expected, rtol=1e-10, atol=1e-10)
+
+        self.assertRaises(ValueError, stream.EMA(5).restore, stream.EMA(10).state)
+
+    def test_cci(self):
+        self.assertStreamsMany("cci", stream.CCI, inputs="high low close")
+        self.assertStreamsMany("cci", stream.CCI, inputs="high low close", length=20, c=0.02, talib=False)
+
+    def test_macd(self):
+        self.assertStreamsMany("macd", stream.MACD)
+        self.assertStreamsMany("macd", stream.MACD, fast=26, slow=12, signal=5, asmode=True)
+        self.assertStreamsMany("macd", stream.MACD, talib=False)
+
+    def test_rsi(self):
+        self.assertStreamsMany("rsi", stream.RSI)
+        self.assertStreamsMany("rsi", stream.RSI, length=5, scalar=50, drift=2, talib=False)
+
+    def test_stoch(self):
+        self.assertStreamsMany("stoch", stream.STOCH, inputs="high low close")
+        self.assertStreamsMany("stoch", stream.STOCH, inputs="high low close", k=5, d=4, smooth_k=2, mamode="ema")
+
+    def test_tsi(self):
+        self.assertStreamsMany("tsi", stream.TSI)
+        self.assertStreamsMany("tsi", stream.TSI, fast=5, slow=9, signal=4, mamode="sma", drift=2)
+
+    def test_willr(self):
+        self.assertStreamsMany("willr", stream.WILLR, inputs="high low close")
+        self.assertStreamsMany("willr", stream.WILLR, inputs="high low close", length=9, min_periods=3, talib=False)
+
+    def test_dema(self):
+        self.assertStreams("dema", stream.DEMA)
+        self.assertStreams("dema", stream.DEMA, length=5, talib=False)
+
+    def test_ema(self):
+        self.assertStreams("ema", stream.EMA, exact=True)
+        self.assertStreams("ema", stream.EMA, exact=True, length=1)
+        self.assertStreams("ema", stream.EMA, exact=True, length=5, sma=False)
+        self.assertStreams("ema", stream.EMA, exact=True, length=20, adjust=True, talib=False)
+
+    def test_rma(self):
+        self.assertStreams("rma", stream.RMA, exact=True)
+        self.assertStreams("rma", stream.RMA, exact=True, length=14)
+
+    def test_sma(self):
+        self.assertStreams("sma", stream.SMA, exact=True)
+        self.assertStreams("sma", stream.SMA, exact=True, length=20, min_periods=5, talib=False)
+
+    def test_strategy(self):
+        strategy = pandas_ta.Strategy("Stream", ta=[
+            {"kind": "sma", "length": 10},
+            {"kind": "ema", "close": "volume", "length": 20, "prefix": "VOL"},
+            {"kind": "rsi"},
+            {"kind": "ema", "close": "RSI_14", "length": 5, "suffix": "RSI"},
+            {"kind": "macd", "fast": 8, "slow": 21, "col_numbers": (0, 2)},
+            {"kind": "supertrend", "col_names": ("ST", "STd", "STl", "STs")},
+            {"kind": "psar"},
+            {"kind": "vwap", "anchor": "W", "bands": [1]},
+            {"kind": "wma", "params": (20,)},
+            {"kind": "atr", "offset": 2},
+            {"kind": "stoch", "offset": 1},
+            {"kind": "cksp"}, {"kind": "tsi"}, {"kind": "zlma"},
+        ])
+        # psar's first close seeds the SAR only when it is given
+        walk = random_walk(2000, 0)
+        walk["volume"] = np.round(np.random.default_rng(0).uniform(100, 1000, walk.shape[0]))
+        for data in (sample_data, walk):
+            df = data.copy()
+            df.ta.cores = 0
+            df.ta.strategy(strategy)
+            expected = df.iloc[:, data.shape[1]:]
+
+            indicator = stream.StreamingStrategy(strategy)
+            self.assertEqual(indicator.columns, list(expected.columns))
+            history = 2 * data.shape[0] // 3
+            result = indicator.update_many(data.iloc[:history])
+            rows = [indicator.update(bar) for _, bar in data.iloc[history:].iterrows()]
+            self.assertEqual(indicator.bars, data.shape[0])
+            self.assertEqual(list(rows[-1]), indicator.columns)
+
+            result = np.concatenate([result.to_numpy(), DataFrame(rows).to_numpy()])
+            npt.assert_allclose(result, expected.astype(float), rtol=1e-10, atol=1e-10)
+
+        self.assertRaises(ValueError, stream.StreamingStrategy, pandas_ta.AllStrategy)
+        self.assertRaises(ValueError, stream.StreamingStrategy, pandas_ta.Strategy("No", ta=[{"kind": "bbands"}]))
+        self.assertRaises(ValueError, stream.StreamingStrategy, pandas_ta.Strategy("No", ta=[{"kind": "sma", "offset": -1}]))
+
+    def test_t3(self):
+        self.assertStreams("t3", stream.T3)
+        self.assertStreams("t3", stream.T3, length=5, a=0.5, talib=False)
+
+    def test_tema(self):
+        self.assertStreams("tema", stream.TEMA)
+        self.assertStreams("tema", stream.TEMA, length=7, talib=False)
+
+    def test_vwap(self):
+        volume = sample_data["volume"]
+        for anchor, bands in [("D", None), ("W", [1, 2.5]), ("M", 2)]:
+            expected = pandas_ta.vwap(self.high, self.low, self.close, volume, anchor=anchor, bands=bands)
+            indicator = stream.VWAP(anchor, bands)
+            result = indicator.update_many(self.high, self.low, self.close, volume)
+
+            columns = list(expected.columns) if bands else [expected.name]
+            self.assertEqual(indicator.columns, columns)
+            npt.assert_array_equal(result, expected)
+
+            indicator.reset()
+            replayed = [indicator.update(*bar) for bar in zip(self.high, self.low, self.close, volume, volume.index)]
+            npt.assert_array_equal(replayed, result)
+
+        # Intraday sessions of a timezone aware index
+        index = date_range("2024-03-08 09:30", periods=3000, freq="3min", tz="America/New_York")
+        bars = DataFrame({"close": np.linspace(100, 130, index.size), "volume": np.arange(index.size) % 7 + 1.0}, index=index)
+        bars["high"], bars["low"] = bars["close"] + 0.5, bars["close"] - 0.5
+        bars.iloc[40, 1] = np.nan
+        expected = pandas_ta.vwap(bars["high"], bars["low"], bars["close"], bars["volume"], bands=[1])
+        result = stream.VWAP(bands=[1]).update_many(bars["high"], bars["low"], bars["close"], bars["volume"])
+        npt.assert_array_equal(result, expected)
+
+    def test_wma(self):
+        self.assertStreams("wma", stream.WMA)
+        self.assertStreams("wma", stream.WMA, length=30, talib=False)
+
+    def test_zlma(self):
+        self.assertStreams("zlma", stream.ZLMA)
+        for mamode in ["dema", "rma", "sma", "t3", "tema", "wma"]:
+            self.assertStreams("zlma", stream.ZLMA, mamode=mamode, length=12)
+        self.assertRaises(ValueError, stream.ZLMA, mamode="hma")
@@ -1,12 +1,14 @@
 from .config import sample_data
 from .context import pandas_ta
 
+from tempfile import TemporaryDirectory
 from unittest import skip, TestCase
 from unittest.mock import patch
 
 import numpy as np
 import numpy.testing as npt
 from pandas import DataFrame, Series
+import pandas.testing as pdt
 from pandas.api.types import is_datetime64_ns_dtype, is_datetime64tz_dtype
 
 
@@ -116,6 +118,72 @@ class TestUtilities(TestCase):
         result = self.utils.below_value(self.crosseddf["a"], self.crosseddf["zero"])
         self.assertIsNone(result)
 
+    def test_bars_since(self):
+        close = self.data["close"].copy()
+        close.iloc[50] = np.nan
+        expected = close.rolling(15).apply(self.utils.recent_maximum_index, raw=True)
+        result = self.utils.bars_since(close, 15)
+        self.assertIsInstance(result, Series)
+        pdt.assert_series_equal(result, expected)
+        pdt.assert_series_equal(self.utils.rolling_argmax(close, 15), 14 - expected)
+
+        expected = close.rolling(15).apply(self.utils.recent_minimum_index, raw=True)
+        pdt.assert_series_equal(self.utils.bars_since(close, 15, highest=False), expected)
+        pdt.assert_series_equal(self.utils.rolling_argmin(close, 15), 14 - expected)
+
+        with patch.dict(pandas_ta.Imports, {"numba": False}):
+            pdt.assert_series_equal(self.utils.bars_since(close, 15, highest=False), expected)
+
+    def test_cache(self):
+        cache = pandas_ta.cache
+        cache.enable()
+        cache.reset_stats()
+        try:
+            result1 = self.data.ta.rsi()
+            result2 = self.data.ta.rsi()
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(cache.hits, 1)
+            self.assertIsNot(result1, result2)
+            self.assertEqual(result1.name, result2.name)
+            pdt.assert_series_equal(result1, result2)
+
+            # Content addressed: a copy hits, a changed value misses
+            self.data.copy().ta.rsi()
+            self.assertEqual(cache.hits, 2)
+            data = self.data.copy()
+            data.iloc[-1, data.columns.get_loc("close")] += 1
+            data.ta.rsi()
+            self.data.ta.rsi(length=5)
+            self.data.ta.rsi(cache=False)
+            self.assertEqual(cache.misses, 3)
+            self.assertEqual(cache.hits, 2)
+
+            # Positional, keyword and default arguments share a key
+            self.data.ta.rsi(5)
+            self.data.ta.rsi(length=None)
+            self.assertEqual(cache.hits, 4)
+            with patch.dict(pandas_ta.Imports, {"talib": not pandas_ta.Imports["talib"]}):
+                self.data.ta.rsi()
+            self.assertEqual(cache.misses, 4)
+        finally:
+            cache.disable()
+        self.assertEqual(cache.stats["memory_results"], 0)
+
+    def test_cache_disk(self):
+        cache = pandas_ta.cache
+        with TemporaryDirectory() as path:
+            with cache(path=path, format="npy"):
+                cache.reset_stats()
+                result1 = self.data.ta.macd()
+            with cache(path=path):
+                result2 = self.data.ta.macd()
+                self.assertEqual(cache.stats["disk_hits"], 1)
+                # Shrinking the disk tier evicts the results
+                cache.enable(path=path, disk=0)
+                self.assertEqual(cache.stats["evictions"], 1)
+        self.assertEqual(result1.name, result2.name)
+        pdt.assert_frame_equal(result1, result2)
+
     def test_combination(self):
         self.assertIsNotNone(self.utils.combination())
 
@@ -125,6 +193,16 @@ class TestUtilities(TestCase):
         self.assertEqual(self.utils.combination(n=10, r=4, repetition=False), 210)
         self.assertEqual(self.utils.combination(n=10, r=4, repetition=True), 715)
 
+    def test_consecutive(self):
+        x = Series([True, True, False, np.nan, True, True, True, False, True])
+        result = self.utils.consecutive(x)
+        self.assertIsInstance(result, Series)
+        self.assertEqual(list(result), [1, 2, 0, 0, 1, 2, 3, 0, 1])
+
+        rises = self.data["close"].diff() > 0
+        expected = rises.rolling(4).sum() == 4
+        pdt.assert_series_equal(self.utils.consecutive(rises) >= 4, expected, check_names=False)
+
     def test_cross_above(self):
         result = self.utils.cross(self.crosseddf["a"], self.crosseddf["b"])
         self.assertIsInstance(result, Series)
@@ -213,6 +291,32 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result, str)
         self.assertTrue("SSE" in result)
 
+    def test_ewm_mean(self):
+        close = self.data["close"].copy()
+        close.iloc[:5] = np.nan
+        for adjust in (False, True):
+            result = self.utils.ewm_mean(close, 0.2, adjust=adjust, min_periods=10)
+            self.assertIsInstance(result, Series)
+            pdt.assert_series_equal(result, close.ewm(alpha=0.2, adjust=adjust, min_periods=10).mean(), rtol=1e-10)
+
+    def test_linear_filter(self):
+        x = self.data["close"].to_numpy()
+        b, a = [0.2, 0.1], [1, -0.9, 0.2]
+        y0, x0 = [x[0], x[0]], [x[0]]
+
+        expected = self.utils.linear_filter(x, b, a, y0=y0, x0=x0)
+        if pandas_ta.Imports["scipy"]:
+            from scipy.signal import lfilter, lfiltic
+            npt.assert_allclose(expected, lfilter(b, a, x, zi=lfiltic(b, a, y0, x0))[0], rtol=1e-12)
+
+        with patch.dict(pandas_ta.Imports, {"scipy": False}):
+            npt.assert_allclose(self.utils.linear_filter(x, b, a, y0=y0, x0=x0), expected, rtol=1e-10)
+
+        result = self.utils.linear_filter(self.data[["close", "open"]], b, a)
+        self.assertIsInstance(result, DataFrame)
+        npt.assert_allclose(result["open"], self.utils.linear_filter(self.data["open"], b, a))
+        npt.assert_allclose(self.utils.linear_filter(np.vstack([x, x]), b, a, axis=1)[1], result["close"])
+
     def test_linear_regression(self):
         x = Series([1, 2, 3, 4, 5])
         y = Series([1.8, 2.1, 2.7, 3.2, 4])
@@ -244,6 +348,33 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result, int)
         self.assertAlmostEqual(result, 0)
 
+    def test_incremental(self):
+        self.assertEqual(self.utils.ta_lookback("sma"), 10)
+        self.assertEqual(self.utils.ta_lookback("hma", {"length": 20}), 40)
+        self.assertIsNone(self.utils.ta_lookback("sma", {"offset": 1}))
+        self.assertIsNone(self.utils.ta_lookback("macd"))
+
+        self.assertEqual(self.utils.ta_incremental("ema"), "resume")
+        self.assertEqual(self.utils.ta_incremental("bbands"), "tail")
+        self.assertIsNone(self.utils.ta_incremental("ema", (5,)))
+        self.assertIsNone(self.utils.ta_incremental("tsi"))
+
+    def test_memoize(self):
+        self.utils.memo_start()
+        result1 = pandas_ta.atr(self.data.high, self.data.low, self.data.close, talib=False)
+        result2 = pandas_ta.atr(high=self.data.high, low=self.data.low, close=self.data.close, talib=False)
+        saved = self.utils.memo_stop()
+
+        self.assertIsInstance(result2, Series)
+        self.assertIsNot(result1, result2)
+        self.assertEqual(result1.name, result2.name)
+        npt.assert_array_equal(result1, result2)
+        self.assertGreaterEqual(saved["atr"], 1)
+
+        # Inactive outside of a run
+        pandas_ta.atr(self.data.high, self.data.low, self.data.close, talib=False)
+        self.assertEqual(self.utils.memo_stop(), {})
+
     def test_pascals_triangle(self):
         self.assertIsNone(self.utils.pascals_triangle(inverse=True), None)
 
@@ -263,6 +394,142 @@ class TestUtilities(TestCase):
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True), array_5w)
         npt.assert_array_equal(self.utils.pascals_triangle(n=5, weighted=True, inverse=True), array_5iw)
 
+    def test_pool(self):
+        pool = self.utils.pool
+        self.assertFalse(pool.active)
+
+        pool.start(1)
+        self.assertTrue(pool.active)
+        self.assertEqual(pool.cores, 1)
+        pool.stop()
+        self.assertFalse(pool.active)
+
+        with pool(1) as p:
+            self.assertTrue(p.active)
+        self.assertFalse(pool.active)
+
+    def test_rolling_mad(self):
+        close = self.data["close"].copy()
+        close.iloc[100] = np.nan
+        mean_ad = lambda x: np.fabs(x - x.mean()).mean()
+        median_ad = lambda x: np.median(np.fabs(x - np.median(x)))
+
+        for min_periods in (None, 5):
+            expected = close.rolling(20, min_periods=min_periods).apply(mean_ad, raw=True)
+            result = self.utils.rolling_mad(close, 20, min_periods=min_periods)
+            self.assertIsInstance(result, Series)
+            pdt.assert_series_equal(result, expected, rtol=1e-12)
+
+            expected = close.rolling(20, min_periods=min_periods).apply(median_ad, raw=True)
+            result = self.utils.rolling_mad(close, 20, min_periods=min_periods, median=True, memory=1)
+            pdt.assert_series_equal(result, expected, rtol=1e-12)
+
+    def test_rolling_quantile(self):
+        close = self.data["close"].copy()
+        close.iloc[[100, 101]] = np.nan
+        for min_periods in (None, 5):
+            expected = close.rolling(20, min_periods=min_periods).quantile(0.3)
+            result = self.utils.rolling_quantile(close, 20, 0.3, min_periods=min_periods, memory=4096)
+            self.assertIsInstance(result, Series)
+            pdt.assert_series_equal(result, expected, rtol=1e-12)
+
+    def test_rolling_ols(self):
+        close, length = self.data["close"], 20
+        result = self.utils.rolling_ols(close, length)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(list(result.keys()), ["slope", "intercept", "r"])
+        for stat in result.values():
+            self.assertIsInstance(stat, Series)
+            self.assertEqual(stat.isna().sum(), length - 1)
+
+        x = np.arange(1, length + 1)
+        for i in (length - 1, close.size // 2, close.size - 1):
+            y = close.iloc[i - length + 1:i + 1].to_numpy()
+            m, b = np.polyfit(x, y, 1)
+            self.assertAlmostEqual(result["slope"].iloc[i], m, places=8)
+            self.assertAlmostEqual(result["intercept"].iloc[i], b, places=6)
+            self.assertAlmostEqual(result["r"].iloc[i], np.corrcoef(x, y)[0, 1], places=8)
+
+        # Long series, the window's x does not grow with the index
+        length, x = 14, np.arange(1, 15)
+        walk = Series(np.round(100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 2_000_000)), 1))
+        result = self.utils.rolling_ols(walk, length)
+        for i in (walk.size // 2, walk.size - 1):
+            m, b = np.polyfit(x, walk.iloc[i - length + 1:i + 1].to_numpy(), 1)
+            npt.assert_allclose(result["slope"].iloc[i], m, rtol=1e-10)
+            npt.assert_allclose(result["intercept"].iloc[i], b, rtol=1e-10)
+
+    def test_rolling_dot(self):
+        close = self.data["close"].copy()
+        close.iloc[100] = np.nan
+        for length in (4, self.utils.ROLLING_DOT_FFT + 1):
+            w = np.arange(1, length + 1) / length
+            expected = close.rolling(length).apply(self.utils.weights(w), raw=True)
+
+            result = self.utils.rolling_dot(close, w)
+            self.assertIsInstance(result, Series)
+            pdt.assert_series_equal(result, expected, rtol=1e-10)
+
+            result = self.utils.rolling_dot(self.data[["close", "open"]], w)
+            self.assertIsInstance(result, DataFrame)
+            npt.assert_allclose(result["open"], self.data["open"].rolling(length).apply(self.utils.weights(w), raw=True), rtol=1e-10)
+            npt.assert_allclose(self.utils.rolling_dot(self.data[["close", "open"]].to_numpy().T, w, axis=1).T, result, rtol=1e-10)
+
+    def test_shm_publish_attach(self):
+        spec, shm = self.utils.shm_publish(self.data)
+        try:
+            result = self.utils.shm_attach(spec)
+            self.assertIsInstance(result, DataFrame)
+            self.assertEqual(result.shape, self.data.shape)
+            self.assertTrue(result.index.equals(self.data.index))
+            npt.assert_array_equal(result.values, self.data.values.astype(float))
+            self.assertFalse(result["close"].values.flags.writeable)
+        finally:
+            self.utils.shm_release(shm)
+
+    def test_strategy_schedule(self):
+        costs = dict(enumerate([8.0, 1.0, 1.0, 1.0, 1.0, 4.0]))
+        batches, predicted = self.utils.strategy_schedule([[0], [1, 2], [3], [4], [5]], costs, 2)
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(6)))
+        self.assertEqual(batches[0], [0])  # Longest first
+        self.assertAlmostEqual(predicted, 8.0)
+
+        batches, _ = self.utils.strategy_schedule([[0, 1, 2, 3, 4, 5]], costs, 2, chunksize=4)
+        self.assertEqual(batches, [[0, 1, 2, 3], [4, 5]])
+
+        self.assertAlmostEqual(self.utils.makespan([3, 2, 2, 1], 2), 4)
+
+    def test_ta_holds_gil(self):
+        costs = {"sma": {"overhead": 1e-3, "per_row": 1e-8}, "stc": {"overhead": 1e-3, "per_row": 1e-4}}
+        self.assertFalse(self.utils.ta_holds_gil("sma", costs))
+        self.assertTrue(self.utils.ta_holds_gil("stc", costs))
+        self.assertFalse(self.utils.ta_holds_gil("rsi", costs))
+
+        # Kernels hold it only without numba, whatever their cost
+        costs["psar"] = {"overhead": 1e-3, "per_row": 1e-8}
+        with patch.dict(pandas_ta.Imports, {"numba": False}):
+            self.assertTrue(self.utils.ta_holds_gil("psar", costs))
+            self.assertFalse(self.utils.ta_holds_gil("stc", {}))
+        with patch.dict(pandas_ta.Imports, {"numba": True}):
+            self.assertFalse(self.utils.ta_holds_gil("psar", {"psar": {"overhead": 1e-3, "per_row": 1e-4}}))
+
+    def test_ta_cost(self):
+        costs = {"sma": {"overhead": 1e-3, "per_row": 1e-6}, "ema": {"overhead": 3e-3, "per_row": 3e-6}}
+        self.assertAlmostEqual(self.utils.ta_cost("sma", 1000, costs), 2e-3)
+        self.assertAlmostEqual(self.utils.ta_cost("rsi", 1000, costs), 4e-3)  # Median
+        self.assertGreater(len(self.utils.ta_costs()), 0)
+
+    def test_strategy_plan(self):
+        self.assertIn("atr", self.utils.ta_dependencies("supertrend"))
+        self.assertIn("bbands", self.utils.ta_dependencies("squeeze"))
+
+        ta = ["sma", "supertrend", "hl2", "natr", {"kind": "adx"}]
+        order = self.utils.strategy_plan(ta)
+        self.assertEqual(sorted(order), list(range(len(ta))))
+        # Indicators sharing 'atr' are dispatched next to each other
+        atr_users = [order.index(i) for i in (1, 3, 4)]
+        self.assertEqual(max(atr_users) - min(atr_users), 2)
+
     def test_symmetric_triangle(self):
         npt.assert_array_equal(self.utils.symmetric_triangle(), np.array([1,1]))
         npt.assert_array_equal(self.utils.symmetric_triangle(weighted=True), np.array([0.5, 0.5]))